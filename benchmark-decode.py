@@ -0,0 +1,71 @@
+"""Per-feature decoding overhead of Fiona's read path.
+
+The features of tests/data/coutwildrnp.shp are copied SCALE times into
+a temporary GeoPackage. The time to fetch the features without decoding
+them (Collection.keys) is compared to the time to fetch and decode them
+into GeoJSON-like records (Collection.__iter__). The difference is the
+per-feature decoding overhead. Run this script before and after a change
+to the decoder to compare.
+
+    $ python benchmark-decode.py [SCALE]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import fiona
+
+
+SRC = os.path.join(os.path.dirname(__file__), 'tests', 'data', 'coutwildrnp.shp')
+SCALE = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+REPEAT = 5
+
+
+def make_dataset(path, scale):
+    """Write scale copies of the source features to a GeoPackage"""
+    with fiona.open(SRC) as src:
+        records = list(src)
+        meta = src.meta
+    meta['driver'] = 'GPKG'
+    with fiona.open(path, 'w', **meta) as dst:
+        for _ in range(scale):
+            dst.writerecords(records)
+
+
+def fetch(path):
+    with fiona.open(path) as src:
+        for _ in src.keys():
+            pass
+
+
+def decode(path):
+    with fiona.open(path) as src:
+        for _ in src:
+            pass
+
+
+def main():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmpdir, 'coutwildrnp.gpkg')
+        make_dataset(path, SCALE)
+        with fiona.open(path) as src:
+            count = len(src)
+
+        t_fetch = min(timeit.repeat(lambda: fetch(path), number=1, repeat=REPEAT))
+        t_decode = min(timeit.repeat(lambda: decode(path), number=1, repeat=REPEAT))
+
+        print("Fiona %s, GDAL %s, %d features" % (
+            fiona.__version__, fiona.__gdal_version__, count))
+        print("fetch only:        %.2f usec/feature" % (1e6 * t_fetch / count))
+        print("fetch and decode:  %.2f usec/feature" % (1e6 * t_decode / count))
+        print("decoding overhead: %.2f usec/feature" % (1e6 * (t_decode - t_fetch) / count))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
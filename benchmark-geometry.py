@@ -0,0 +1,86 @@
+"""Microbenchmarks of GeomBuilder per geometry type.
+
+For each geometry type a WKB geometry with many parts and vertices is
+built into a GeoJSON-like mapping with GeomBuilder.build_wkb. The time
+includes the import of the WKB by OGR, which is the same for every
+builder. Run this script against two revisions of Fiona to compare
+their builders.
+
+    $ python benchmark-geometry.py [VERTICES]
+"""
+
+import math
+import struct
+import sys
+import timeit
+
+import fiona
+from fiona._geometry import GeomBuilder
+
+
+VERTICES = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+REPEAT = 5
+
+
+def ring(n, x0=0.0, y0=0.0):
+    """A closed ring of n vertices"""
+    coords = [(x0 + math.cos(2 * math.pi * i / (n - 1)),
+               y0 + math.sin(2 * math.pi * i / (n - 1))) for i in range(n - 1)]
+    return coords + coords[:1]
+
+
+def wkb_coords(coords):
+    return struct.pack('<I', len(coords)) + b''.join(
+        struct.pack('<dd', x, y) for x, y in coords)
+
+
+def wkb_point(xy):
+    return struct.pack('<BI', 1, 1) + struct.pack('<dd', *xy)
+
+
+def wkb_linestring(coords):
+    return struct.pack('<BI', 1, 2) + wkb_coords(coords)
+
+
+def wkb_polygon(rings):
+    return struct.pack('<BII', 1, 3, len(rings)) + b''.join(
+        wkb_coords(r) for r in rings)
+
+
+def wkb_multi(code, parts):
+    return struct.pack('<BII', 1, code, len(parts)) + b''.join(parts)
+
+
+def geometries(nverts):
+    """Pairs of names and WKB of geometries of about nverts vertices"""
+    yield 'Point', wkb_point((0.0, 0.0)), 1
+    yield 'LineString', wkb_linestring(ring(nverts)), nverts
+    yield 'Polygon', wkb_polygon([ring(100, i, i) for i in range(nverts // 100)]), nverts
+    yield ('MultiPoint',
+           wkb_multi(4, [wkb_point(xy) for xy in ring(nverts)]), nverts)
+    yield ('MultiLineString',
+           wkb_multi(5, [wkb_linestring(ring(10, i, i)) for i in range(nverts // 10)]),
+           nverts)
+    yield ('MultiPolygon (few large parts)',
+           wkb_multi(6, [wkb_polygon([ring(nverts // 10)]) for i in range(10)]),
+           nverts)
+    yield ('MultiPolygon (many small parts)',
+           wkb_multi(6, [wkb_polygon([ring(5, i, i)]) for i in range(nverts // 5)]),
+           nverts)
+    yield ('GeometryCollection',
+           wkb_multi(7, [wkb_point((i, i)) for i in range(nverts)]), nverts)
+
+
+def main():
+    print("Fiona %s, GDAL %s" % (fiona.__version__, fiona.__gdal_version__))
+    print("%-32s %12s %14s" % ("type", "msec/geom", "nsec/vertex"))
+    for name, wkb, nverts in geometries(VERTICES):
+        builder = GeomBuilder()
+        number = max(1, 100000 // nverts)
+        t = min(timeit.repeat(
+            lambda: builder.build_wkb(wkb), number=number, repeat=REPEAT)) / number
+        print("%-32s %12.4f %14.1f" % (name, 1e3 * t, 1e9 * t / nverts))
+
+
+if __name__ == '__main__':
+    main()
@@ -162,6 +162,21 @@ def open(fp, mode='r', driver=None, schema=None, crs=None, encoding=None,
       fiona.open(
           'example.shp', enabled_drivers=['GeoJSON', 'ESRI Shapefile'])
 
+    In 'r' mode, a ``geometry_format`` keyword argument of 'wkb',
+    'wkt', or 'shapely' makes features' geometries WKB bytes, WKT text,
+    or shapely geometries instead of GeoJSON-like mappings. With
+    'numpy', the coordinate sequences of the mappings are NumPy arrays.
+
+    In 'r' mode, a ``dst_crs`` keyword argument, such as 'EPSG:4326',
+    makes features read in that CRS. Their geometries are transformed by
+    OGR as they are read, and the collection's ``crs``, ``crs_wkt`` and
+    ``bounds`` as well as ``bbox`` and ``mask`` spatial filters are in
+    ``dst_crs``.
+
+      with fiona.open('example.shp', dst_crs='EPSG:4326') as src:
+          for feature in src.filter(bbox=(-106.0, 39.0, -104.0, 41.0)):
+              ...
+
     Parameters
     ----------
     fp : URI (str or pathlib.Path), or file-like object
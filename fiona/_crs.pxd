@@ -18,4 +18,5 @@ cdef extern from "ogr_srs_api.h":
     void    OSRRelease (OGRSpatialReferenceH srs)
     void *  OCTNewCoordinateTransformation (OGRSpatialReferenceH source, OGRSpatialReferenceH dest)
     void    OCTDestroyCoordinateTransformation (void *source)
-    int     OCTTransform (void *ct, int nCount, double *x, double *y, double *z)
+    int     OCTTransform (void *ct, int nCount, double *x, double *y, double *z) nogil
+    int     OCTTransformEx (void *ct, int nCount, double *x, double *y, double *z, int *success) nogil
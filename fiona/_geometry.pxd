@@ -87,6 +87,7 @@ ctypedef struct OGREnvelope:
 
 cdef extern from "ogr_api.h":
     OGRErr  OGR_G_AddGeometryDirectly (void *geometry, void *part)
+    OGRErr  OGR_G_CreateFromWkb (unsigned char *bytes, void *srs, void **geometry, int nbytes) nogil
     void    OGR_G_AddPoint (void *geometry, double x, double y, double z)
     void    OGR_G_AddPoint_2D (void *geometry, double x, double y)
     void    OGR_G_CloseRings (void *geometry)
@@ -100,28 +101,22 @@ cdef extern from "ogr_api.h":
     int     OGR_G_GetGeometryType (void *geometry)
     void *  OGR_G_GetGeometryRef (void *geometry, int n)
     int     OGR_G_GetPointCount (void *geometry)
+    int     OGR_G_GetPoints (void *geometry, void *x, int xstride, void *y, int ystride, void *z, int zstride)
     double  OGR_G_GetX (void *geometry, int n)
     double  OGR_G_GetY (void *geometry, int n)
     double  OGR_G_GetZ (void *geometry, int n)
     void    OGR_G_ImportFromWkb (void *geometry, unsigned char *bytes, int nbytes)
+    void    OGR_G_SetPoints (void *geometry, int npoints, const void *x, int xstride, const void *y, int ystride, const void *z, int zstride) nogil
     int     OGR_G_WkbSize (void *geometry)
 
 
 cdef class GeomBuilder:
-    cdef void *geom
-    cdef object code
-    cdef object geomtypename
-    cdef object ndims
+    cdef bint ndarray_coords
+    cdef int precision
+    cdef object np
     cdef _buildCoords(self, void *geom)
-    cpdef _buildPoint(self)
-    cpdef _buildLineString(self)
-    cpdef _buildLinearRing(self)
-    cdef _buildParts(self, void *geom)
-    cpdef _buildPolygon(self)
-    cpdef _buildMultiPoint(self)
-    cpdef _buildMultiLineString(self)
-    cpdef _buildMultiPolygon(self)
-    cpdef _buildGeometryCollection(self)
+    cdef _buildPoint(self, void *geom)
+    cdef list _buildParts(self, void *geom)
     cdef build(self, void *geom)
     cpdef build_wkb(self, object wkb)
 
@@ -129,6 +124,9 @@ cdef class GeomBuilder:
 cdef class OGRGeomBuilder:
     cdef void * _createOgrGeometry(self, int geom_type) except NULL
     cdef _addPointToGeometry(self, void *cogr_geometry, object coordinate)
+    cdef int _setPoints(self, void *cogr_geometry, object coordinates) except -1
+    cdef int _setPointsFromBuffer(self, void *cogr_geometry, object coordinates, int ndim) except -1
+    cdef int _setPointsFromSequence(self, void *cogr_geometry, object coordinates) except -1
     cdef void * _buildPoint(self, object coordinates) except NULL
     cdef void * _buildLineString(self, object coordinates) except NULL
     cdef void * _buildLinearRing(self, object coordinates) except NULL
@@ -140,6 +138,9 @@ cdef class OGRGeomBuilder:
     cdef void * build(self, object geom) except NULL
 
 
+cdef void * _createOgrGeomFromWKB(object wkb) except NULL
+cdef void round_coordinates(double *coords, int n, int precision) nogil
+cdef int round_ogr_geometry(void *geom, int precision) except -1
 cdef unsigned int geometry_type_code(object name) except? 9999
 cdef object normalize_geometry_type_code(unsigned int code)
 cdef unsigned int base_geometry_type_code(unsigned int code)
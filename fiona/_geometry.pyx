@@ -3,9 +3,14 @@
 from __future__ import absolute_import
 
 import logging
+import struct
 
 from fiona.errors import UnsupportedGeometryTypeError
 
+from libc.math cimport INFINITY, copysign, fabs, floor, fma, fmod
+from libc.stdlib cimport malloc, free
+from cpython.buffer cimport PyObject_CheckBuffer
+
 
 class NullHandler(logging.Handler):
     def emit(self, record):
@@ -93,17 +98,67 @@ cdef inline unsigned int base_geometry_type_code(unsigned int code):
     return code % 1000
 
 
+# Formats of buffers of coordinates that can be loaded directly by
+# OGRGeomBuilder: native byte order float64.
+DOUBLE_BUFFER_FORMATS = ('d', '@d', '=d')
+
+
 # Geometry related functions and classes follow.
 cdef void * _createOgrGeomFromWKB(object wkb) except NULL:
     """Make an OGR geometry from a WKB string"""
-    wkbtype = bytearray(wkb)[1]
     cdef unsigned char *buffer = wkb
-    cdef void *cogr_geometry = OGR_G_CreateGeometry(<OGRwkbGeometryType>wkbtype)
-    if cogr_geometry is not NULL:
-        OGR_G_ImportFromWkb(cogr_geometry, buffer, len(wkb))
+    cdef int nbytes = len(wkb)
+    cdef void *cogr_geometry = NULL
+    cdef OGRErr result
+    # The GIL is released so that other threads can build features
+    # while OGR parses the WKB.
+    with nogil:
+        result = OGR_G_CreateFromWkb(buffer, NULL, &cogr_geometry, nbytes)
+    if result != 0 or cogr_geometry == NULL:
+        _deleteOgrGeom(cogr_geometry)
+        raise ValueError("Invalid WKB geometry")
     return cogr_geometry
 
 
+def wkb_geometry_type(wkb):
+    """Returns the GeoJSON type name of a WKB geometry
+
+    The type is read from the WKB header. ISO WKB and EWKB type codes
+    are accepted. Names of geometries with Z coordinates have a "3D "
+    prefix.
+
+    Parameters
+    ----------
+    wkb : bytes
+        A WKB geometry
+
+    Returns
+    -------
+    str
+    """
+    if len(wkb) < 5:
+        raise ValueError("Invalid WKB geometry")
+    byteorder = bytearray(wkb[:1])[0]
+    if byteorder == 1:
+        code, = struct.unpack_from('<I', wkb, 1)
+    elif byteorder == 0:
+        code, = struct.unpack_from('>I', wkb, 1)
+    else:
+        raise ValueError("Invalid WKB byte order: %r" % byteorder)
+
+    # EWKB flags Z with the high bit, ISO WKB with an offset of 1000.
+    has_z = bool(code & 0x80000000)
+    code &= 0x0FFFFFFF
+    if 1000 <= code < 2000 or 3000 <= code < 4000:
+        has_z = True
+    code %= 1000
+    if code not in GEOMETRY_TYPES or code == 0:
+        raise UnsupportedGeometryTypeError(code)
+
+    name = GEOMETRY_TYPES[code]
+    return "3D " + name if has_z else name
+
+
 cdef _deleteOgrGeom(void *cogr_geometry):
     """Delete an OGR geometry"""
     if cogr_geometry is not NULL:
@@ -111,79 +166,240 @@ cdef _deleteOgrGeom(void *cogr_geometry):
     cogr_geometry = NULL
 
 
+cdef void round_coordinates(double *coords, int n, int precision) nogil:
+    """Round an array of coordinates in place
+
+    Coordinates are rounded to ``precision`` decimal places like
+    Python's round(): their exact values are rounded, half to even.
+    The rounding error of each scaled coordinate is recovered with
+    fma() so that coordinates next to a half are rounded the right way.
+    Coordinates scaled to 2**53 or more have no digits to round.
+    Precisions above 22, for which the scale is not exact, are not
+    supported and leave coordinates unchanged.
+    """
+    cdef int i
+    cdef double x
+    cdef double scaled
+    cdef double error
+    cdef double lower
+    cdef double diff
+    cdef double scale = 1.0
+    if precision < 0 or precision > 22:
+        return
+    for i in range(precision):
+        scale *= 10.0
+    for i in range(n):
+        x = coords[i]
+        scaled = x * scale
+        # Also skips NaN and infinite coordinates.
+        if not fabs(scaled) < 9007199254740992.0:
+            continue
+        # The exact scaled value is scaled + error, between lower and
+        # lower + 1.
+        error = fma(x, scale, -scaled)
+        lower = floor(scaled)
+        if scaled == lower and error < 0.0:
+            lower -= 1.0
+        diff = ((scaled - lower) - 0.5) + error
+        if diff > 0.0 or (diff == 0.0 and fmod(lower, 2.0) != 0.0):
+            lower += 1.0
+        coords[i] = copysign(lower / scale, x)
+
+
+cdef int round_ogr_geometry(void *geom, int precision) except -1:
+    """Round the vertices of an OGR geometry in place
+
+    Coordinates are rounded like round_coordinates(). The vertices of
+    each curve are fetched and set at once.
+    """
+    cdef int i
+    cdef int npoints
+    cdef int ndims
+    cdef int stride
+    cdef int count
+    cdef double *xyz = NULL
+    cdef double *z = NULL
+    if geom == NULL:
+        raise ValueError("Null geom")
+
+    count = OGR_G_GetGeometryCount(geom)
+    if count > 0:
+        for i in range(count):
+            round_ogr_geometry(OGR_G_GetGeometryRef(geom, i), precision)
+        return 0
+
+    npoints = OGR_G_GetPointCount(geom)
+    if npoints == 0:
+        return 0
+    ndims = 3 if OGR_G_GetCoordinateDimension(geom) > 2 else 2
+    stride = ndims * sizeof(double)
+    xyz = <double *>malloc(npoints * stride)
+    if xyz == NULL:
+        raise MemoryError()
+    if ndims == 3:
+        z = xyz + 2
+    try:
+        OGR_G_GetPoints(geom, xyz, stride, xyz + 1, stride, z, stride)
+        round_coordinates(xyz, npoints * ndims, precision)
+        OGR_G_SetPoints(geom, npoints, xyz, stride, xyz + 1, stride, z, stride)
+    finally:
+        free(xyz)
+    return 0
+
+
 cdef class GeomBuilder:
     """Builds Fiona (GeoJSON) geometries from an OGR geometry handle.
+
+    By default coordinate sequences are lists of tuples. If
+    ``ndarray_coords`` is True, they are (N, 2) or (N, 3) NumPy arrays
+    of float64 and Point coordinates are 1-D arrays. If ``precision``
+    is not negative, coordinates are rounded to that many decimal
+    places as they are fetched from OGR.
     """
+    def __init__(self, ndarray_coords=False, precision=-1):
+        self.ndarray_coords = bool(ndarray_coords)
+        self.precision = precision
+        if self.ndarray_coords:
+            try:
+                import numpy
+            except ImportError:
+                raise ImportError("NumPy is required for array coordinates")
+            self.np = numpy
+
     cdef _buildCoords(self, void *geom):
-        # Build a coordinate sequence
+        # Build a coordinate sequence. All vertices are fetched at once
+        # into a buffer of interleaved doubles.
         cdef int i
+        cdef int npoints
+        cdef int ndims
+        cdef int stride
+        cdef double *xyz = NULL
+        cdef double *z = NULL
+        cdef double[:, ::1] view
         if geom == NULL:
             raise ValueError("Null geom")
         npoints = OGR_G_GetPointCount(geom)
-        coords = []
-        for i in range(npoints):
-            values = [OGR_G_GetX(geom, i), OGR_G_GetY(geom, i)]
-            if self.ndims > 2:
-                values.append(OGR_G_GetZ(geom, i))
-            coords.append(tuple(values))
+        ndims = 3 if OGR_G_GetCoordinateDimension(geom) > 2 else 2
+        stride = ndims * sizeof(double)
+
+        if self.ndarray_coords:
+            coords = self.np.empty((npoints, ndims), dtype='float64')
+            if npoints > 0:
+                view = coords
+                xyz = &view[0, 0]
+                if ndims == 3:
+                    z = xyz + 2
+                OGR_G_GetPoints(geom, xyz, stride, xyz + 1, stride, z, stride)
+                if self.precision >= 0:
+                    round_coordinates(xyz, npoints * ndims, self.precision)
+            return coords
+
+        if npoints == 0:
+            return []
+        xyz = <double *>malloc(npoints * stride)
+        if xyz == NULL:
+            raise MemoryError()
+        if ndims == 3:
+            z = xyz + 2
+        try:
+            OGR_G_GetPoints(geom, xyz, stride, xyz + 1, stride, z, stride)
+            if self.precision >= 0:
+                round_coordinates(xyz, npoints * ndims, self.precision)
+            coords = [None] * npoints
+            if ndims == 3:
+                for i in range(npoints):
+                    coords[i] = (xyz[3 * i], xyz[3 * i + 1], xyz[3 * i + 2])
+            else:
+                for i in range(npoints):
+                    coords[i] = (xyz[2 * i], xyz[2 * i + 1])
+        finally:
+            free(xyz)
         return coords
-    
-    cpdef _buildPoint(self):
-        return {'type': 'Point', 'coordinates': self._buildCoords(self.geom)[0]}
-    
-    cpdef _buildLineString(self):
-        return {'type': 'LineString', 'coordinates': self._buildCoords(self.geom)}
-    
-    cpdef _buildLinearRing(self):
-        return {'type': 'LinearRing', 'coordinates': self._buildCoords(self.geom)}
-    
-    cdef _buildParts(self, void *geom):
+
+    cdef _buildPoint(self, void *geom):
+        # Build a single coordinate without an intermediate sequence
+        cdef double xyz[3]
+        cdef int ndims
+        if geom == NULL:
+            raise ValueError("Null geom")
+        if self.ndarray_coords or OGR_G_GetPointCount(geom) == 0:
+            return self._buildCoords(geom)[0]
+        ndims = 3 if OGR_G_GetCoordinateDimension(geom) > 2 else 2
+        xyz[0] = OGR_G_GetX(geom, 0)
+        xyz[1] = OGR_G_GetY(geom, 0)
+        xyz[2] = OGR_G_GetZ(geom, 0) if ndims == 3 else 0.0
+        if self.precision >= 0:
+            round_coordinates(xyz, ndims, self.precision)
+        if ndims == 3:
+            return (xyz[0], xyz[1], xyz[2])
+        return (xyz[0], xyz[1])
+
+    cdef list _buildParts(self, void *geom):
+        # Build the coordinate sequences of the parts of a Polygon or
+        # MultiLineString, or of the rings of a Polygon part
         cdef int j
-        cdef void *part
+        cdef int nparts
         if geom == NULL:
             raise ValueError("Null geom")
-        parts = []
-        for j in range(OGR_G_GetGeometryCount(geom)):
-            part = OGR_G_GetGeometryRef(geom, j)
-            parts.append(GeomBuilder().build(part))
+        nparts = OGR_G_GetGeometryCount(geom)
+        parts = [None] * nparts
+        for j in range(nparts):
+            parts[j] = self._buildCoords(OGR_G_GetGeometryRef(geom, j))
         return parts
-    
-    cpdef _buildPolygon(self):
-        coordinates = [p['coordinates'] for p in self._buildParts(self.geom)]
-        return {'type': 'Polygon', 'coordinates': coordinates}
-    
-    cpdef _buildMultiPoint(self):
-        coordinates = [p['coordinates'] for p in self._buildParts(self.geom)]
-        return {'type': 'MultiPoint', 'coordinates': coordinates}
-    
-    cpdef _buildMultiLineString(self):
-        coordinates = [p['coordinates'] for p in self._buildParts(self.geom)]
-        return {'type': 'MultiLineString', 'coordinates': coordinates}
-    
-    cpdef _buildMultiPolygon(self):
-        coordinates = [p['coordinates'] for p in self._buildParts(self.geom)]
-        return {'type': 'MultiPolygon', 'coordinates': coordinates}
 
-    cpdef _buildGeometryCollection(self):
-        parts = self._buildParts(self.geom)
-        return {'type': 'GeometryCollection', 'geometries': parts}
-    
     cdef build(self, void *geom):
-        # The only method anyone needs to call
+        # The only method anyone needs to call. Dispatches on the integer
+        # geometry type code and walks the parts of multi-part geometries
+        # with this same builder.
+        cdef unsigned int code
+        cdef int j
+        cdef int nparts
+        cdef void *part = NULL
+
         if geom == NULL:
             raise ValueError("Null geom")
 
-        cdef unsigned int etype = OGR_G_GetGeometryType(geom)
+        code = base_geometry_type_code(OGR_G_GetGeometryType(geom))
+
+        if code == 1:
+            return {'type': 'Point', 'coordinates': self._buildPoint(geom)}
 
-        self.code = base_geometry_type_code(etype)
+        elif code == 2:
+            return {'type': 'LineString', 'coordinates': self._buildCoords(geom)}
 
-        if self.code not in GEOMETRY_TYPES:
-            raise UnsupportedGeometryTypeError(self.code)
+        elif code == 3:
+            return {'type': 'Polygon', 'coordinates': self._buildParts(geom)}
 
-        self.geomtypename = GEOMETRY_TYPES[self.code]
-        self.ndims = OGR_G_GetCoordinateDimension(geom)
-        self.geom = geom
-        return getattr(self, '_build' + self.geomtypename)()
+        elif code == 4:
+            nparts = OGR_G_GetGeometryCount(geom)
+            coordinates = [None] * nparts
+            for j in range(nparts):
+                coordinates[j] = self._buildPoint(OGR_G_GetGeometryRef(geom, j))
+            return {'type': 'MultiPoint', 'coordinates': coordinates}
+
+        elif code == 5:
+            return {'type': 'MultiLineString', 'coordinates': self._buildParts(geom)}
+
+        elif code == 6:
+            nparts = OGR_G_GetGeometryCount(geom)
+            coordinates = [None] * nparts
+            for j in range(nparts):
+                coordinates[j] = self._buildParts(OGR_G_GetGeometryRef(geom, j))
+            return {'type': 'MultiPolygon', 'coordinates': coordinates}
+
+        elif code == 7:
+            nparts = OGR_G_GetGeometryCount(geom)
+            geometries = [None] * nparts
+            for j in range(nparts):
+                part = OGR_G_GetGeometryRef(geom, j)
+                geometries[j] = self.build(part)
+            return {'type': 'GeometryCollection', 'geometries': geometries}
+
+        elif code == 101:
+            return {'type': 'LinearRing', 'coordinates': self._buildCoords(geom)}
+
+        else:
+            raise UnsupportedGeometryTypeError(code)
 
     cpdef build_wkb(self, object wkb):
         # The only other method anyone needs to call
@@ -211,62 +427,180 @@ cdef class OGRGeomBuilder:
             x, y, z = coordinate[:3]
             OGR_G_AddPoint(cogr_geometry, x, y, z)
 
+    cdef int _setPoints(self, void *cogr_geometry, object coordinates) except -1:
+        # Load a sequence of coordinates into a curve with one call of
+        # OGR_G_SetPoints. Buffers of doubles (NumPy arrays of shape
+        # (N, 2) or (N, 3+), or 1-D buffers of interleaved x, y values)
+        # are passed to OGR as they are. Other sequences are first copied
+        # into a C array in one pass.
+        if PyObject_CheckBuffer(coordinates):
+            buf = memoryview(coordinates)
+            if buf.format in DOUBLE_BUFFER_FORMATS and buf.ndim in (1, 2):
+                return self._setPointsFromBuffer(cogr_geometry, coordinates, buf.ndim)
+        return self._setPointsFromSequence(cogr_geometry, coordinates)
+
+    cdef int _setPointsFromBuffer(self, void *cogr_geometry, object coordinates, int ndim) except -1:
+        cdef const double[:, :] view2
+        cdef const double[:] view1
+        cdef const double *x = NULL
+        cdef const double *y = NULL
+        cdef const double *z = NULL
+        cdef int npoints
+        cdef int stride
+
+        if ndim == 2:
+            view2 = coordinates
+            if view2.shape[1] < 2:
+                raise ValueError("Coordinates must have at least 2 dimensions")
+            npoints = view2.shape[0]
+            if npoints == 0:
+                return 0
+            stride = view2.strides[0]
+            x = &view2[0, 0]
+            y = &view2[0, 1]
+            if view2.shape[1] > 2:
+                z = &view2[0, 2]
+        else:
+            view1 = coordinates
+            if view1.shape[0] % 2:
+                raise ValueError("Flat coordinates must be pairs of x and y values")
+            npoints = view1.shape[0] // 2
+            if npoints == 0:
+                return 0
+            stride = 2 * view1.strides[0]
+            x = &view1[0]
+            y = &view1[1]
+
+        with nogil:
+            OGR_G_SetPoints(cogr_geometry, npoints, x, stride, y, stride, z, stride)
+        return 0
+
+    cdef int _setPointsFromSequence(self, void *cogr_geometry, object coordinates) except -1:
+        cdef int i
+        cdef int npoints
+        cdef int ncoords
+        cdef bint has_z = False
+        cdef double *xyz = NULL
+        cdef double *z = NULL
+
+        if not isinstance(coordinates, (list, tuple)):
+            coordinates = list(coordinates)
+        npoints = len(coordinates)
+        if npoints == 0:
+            return 0
+
+        xyz = <double *>malloc(3 * npoints * sizeof(double))
+        if xyz == NULL:
+            raise MemoryError()
+        try:
+            for i in range(npoints):
+                coordinate = coordinates[i]
+                ncoords = len(coordinate)
+                if ncoords < 2:
+                    raise ValueError("Coordinates must have at least 2 dimensions")
+                xyz[3 * i] = coordinate[0]
+                xyz[3 * i + 1] = coordinate[1]
+                if ncoords > 2:
+                    xyz[3 * i + 2] = coordinate[2]
+                    has_z = True
+                else:
+                    xyz[3 * i + 2] = 0.0
+            if has_z:
+                z = xyz + 2
+            with nogil:
+                OGR_G_SetPoints(
+                    cogr_geometry, npoints, xyz, 3 * sizeof(double),
+                    xyz + 1, 3 * sizeof(double), z, 3 * sizeof(double))
+        finally:
+            free(xyz)
+        return 0
+
     cdef void * _buildPoint(self, object coordinates) except NULL:
         cdef void *cogr_geometry = self._createOgrGeometry(GEOJSON2OGR_GEOMETRY_TYPES['Point'])
-        self._addPointToGeometry(cogr_geometry, coordinates)
+        try:
+            self._addPointToGeometry(cogr_geometry, coordinates)
+        except:
+            OGR_G_DestroyGeometry(cogr_geometry)
+            raise
         return cogr_geometry
     
     cdef void * _buildLineString(self, object coordinates) except NULL:
         cdef void *cogr_geometry = self._createOgrGeometry(GEOJSON2OGR_GEOMETRY_TYPES['LineString'])
-        for coordinate in coordinates:
-            self._addPointToGeometry(cogr_geometry, coordinate)
+        try:
+            self._setPoints(cogr_geometry, coordinates)
+        except:
+            OGR_G_DestroyGeometry(cogr_geometry)
+            raise
         return cogr_geometry
     
     cdef void * _buildLinearRing(self, object coordinates) except NULL:
         cdef void *cogr_geometry = self._createOgrGeometry(GEOJSON2OGR_GEOMETRY_TYPES['LinearRing'])
-        for coordinate in coordinates:
-            self._addPointToGeometry(cogr_geometry, coordinate)
+        try:
+            self._setPoints(cogr_geometry, coordinates)
+        except:
+            OGR_G_DestroyGeometry(cogr_geometry)
+            raise
         OGR_G_CloseRings(cogr_geometry)
         return cogr_geometry
     
     cdef void * _buildPolygon(self, object coordinates) except NULL:
         cdef void *cogr_ring
         cdef void *cogr_geometry = self._createOgrGeometry(GEOJSON2OGR_GEOMETRY_TYPES['Polygon'])
-        for ring in coordinates:
-            cogr_ring = self._buildLinearRing(ring)
-            OGR_G_AddGeometryDirectly(cogr_geometry, cogr_ring)
+        try:
+            for ring in coordinates:
+                cogr_ring = self._buildLinearRing(ring)
+                OGR_G_AddGeometryDirectly(cogr_geometry, cogr_ring)
+        except:
+            OGR_G_DestroyGeometry(cogr_geometry)
+            raise
         return cogr_geometry
 
     cdef void * _buildMultiPoint(self, object coordinates) except NULL:
         cdef void *cogr_part
         cdef void *cogr_geometry = self._createOgrGeometry(GEOJSON2OGR_GEOMETRY_TYPES['MultiPoint'])
-        for coordinate in coordinates:
-            cogr_part = self._buildPoint(coordinate)
-            OGR_G_AddGeometryDirectly(cogr_geometry, cogr_part)
+        try:
+            for coordinate in coordinates:
+                cogr_part = self._buildPoint(coordinate)
+                OGR_G_AddGeometryDirectly(cogr_geometry, cogr_part)
+        except:
+            OGR_G_DestroyGeometry(cogr_geometry)
+            raise
         return cogr_geometry
 
     cdef void * _buildMultiLineString(self, object coordinates) except NULL:
         cdef void *cogr_part
         cdef void *cogr_geometry = self._createOgrGeometry(GEOJSON2OGR_GEOMETRY_TYPES['MultiLineString'])
-        for line in coordinates:
-            cogr_part = self._buildLineString(line)
-            OGR_G_AddGeometryDirectly(cogr_geometry, cogr_part)
+        try:
+            for line in coordinates:
+                cogr_part = self._buildLineString(line)
+                OGR_G_AddGeometryDirectly(cogr_geometry, cogr_part)
+        except:
+            OGR_G_DestroyGeometry(cogr_geometry)
+            raise
         return cogr_geometry
 
     cdef void * _buildMultiPolygon(self, object coordinates) except NULL:
         cdef void *cogr_part
         cdef void *cogr_geometry = self._createOgrGeometry(GEOJSON2OGR_GEOMETRY_TYPES['MultiPolygon'])
-        for part in coordinates:
-            cogr_part = self._buildPolygon(part)
-            OGR_G_AddGeometryDirectly(cogr_geometry, cogr_part)
+        try:
+            for part in coordinates:
+                cogr_part = self._buildPolygon(part)
+                OGR_G_AddGeometryDirectly(cogr_geometry, cogr_part)
+        except:
+            OGR_G_DestroyGeometry(cogr_geometry)
+            raise
         return cogr_geometry
 
     cdef void * _buildGeometryCollection(self, object coordinates) except NULL:
         cdef void *cogr_part
         cdef void *cogr_geometry = self._createOgrGeometry(GEOJSON2OGR_GEOMETRY_TYPES['GeometryCollection'])
-        for part in coordinates:
-            cogr_part = OGRGeomBuilder().build(part)
-            OGR_G_AddGeometryDirectly(cogr_geometry, cogr_part)
+        try:
+            for part in coordinates:
+                cogr_part = self.build(part)
+                OGR_G_AddGeometryDirectly(cogr_geometry, cogr_part)
+        except:
+            OGR_G_DestroyGeometry(cogr_geometry)
+            raise
         return cogr_geometry
 
     cdef void * build(self, object geometry) except NULL:
@@ -293,6 +627,75 @@ cdef class OGRGeomBuilder:
             raise UnsupportedGeometryTypeError("Unsupported geometry type %s" % typename)
 
 
+cdef inline void _extend_bounds_xy(double *bounds, double x, double y):
+    bounds[0] = min(bounds[0], x)
+    bounds[1] = min(bounds[1], y)
+    bounds[2] = max(bounds[2], x)
+    bounds[3] = max(bounds[3], y)
+
+
+cdef int _extend_bounds(object coordinates, double *bounds) except -1:
+    # Extend (minx, miny, maxx, maxy) bounds by the positions of a
+    # GeoJSON-like coordinates object of any depth. Buffers of doubles
+    # of shape (N, 2) or (N, 3+) are read without Python objects.
+    cdef const double[:, :] view
+    cdef Py_ssize_t i
+
+    if PyObject_CheckBuffer(coordinates):
+        buf = memoryview(coordinates)
+        if buf.format in DOUBLE_BUFFER_FORMATS and buf.ndim == 2 and buf.shape[1] >= 2:
+            view = coordinates
+            for i in range(view.shape[0]):
+                _extend_bounds_xy(bounds, view[i, 0], view[i, 1])
+            return 0
+
+    if len(coordinates) == 0:
+        return 0
+    first = coordinates[0]
+    if isinstance(first, (float, int)) or not hasattr(first, '__len__'):
+        _extend_bounds_xy(bounds, first, coordinates[1])
+    else:
+        for part in coordinates:
+            _extend_bounds(part, bounds)
+    return 0
+
+
+cdef int _extend_geometry_bounds(object geometry, double *bounds) except -1:
+    if geometry['type'] == 'GeometryCollection':
+        for part in geometry['geometries']:
+            _extend_geometry_bounds(part, bounds)
+    else:
+        _extend_bounds(geometry['coordinates'], bounds)
+    return 0
+
+
+def geometry_bounds(geometry):
+    """Bounding box of a GeoJSON-like geometry
+
+    Parameters
+    ----------
+    geometry : dict
+        A GeoJSON-like geometry, whose coordinate sequences may also be
+        NumPy arrays
+
+    Returns
+    -------
+    tuple or None
+        (minx, miny, maxx, maxy), or None if the geometry is empty or
+        is not a GeoJSON-like geometry
+    """
+    cdef double bounds[4]
+    bounds[0] = bounds[1] = INFINITY
+    bounds[2] = bounds[3] = -INFINITY
+    try:
+        _extend_geometry_bounds(geometry, bounds)
+    except (KeyError, TypeError, IndexError):
+        return None
+    if bounds[0] > bounds[2]:
+        return None
+    return (bounds[0], bounds[1], bounds[2], bounds[3])
+
+
 def geometryRT(geometry):
     # For testing purposes only, leaks the JSON data
     cdef void *cogr_geometry = OGRGeomBuilder().build(geometry)
@@ -34,3 +34,6 @@ from fiona._shim cimport OGR_DS_GetLayerCount as GDALDatasetGetLayerCount
 from fiona._shim cimport OGR_DS_DeleteLayer as GDALDatasetDeleteLayer
 from fiona._shim cimport OGR_DS_CreateLayer as GDALDatasetCreateLayer
 from fiona._shim cimport OGR_Dr_DeleteDataSource as GDALDeleteDataset
+from fiona._shim cimport OGR_DS_ExecuteSQL as GDALDatasetExecuteSQL
+from fiona._shim cimport OGR_DS_ReleaseResultSet as GDALDatasetReleaseResultSet
+cdef int get_arrow_stream(void *cogr_layer, void *stream, char **options) except -1
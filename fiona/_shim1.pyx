@@ -5,7 +5,7 @@ import os
 from fiona.ogrext1 cimport *
 from fiona._err cimport exc_wrap_pointer
 from fiona._err import cpl_errs, CPLE_BaseError, FionaNullPointerError
-from fiona.errors import DriverError
+from fiona.errors import DriverError, GDALVersionError
 
 
 cdef int OGRERR_NONE = 0
@@ -132,3 +132,7 @@ cdef void osr_set_traditional_axis_mapping_strategy(OGRSpatialReferenceH hSrs):
 
 cdef void set_proj_search_path(object path):
     os.environ["PROJ_LIB"] = path
+
+
+cdef int get_arrow_stream(void *cogr_layer, void *stream, char **options) except -1:
+    raise GDALVersionError("Arrow stream export requires GDAL 3.6 or newer")
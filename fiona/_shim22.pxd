@@ -15,3 +15,4 @@ cdef void *get_linear_geometry(void *geom)
 cdef const char* osr_get_name(OGRSpatialReferenceH hSrs)
 cdef void osr_set_traditional_axis_mapping_strategy(OGRSpatialReferenceH hSrs)
 cdef void set_proj_search_path(object path)
+cdef int get_arrow_stream(void *cogr_layer, void *stream, char **options) except -1
@@ -11,7 +11,7 @@ from fiona.ogrext2 cimport *
 from fiona._err cimport exc_wrap_pointer
 
 from fiona._err import cpl_errs, CPLE_BaseError, FionaNullPointerError
-from fiona.errors import DriverError
+from fiona.errors import DriverError, GDALVersionError
 
 
 log = logging.getLogger(__name__)
@@ -144,3 +144,7 @@ cdef void osr_set_traditional_axis_mapping_strategy(OGRSpatialReferenceH hSrs):
 
 cdef void set_proj_search_path(object path):
     os.environ["PROJ_LIB"] = path
+
+
+cdef int get_arrow_stream(void *cogr_layer, void *stream, char **options) except -1:
+    raise GDALVersionError("Arrow stream export requires GDAL 3.6 or newer")
@@ -18,7 +18,7 @@ cdef extern from "ogr_srs_api.h" nogil:
 from fiona.ogrext2 cimport *
 from fiona._err cimport exc_wrap_pointer
 from fiona._err import cpl_errs, CPLE_BaseError, FionaNullPointerError
-from fiona.errors import DriverError
+from fiona.errors import DriverError, GDALVersionError
 
 import logging
 
@@ -159,3 +159,7 @@ cdef void set_proj_search_path(object path):
     path_c = path_b
     paths = CSLAddString(paths, path_c)
     OSRSetPROJSearchPaths(paths)
+
+
+cdef int get_arrow_stream(void *cogr_layer, void *stream, char **options) except -1:
+    raise GDALVersionError("Arrow stream export requires GDAL 3.6 or newer")
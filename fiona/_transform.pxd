@@ -0,0 +1,16 @@
+from fiona._crs cimport OGRSpatialReferenceH
+
+
+cdef class Transformer:
+    cdef OGRSpatialReferenceH src
+    cdef OGRSpatialReferenceH dst
+    cdef void *ct
+    cdef char **options
+    cdef readonly object src_crs
+    cdef readonly object dst_crs
+    cdef readonly bint antimeridian_cutting
+    cdef readonly double antimeridian_offset
+
+    cdef void *transform_ogr_geometry(self, void *geometry) except NULL
+    cdef int transform_buffers(self, tuple coords, tuple out) except -1
+    cdef list transform_batch(self, list batch, int precision)
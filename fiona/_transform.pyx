@@ -4,13 +4,23 @@
 
 from __future__ import absolute_import
 
+import array
+from collections import OrderedDict
+import itertools
 import logging
+import threading
 
-from fiona cimport _cpl, _crs, _csl, _geometry
+from fiona cimport _crs, _csl, _geometry
 from fiona._crs cimport OGRSpatialReferenceH
 from fiona._shim cimport osr_set_traditional_axis_mapping_strategy
 
+from cpython cimport PyBytes_FromStringAndSize, PyBytes_AsString
+from cpython.buffer cimport PyObject_CheckBuffer
+from libc.stdlib cimport free, malloc, realloc
+
+from fiona._geometry import DOUBLE_BUFFER_FORMATS
 from fiona.compat import UserDict
+from fiona.errors import CRSError
 
 
 cdef extern from "ogr_geometry.h" nogil:
@@ -19,6 +29,7 @@ cdef extern from "ogr_geometry.h" nogil:
         pass
 
     cdef cppclass OGRGeometryFactory:
+        @staticmethod
         void * transformWithOptions(void *geom, void *ct, char **options)
 
 
@@ -34,6 +45,15 @@ class NullHandler(logging.Handler):
         pass
 log.addHandler(NullHandler())
 
+# Number of transformers cached by each thread.
+TRANSFORMER_CACHE_SIZE = 32
+
+# Number of geometries whose vertices are transformed together by
+# Transformer.transform_geoms().
+TRANSFORM_BATCH_SIZE = 1000
+
+_local = threading.local()
+
 
 cdef void *_crs_from_crs(object crs):
     cdef char *proj_c = NULL
@@ -42,8 +62,9 @@ cdef void *_crs_from_crs(object crs):
     if osr == NULL:
         raise ValueError("NULL spatial reference")
     params = []
-    # Normally, we expect a CRS dict.
-    if isinstance(crs, UserDict):
+    # Normally, we expect a CRS dict. It is copied so that the
+    # caller's is not modified.
+    if isinstance(crs, (dict, UserDict)):
         crs = dict(crs)
 
     if isinstance(crs, dict):
@@ -75,148 +96,535 @@ cdef void *_crs_from_crs(object crs):
     return osr
 
 
-def _transform(src_crs, dst_crs, xs, ys):
+cdef inline bint _is_position(object coordinates):
+    return len(coordinates) > 0 and not hasattr(coordinates[0], '__len__')
+
+
+def _is_double_buffer(obj):
+    """True if an object is a 1-D buffer of doubles"""
+    if not PyObject_CheckBuffer(obj):
+        return False
+    buf = memoryview(obj)
+    return buf.format in DOUBLE_BUFFER_FORMATS and buf.ndim == 1
+
+
+def _copy_coordinates(coordinates):
+    """Copies coordinates into a new writable buffer of doubles
+
+    Buffers with a copy method, like NumPy arrays, are copied by it.
+    Other coordinates are copied into an array('d').
+    """
+    if _is_double_buffer(coordinates) and hasattr(coordinates, 'copy'):
+        copied = coordinates.copy()
+        if _is_double_buffer(copied):
+            return copied
+    return array.array('d', coordinates)
+
+
+cdef int _fill(double[::1] dst, object src) except -1:
+    """Copies coordinates into a buffer of doubles"""
+    cdef const double[::1] view
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = dst.shape[0]
+    try:
+        view = src
+    except (TypeError, ValueError, BufferError):
+        for i in range(n):
+            dst[i] = src[i]
+    else:
+        with nogil:
+            for i in range(n):
+                dst[i] = view[i]
+    return 0
+
+
+cdef double *_grow(double *buf, int capacity) except NULL:
+    cdef double *grown = <double *>realloc(buf, capacity * sizeof(double))
+    if grown == NULL:
+        raise MemoryError()
+    return grown
+
+
+cdef class _Vertices:
+    """A growable buffer of the vertices of GeoJSON-like geometries
+
+    Vertices are gathered from geometries, transformed in place, and
+    scattered into new geometries of the same structure.
+    """
+
     cdef double *x
     cdef double *y
-    cdef char *proj_c = NULL
-    cdef OGRSpatialReferenceH src = NULL
-    cdef OGRSpatialReferenceH dst = NULL
-    cdef void *transform = NULL
-    cdef int i
+    cdef double *z
+    cdef int n
+    cdef int capacity
+    cdef int cursor
+
+    def __dealloc__(self):
+        free(self.x)
+        free(self.y)
+        free(self.z)
+
+    cdef int append(self, double x, double y, double z) except -1:
+        cdef int capacity
+        if self.n == self.capacity:
+            capacity = max(1024, 2 * self.capacity)
+            self.x = _grow(self.x, capacity)
+            self.y = _grow(self.y, capacity)
+            self.z = _grow(self.z, capacity)
+            self.capacity = capacity
+        self.x[self.n] = x
+        self.y[self.n] = y
+        self.z[self.n] = z
+        self.n += 1
+        return 0
+
+    cdef int gather(self, object coordinates) except -1:
+        if _is_position(coordinates):
+            self.append(
+                coordinates[0], coordinates[1],
+                coordinates[2] if len(coordinates) > 2 else 0.0)
+        else:
+            for part in coordinates:
+                self.gather(part)
+        return 0
+
+    cdef object scatter(self, object coordinates):
+        cdef int i
+        if _is_position(coordinates):
+            i = self.cursor
+            self.cursor += 1
+            if len(coordinates) > 2:
+                return (self.x[i], self.y[i], self.z[i])
+            return (self.x[i], self.y[i])
+        return [self.scatter(part) for part in coordinates]
+
+    cdef int gather_geometry(self, object geometry) except -1:
+        if geometry['type'] == 'GeometryCollection':
+            for part in geometry['geometries']:
+                self.gather_geometry(part)
+        else:
+            self.gather(geometry['coordinates'])
+        return 0
+
+    cdef object scatter_geometry(self, object geometry):
+        if geometry['type'] == 'GeometryCollection':
+            return {
+                'type': 'GeometryCollection',
+                'geometries': [self.scatter_geometry(part) for part in geometry['geometries']]}
+        return {
+            'type': geometry['type'],
+            'coordinates': self.scatter(geometry['coordinates'])}
+
+
+cdef object _ogr_geometry_wkb(void *cogr_geometry):
+    """Export an OGR geometry to little endian WKB"""
+    cdef int size = _geometry.OGR_G_WkbSize(cogr_geometry)
+    wkb = PyBytes_FromStringAndSize(NULL, size)
+    _geometry.OGR_G_ExportToWkb(cogr_geometry, 1, PyBytes_AsString(wkb))
+    return wkb
+
+
+cdef class Transformer:
+    """Transforms coordinates and geometries from one CRS to another
+
+    A transformer owns the spatial references and the OGR coordinate
+    transformation of a pair of CRS for its lifetime, so that they are
+    parsed and instantiated once for any number of transformations.
+    Like OGR coordinate transformations, a transformer must not be used
+    by several threads at a time.
+
+    Parameters
+    ----------
+    src_crs, dst_crs : str or dict
+        The source and destination CRS, like the ones of
+        fiona.transform.transform_geom()
+    antimeridian_cutting : bool, optional
+        True to cut output geometries in two at the antimeridian
+    antimeridian_offset : float, optional
+        A distance in decimal degrees from the antimeridian, outside of
+        which geometries will not be cut
+    """
+
+    def __cinit__(self, src_crs, dst_crs, antimeridian_cutting=False,
+                  antimeridian_offset=10.0):
+        self.src_crs = src_crs
+        self.dst_crs = dst_crs
+        self.antimeridian_cutting = antimeridian_cutting
+        self.antimeridian_offset = antimeridian_offset
+        self.src = _crs_from_crs(src_crs)
+        self.dst = _crs_from_crs(dst_crs)
+        self.ct = _crs.OCTNewCoordinateTransformation(self.src, self.dst)
+        if self.ct == NULL:
+            raise CRSError(
+                "Can't transform coordinates from %r to %r" % (src_crs, dst_crs))
+
+        self.options = _csl.CSLSetNameValue(
+            self.options, "DATELINEOFFSET",
+            str(antimeridian_offset).encode('utf-8'))
+        if antimeridian_cutting:
+            self.options = _csl.CSLSetNameValue(self.options, "WRAPDATELINE", "YES")
+
+    def __dealloc__(self):
+        if self.ct != NULL:
+            _crs.OCTDestroyCoordinateTransformation(self.ct)
+        if self.options != NULL:
+            _csl.CSLDestroy(self.options)
+        if self.src != NULL:
+            _crs.OSRRelease(self.src)
+        if self.dst != NULL:
+            _crs.OSRRelease(self.dst)
+
+    def __repr__(self):
+        return "<Transformer from %r to %r>" % (self.src_crs, self.dst_crs)
+
+    cdef void *transform_ogr_geometry(self, void *geometry) except NULL:
+        """Transforms an OGR geometry into a new one, which the caller
+        must destroy"""
+        cdef void *ct = self.ct
+        cdef char **options = self.options
+        cdef void *result = NULL
+        with nogil:
+            result = OGRGeometryFactory.transformWithOptions(
+                <const OGRGeometry *>geometry,
+                <OGRCoordinateTransformation *>ct,
+                options)
+        if result == NULL:
+            raise ValueError("Failed to transform geometry")
+        return result
+
+    def transform(self, xs, ys, zs=None, out=None):
+        """Transforms sequences of x, y and optionally z coordinates
+
+        Coordinates may be sequences of numbers or buffers of doubles,
+        such as NumPy float64 arrays or array('d'). If ``out`` is given,
+        the transformed coordinates are written into its buffers, which
+        may be the input buffers to transform them in place. Otherwise,
+        sequences are transformed into new lists and buffers into copies
+        of the buffers. The GIL is released while the coordinates are
+        transformed.
+
+        Parameters
+        ----------
+        xs, ys : sequence or buffer of float
+            The x and y coordinates
+        zs : sequence or buffer of float, optional
+            The z coordinates
+        out : tuple, optional
+            Writable contiguous buffers of doubles, one per coordinate
+            sequence, into which the transformed coordinates are written
+
+        Returns
+        -------
+        tuple
+            The transformed x, y and, if zs is given, z coordinates
+        """
+        coords = (xs, ys) if zs is None else (xs, ys, zs)
+        if out is not None:
+            self.transform_buffers(coords, tuple(out))
+            return tuple(out)
+
+        buffers = all(_is_double_buffer(c) for c in coords)
+        out = tuple(_copy_coordinates(c) for c in coords)
+        self.transform_buffers(out, out)
+        if not buffers:
+            return tuple(c.tolist() for c in out)
+        return out
+
+    cdef int transform_buffers(self, tuple coords, tuple out) except -1:
+        """Transforms coordinates into buffers of doubles"""
+        cdef double[::1] x
+        cdef double[::1] y
+        cdef double[::1] z
+        cdef double *zp = NULL
+        cdef void *ct = self.ct
+        cdef int n
+
+        if len(out) != len(coords):
+            raise ValueError("out must have one buffer per coordinate sequence")
+        n = len(coords[0])
+        for c, o in zip(coords, out):
+            if len(c) != n or len(o) != n:
+                raise ValueError("Coordinate sequences must have the same length")
+        if n == 0:
+            return 0
+
+        for c, o in zip(coords, out):
+            if c is not o:
+                _fill(o, c)
+
+        x = out[0]
+        y = out[1]
+        if len(out) == 3:
+            z = out[2]
+            zp = &z[0]
+        with nogil:
+            _crs.OCTTransform(ct, n, &x[0], &y[0], zp)
+        return 0
+
+    def transform_bounds(self, bounds, densify_pts=21):
+        """Transforms a bounding box
+
+        The edges of the box are densified so that the transformed box
+        contains the curved edges of the transformed rectangle.
+
+        Parameters
+        ----------
+        bounds : tuple
+            A (minx, miny, maxx, maxy) tuple
+        densify_pts : int, optional
+            Number of points per edge of the box
+
+        Returns
+        -------
+        tuple
+            The (minx, miny, maxx, maxy) bounds of the transformed box
+        """
+        cdef int i
+        cdef double t
+
+        minx, miny, maxx, maxy = bounds
+        n = max(int(densify_pts), 2)
+        xs = array.array('d')
+        ys = array.array('d')
+        for i in range(n):
+            t = <double>i / (n - 1)
+            dx = minx + (maxx - minx) * t
+            dy = miny + (maxy - miny) * t
+            xs.extend((dx, dx, minx, maxx))
+            ys.extend((miny, maxy, dy, dy))
+        self.transform_buffers((xs, ys), (xs, ys))
+        return (min(xs), min(ys), max(xs), max(ys))
+
+    def transform_geom(self, geom, precision=-1):
+        """Transforms a GeoJSON-like geometry
+
+        Parameters
+        ----------
+        geom : dict
+            A GeoJSON-like geometry
+        precision : int, optional
+            Rounding precision of output coordinates, in number of
+            decimal places
+
+        Returns
+        -------
+        dict
+            A new GeoJSON-like geometry
+        """
+        cdef void *src_ogr_geom = NULL
+        cdef void *dst_ogr_geom = NULL
 
-    assert len(xs) == len(ys)
+        src_ogr_geom = _geometry.OGRGeomBuilder().build(geom)
+        try:
+            dst_ogr_geom = self.transform_ogr_geometry(src_ogr_geom)
+        finally:
+            _geometry.OGR_G_DestroyGeometry(src_ogr_geom)
+        try:
+            return _geometry.GeomBuilder(precision=precision).build(dst_ogr_geom)
+        finally:
+            _geometry.OGR_G_DestroyGeometry(dst_ogr_geom)
+
+    def transform_wkb(self, wkb, precision=-1):
+        """Transforms a WKB geometry
+
+        Returns
+        -------
+        bytes
+            A new WKB geometry, whose coordinates are rounded to
+            ``precision`` decimal places in C if it is not negative
+        """
+        cdef void *src_ogr_geom = NULL
+        cdef void *dst_ogr_geom = NULL
+
+        src_ogr_geom = _geometry._createOgrGeomFromWKB(wkb)
+        try:
+            dst_ogr_geom = self.transform_ogr_geometry(src_ogr_geom)
+        finally:
+            _geometry.OGR_G_DestroyGeometry(src_ogr_geom)
+        try:
+            if precision >= 0:
+                _geometry.round_ogr_geometry(dst_ogr_geom, precision)
+            return _ogr_geometry_wkb(dst_ogr_geom)
+        finally:
+            _geometry.OGR_G_DestroyGeometry(dst_ogr_geom)
+
+    def transform_geoms(self, geoms, precision=-1):
+        """Transforms geometries
+
+        Geometries may be GeoJSON-like mappings or objects with a
+        ``__geo_interface__``, which are transformed into mappings, WKB
+        bytes, objects with a ``wkb`` attribute such as shapely
+        geometries, which are transformed into objects of the same type,
+        or None. The vertices of up to TRANSFORM_BATCH_SIZE GeoJSON-like
+        geometries are transformed by one call of OCTTransformEx, unless
+        they are cut at the antimeridian. A geometry that fails to
+        transform raises its error when it is reached, after the
+        geometries before it have been yielded.
+
+        Parameters
+        ----------
+        geoms : iterable
+            The geometries
+        precision : int, optional
+            Rounding precision of output coordinates, in number of
+            decimal places
+
+        Yields
+        ------
+        object
+            The transformed geometries, in order
+        """
+        geoms = iter(geoms)
+        while True:
+            batch = list(itertools.islice(geoms, TRANSFORM_BATCH_SIZE))
+            if not batch:
+                break
+            for geom in self.transform_batch(batch, precision):
+                if isinstance(geom, _FailedTransform):
+                    raise geom.error
+                yield geom
+
+    cdef list transform_batch(self, list batch, int precision):
+        cdef _Vertices vertices = _Vertices()
+        cdef void *ct = self.ct
+        cdef int *success = NULL
+        cdef int j
+        cdef int start
+
+        results = [None] * len(batch)
+        mappings = []
+        for i, geom in enumerate(batch):
+            try:
+                if geom is None:
+                    continue
+                elif isinstance(geom, (bytes, bytearray)):
+                    results[i] = self.transform_wkb(bytes(geom), precision)
+                    continue
+                elif isinstance(getattr(geom, 'wkb', None), bytes):
+                    results[i] = _shapely_loads(self.transform_wkb(geom.wkb, precision))
+                    continue
+                elif not isinstance(geom, dict):
+                    geom = geom.__geo_interface__
+                if self.antimeridian_cutting:
+                    results[i] = self.transform_geom(geom, precision)
+                else:
+                    start = vertices.n
+                    vertices.gather_geometry(geom)
+                    mappings.append((i, geom, start, vertices.n))
+            except Exception as exc:
+                results[i] = _FailedTransform(exc)
+
+        if vertices.n > 0:
+            success = <int *>malloc(vertices.n * sizeof(int))
+            if success == NULL:
+                raise MemoryError()
+            try:
+                with nogil:
+                    _crs.OCTTransformEx(
+                        ct, vertices.n, vertices.x, vertices.y, vertices.z, success)
+                    if precision >= 0:
+                        _geometry.round_coordinates(vertices.x, vertices.n, precision)
+                        _geometry.round_coordinates(vertices.y, vertices.n, precision)
+                        _geometry.round_coordinates(vertices.z, vertices.n, precision)
+
+                # A geometry of which a vertex failed is transformed on
+                # its own, so that it fails like in transform_geom().
+                for i, geom, start, stop in mappings:
+                    for j in range(start, stop):
+                        if not success[j]:
+                            break
+                    else:
+                        vertices.cursor = start
+                        results[i] = vertices.scatter_geometry(geom)
+                        continue
+                    try:
+                        results[i] = self.transform_geom(geom, precision)
+                    except Exception as exc:
+                        results[i] = _FailedTransform(exc)
+            finally:
+                free(success)
+
+        return results
+
+
+class _FailedTransform(object):
+    """The error of a geometry of a batch that failed to transform"""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def _shapely_loads(wkb):
+    import shapely.wkb
+    return shapely.wkb.loads(wkb)
+
+
+def _crs_key(crs):
+    """A hashable key of a CRS"""
+    if isinstance(crs, (dict, UserDict)):
+        return tuple(sorted(dict(crs).items()))
+    return crs
 
-    src = _crs_from_crs(src_crs)
-    dst = _crs_from_crs(dst_crs)
 
-    n = len(xs)
-    x = <double *>_cpl.CPLMalloc(n*sizeof(double))
-    y = <double *>_cpl.CPLMalloc(n*sizeof(double))
-    for i in range(n):
-        x[i] = xs[i]
-        y[i] = ys[i]
+def get_transformer(src_crs, dst_crs, antimeridian_cutting=False,
+                    antimeridian_offset=10.0):
+    """Gets a transformer from the calling thread's cache
 
-    transform = _crs.OCTNewCoordinateTransformation(src, dst)
-    res = _crs.OCTTransform(transform, n, x, y, NULL)
+    Each thread keeps its TRANSFORMER_CACHE_SIZE most recently used
+    transformers, since transformers can't be shared between threads.
 
-    res_xs = [0]*n
-    res_ys = [0]*n
+    Returns
+    -------
+    Transformer
+    """
+    try:
+        key = (_crs_key(src_crs), _crs_key(dst_crs),
+               bool(antimeridian_cutting), float(antimeridian_offset))
+        hash(key)
+    except TypeError:
+        return Transformer(
+            src_crs, dst_crs, antimeridian_cutting, antimeridian_offset)
 
-    for i in range(n):
-        res_xs[i] = x[i]
-        res_ys[i] = y[i]
+    cache = getattr(_local, 'transformers', None)
+    if cache is None:
+        cache = _local.transformers = OrderedDict()
+    transformer = cache.pop(key, None)
+    if transformer is None:
+        log.debug("Creating transformer from %r to %r", src_crs, dst_crs)
+        transformer = Transformer(
+            src_crs, dst_crs, antimeridian_cutting, antimeridian_offset)
+    cache[key] = transformer
+    while len(cache) > TRANSFORMER_CACHE_SIZE:
+        cache.popitem(last=False)
+    return transformer
 
-    _cpl.CPLFree(x)
-    _cpl.CPLFree(y)
-    _crs.OCTDestroyCoordinateTransformation(transform)
-    _crs.OSRRelease(src)
-    _crs.OSRRelease(dst)
-    return res_xs, res_ys
+
+def _transform(src_crs, dst_crs, xs, ys, zs=None, out=None):
+    return get_transformer(src_crs, dst_crs).transform(xs, ys, zs, out)
 
 
 def _transform_geom(
         src_crs, dst_crs, geom, antimeridian_cutting, antimeridian_offset,
         precision):
     """Return a transformed geometry."""
-    cdef char *proj_c = NULL
-    cdef char *key_c = NULL
-    cdef char *val_c = NULL
-    cdef char **options = NULL
-    cdef OGRSpatialReferenceH src = NULL
-    cdef OGRSpatialReferenceH dst = NULL
-    cdef void *transform = NULL
-    cdef OGRGeometryFactory *factory = NULL
-    cdef void *src_ogr_geom = NULL
-    cdef void *dst_ogr_geom = NULL
-    cdef int i
-
     if src_crs and dst_crs:
-        src = _crs_from_crs(src_crs)
-        dst = _crs_from_crs(dst_crs)
-        transform = _crs.OCTNewCoordinateTransformation(src, dst)
-
-        # Transform options.
-        options = _csl.CSLSetNameValue(
-                    options, "DATELINEOFFSET", 
-                    str(antimeridian_offset).encode('utf-8'))
-        if antimeridian_cutting:
-            options = _csl.CSLSetNameValue(options, "WRAPDATELINE", "YES")
-
-        factory = new OGRGeometryFactory()
-        src_ogr_geom = _geometry.OGRGeomBuilder().build(geom)
-        dst_ogr_geom = factory.transformWithOptions(
-                        <const OGRGeometry *>src_ogr_geom,
-                        <OGRCoordinateTransformation *>transform,
-                        options)
-        g = _geometry.GeomBuilder().build(dst_ogr_geom)
-
-        _geometry.OGR_G_DestroyGeometry(dst_ogr_geom)
-        _geometry.OGR_G_DestroyGeometry(src_ogr_geom)
-        _crs.OCTDestroyCoordinateTransformation(transform)
-        if options != NULL:
-            _csl.CSLDestroy(options)
-        _crs.OSRRelease(src)
-        _crs.OSRRelease(dst)
-
-    else:
-        g = geom
+        transformer = get_transformer(
+            src_crs, dst_crs, antimeridian_cutting, antimeridian_offset)
+        return transformer.transform_geom(geom, precision)
 
     if precision >= 0:
+        return _round_geometry(geom, precision)
+    return geom
 
-        if g['type'] == 'Point':
-            coords = list(g['coordinates'])
-            x, y = coords[:2]
-            x = round(x, precision)
-            y = round(y, precision)
-            new_coords = [x, y]
-            if len(coords) == 3:
-                z = coords[2]
-                new_coords.append(round(z, precision))
-
-        elif g['type'] in ['LineString', 'MultiPoint']:
-            coords = list(zip(*g['coordinates']))
-            xp, yp = coords[:2]
-            xp = [round(v, precision) for v in xp]
-            yp = [round(v, precision) for v in yp]
-            if len(coords) == 3:
-                zp = coords[2]
-                zp = [round(v, precision) for v in zp]
-                new_coords = list(zip(xp, yp, zp))
-            else:
-                new_coords = list(zip(xp, yp))
-
-        elif g['type'] in ['Polygon', 'MultiLineString']:
-            new_coords = []
-            for piece in g['coordinates']:
-                coords = list(zip(*piece))
-                xp, yp = coords[:2]
-                xp = [round(v, precision) for v in xp]
-                yp = [round(v, precision) for v in yp]
-                if len(coords) == 3:
-                    zp = coords[2]
-                    zp = [round(v, precision) for v in zp]
-                    new_coords.append(list(zip(xp, yp, zp)))
-                else:
-                    new_coords.append(list(zip(xp, yp)))
-
-        elif g['type'] == 'MultiPolygon':
-            parts = g['coordinates']
-            new_coords = []
-            for part in parts:
-                inner_coords = []
-                for ring in part:
-                    coords = list(zip(*ring))
-                    xp, yp = coords[:2]
-                    xp = [round(v, precision) for v in xp]
-                    yp = [round(v, precision) for v in yp]
-                    if len(coords) == 3:
-                        zp = coords[2]
-                        zp = [round(v, precision) for v in zp]
-                        inner_coords.append(list(zip(xp, yp, zp)))
-                    else:
-                        inner_coords.append(list(zip(xp, yp)))
-                new_coords.append(inner_coords)
 
-        g['coordinates'] = new_coords
+def _round_geometry(geom, precision):
+    """Round the coordinates of a GeoJSON-like geometry
 
-    return g
+    The geometry is loaded into an OGR geometry and a new one is built
+    from it, with its coordinates rounded in C.
+    """
+    cdef void *cogr_geometry = _geometry.OGRGeomBuilder().build(geom)
+    try:
+        return _geometry.GeomBuilder(precision=precision).build(cogr_geometry)
+    finally:
+        _geometry.OGR_G_DestroyGeometry(cogr_geometry)
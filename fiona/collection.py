@@ -3,12 +3,17 @@
 
 import logging
 import os
+import time
 import warnings
+import weakref
 
 from fiona import compat, vfs
-from fiona.ogrext import Iterator, ItemsIterator, KeysIterator
+from fiona.ogrext import Iterator, ItemsIterator, KeysIterator, BatchIterator
+from fiona.ogrext import DEFAULT_BATCH_SIZE, DEFAULT_TRANSACTION_SIZE
+from fiona.ogrext import GEOMETRY_FORMATS, VALIDATION_MODES
 from fiona.ogrext import Session, WritingSession
 from fiona.ogrext import buffer_to_virtual_file, remove_virtual_file, GEOMETRY_TYPES
+from fiona.ogrext import _normalize_geometry, _geometry_type_name
 from fiona.errors import (DriverError, SchemaError, CRSError, UnsupportedGeometryTypeError, DriverSupportError)
 from fiona.logutils import FieldSkipLogFilter
 from fiona._crs import crs_to_wkt
@@ -17,11 +22,16 @@ from fiona.env import env_ctx_if_needed
 from fiona.errors import FionaDeprecationWarning
 from fiona.drvsupport import supported_drivers
 from fiona.path import Path, vsi_path, parse_path
-from six import string_types, binary_type
+from fiona.parallel import Partition, index_partitions, tile_partitions
+from six import integer_types, string_types, binary_type
 
 
 log = logging.getLogger(__name__)
 
+# Open collections, whose datasets are detached in forked child
+# processes.
+_open_collections = weakref.WeakSet()
+
 
 class Collection(object):
 
@@ -30,13 +40,26 @@ class Collection(object):
     Python text file objects are iterators over lines of a file. Fiona
     Collections are similar iterators (not lists!) over features
     represented as GeoJSON-like mappings.
+
+    Collections in 'r' mode can be pickled. The unpickled collection
+    opens the dataset again when it is first used, and resumes the
+    iteration of the pickled collection's iterator.
     """
 
+    _session = None
+    _iterator = None
+    _reopen_spec = None
+
     def __init__(self, path, mode='r', driver=None, schema=None, crs=None,
                  encoding=None, layer=None, vsi=None, archive=None,
                  enabled_drivers=None, crs_wkt=None, ignore_fields=None,
-                 ignore_geometry=False,
-                 **kwargs):
+                 ignore_geometry=False, geometry_format='geojson',
+                 validate='full', buffered=False,
+                 buffer_size=DEFAULT_TRANSACTION_SIZE, buffer_bytes=None,
+                 buffer_interval=None,
+                 transaction_size=DEFAULT_TRANSACTION_SIZE, bulk_load=False,
+                 write_workers=0, pool=None, metadata_cache=None,
+                 dst_crs=None, **kwargs):
 
         """The required ``path`` is the absolute or relative path to
         a file, such as '/data/test_uk.shp'. In ``mode`` 'r', data can
@@ -51,6 +74,48 @@ class Collection(object):
 
         In 'w' mode, kwargs will be mapped to OGR layer creation
         options.
+
+        Features' geometries are read as GeoJSON-like mappings by
+        default. A ``geometry_format`` of 'wkb', 'wkt', or 'shapely'
+        returns WKB bytes, WKT text, or shapely geometries instead,
+        without building the mappings. With 'numpy' the mappings'
+        coordinate sequences are NumPy arrays of shape (N, 2) or (N, 3).
+
+        In 'w' and 'a' mode, written records are validated against the
+        schema according to ``validate``: every record ('full', the
+        default), a sample of the records ('sample'), or none ('none').
+        Trusted bulk loads can skip the checks with 'none'.
+
+        If ``buffered`` is True, records passed to ``write()`` are
+        queued and written in one transaction when the queue holds
+        ``buffer_size`` records, an estimated ``buffer_bytes`` bytes,
+        or records queued more than ``buffer_interval`` seconds ago.
+        The queue is also written by ``flush()`` and ``close()``.
+
+        In 'w' and 'a' mode, features are committed to transactional
+        formats every ``transaction_size`` features. If ``bulk_load``
+        is True, a GPKG or SQLite dataset is loaded with relaxed
+        journal and synchronous settings and, in 'w' mode, its spatial
+        index is built once at close instead of feature by feature. The
+        duration of the commits and of the index build are then
+        reported by ``bulk_load_timings``.
+
+        If ``write_workers`` is a positive number, records passed to
+        ``writerecords()`` are converted to OGR features by that many
+        threads while the calling thread inserts them into the layer.
+
+        In 'r' mode, the dataset may be leased from a
+        ``fiona.pool.DatasetPool`` given as ``pool``, to which it is
+        returned when the collection is closed.
+
+        In 'r' mode, the driver, schema, CRS, length and bounds of a
+        layer are looked up in and added to a
+        ``fiona.metacache.MetadataCache`` given as ``metadata_cache``.
+
+        In 'r' mode, features may be read in another CRS than the
+        layer's, given as ``dst_crs``. Their geometries are then
+        transformed by OGR before they are built, and ``crs``,
+        ``crs_wkt``, ``bounds`` and spatial filters are in ``dst_crs``.
         """
 
         if not isinstance(path, (string_types, Path)):
@@ -74,6 +139,26 @@ class Collection(object):
                 raise TypeError("invalid vsi: %r" % vsi)
         if archive and not isinstance(archive, string_types):
             raise TypeError("invalid archive: %r" % archive)
+        if geometry_format not in GEOMETRY_FORMATS:
+            raise ValueError("invalid geometry_format: %r" % geometry_format)
+        if validate not in VALIDATION_MODES:
+            raise ValueError("invalid validate: %r" % validate)
+        if buffered and mode == 'r':
+            raise ValueError("buffered is only valid in 'a' or 'w' mode")
+        if not isinstance(transaction_size, integer_types) or transaction_size < 1:
+            raise ValueError("invalid transaction_size: %r" % transaction_size)
+        if bulk_load and mode == 'r':
+            raise ValueError("bulk_load is only valid in 'a' or 'w' mode")
+        if not isinstance(write_workers, integer_types) or write_workers < 0:
+            raise ValueError("invalid write_workers: %r" % write_workers)
+        if pool is not None and mode != 'r':
+            raise ValueError("pool is only valid in 'r' mode")
+        if metadata_cache is not None and mode != 'r':
+            raise ValueError("metadata_cache is only valid in 'r' mode")
+        if dst_crs and not isinstance(dst_crs, compat.DICT_TYPES + string_types):
+            raise TypeError("invalid dst_crs: %r" % dst_crs)
+        if dst_crs and mode != 'r':
+            raise ValueError("dst_crs is only valid in 'r' mode")
 
         # Check GDAL version against drivers
         if (driver == "GPKG" and get_gdal_version_tuple() < (1, 11, 0)):
@@ -83,6 +168,7 @@ class Collection(object):
 
         self.session = None
         self.iterator = None
+        self._arrow_reader = None
         self._len = 0
         self._bounds = None
         self._driver = None
@@ -92,6 +178,19 @@ class Collection(object):
         self.enabled_drivers = enabled_drivers
         self.ignore_fields = ignore_fields
         self.ignore_geometry = bool(ignore_geometry)
+        self.geometry_format = geometry_format
+        self.validate = validate
+        self._write_buffer = None
+        if buffered:
+            self._write_buffer = WriteBuffer(
+                size=buffer_size, nbytes=buffer_bytes, interval=buffer_interval)
+        self.transaction_size = transaction_size
+        self.bulk_load = bool(bulk_load)
+        self.bulk_load_timings = None
+        self.write_workers = write_workers
+        self.pool = pool
+        self.metadata_cache = metadata_cache
+        self.dst_crs = dst_crs or None
 
         if vsi:
             self.path = vfs.vsi_path(path, vsi, archive)
@@ -116,6 +215,9 @@ class Collection(object):
             else:
                 self.name = layer or os.path.basename(os.path.splitext(path)[0])
 
+        # The layer as requested, before the session resolves indexes
+        # to names, keys the metadata cache.
+        self._metadata_layer = self.name
         self.mode = mode
 
         if self.mode == 'w':
@@ -166,6 +268,9 @@ class Collection(object):
 
         self.field_skip_log_filter = FieldSkipLogFilter()
 
+        if self.session is not None:
+            _open_collections.add(self)
+
     def __repr__(self):
         return "<%s Collection '%s', mode '%s' at %s>" % (
             self.closed and "closed" or "open",
@@ -180,11 +285,101 @@ class Collection(object):
         if self.mode not in supported_drivers[driver]:
             raise DriverError("unsupported mode: %r" % self.mode)
 
+    @property
+    def session(self):
+        """The collection's Session, opened again when first accessed
+        after the collection is unpickled or the process is forked"""
+        if self._session is None and self._reopen_spec is not None:
+            self._reopen()
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        self._session = session
+
+    @property
+    def iterator(self):
+        """The collection's current iterator"""
+        if self._session is None and self._reopen_spec is not None:
+            self._reopen()
+        return self._iterator
+
+    @iterator.setter
+    def iterator(self, iterator):
+        self._iterator = iterator
+
+    def _open_spec(self):
+        """Keyword arguments of Collection to open the collection again
+        in 'r' mode, with the state of its iterator"""
+        if self._session is None and self._reopen_spec is not None:
+            return dict(self._reopen_spec)
+        spec = {
+            'path': self.path,
+            'mode': 'r',
+            'layer': self.name,
+            'encoding': self.encoding,
+            'enabled_drivers': self.enabled_drivers or [self.driver],
+            'ignore_fields': self.ignore_fields,
+            'ignore_geometry': self.ignore_geometry,
+            'geometry_format': self.geometry_format,
+            'dst_crs': self.dst_crs}
+        if self._iterator is not None:
+            spec['iterator_state'] = self._iterator.get_state()
+        return spec
+
+    def _reopen(self):
+        """Opens the collection again from its open spec"""
+        spec = dict(self._reopen_spec)
+        self._reopen_spec = None
+        state = spec.pop('iterator_state', None)
+        field_skip_log_filter = getattr(self, 'field_skip_log_filter', None)
+        log.debug("Reopening %s", spec['path'])
+        self.__init__(**spec)
+        if field_skip_log_filter is not None:
+            self.field_skip_log_filter = field_skip_log_filter
+        if state:
+            iterators = {
+                'Iterator': self.filter,
+                'ItemsIterator': self.items,
+                'KeysIterator': self.keys}
+            iterators[state['iterator']](
+                state['start'], state['stop'], state['step'],
+                bbox=state['bbox'], mask=state['mask'],
+                with_bbox=state.get('with_bbox', False),
+                precision=state.get('precision', -1))
+
+    def _after_fork(self):
+        """Detaches the dataset inherited from the parent process
+
+        Collections in 'r' mode are opened again when next used. Others
+        are closed.
+        """
+        session = self._session
+        if session is None:
+            return
+        spec = None
+        if self.mode == 'r' and not self.path.startswith('/vsimem/'):
+            spec = self._open_spec()
+        self._arrow_reader = None
+        self.iterator = None
+        session.detach()
+        self._session = None
+        self._reopen_spec = spec
+
+    def __reduce__(self):
+        if self.mode != 'r':
+            raise TypeError("collections can only be pickled in 'r' mode")
+        if self.path.startswith('/vsimem/'):
+            raise TypeError("collections of in-memory files can not be pickled")
+        if self._session is None and self._reopen_spec is None:
+            raise ValueError("I/O operation on closed collection")
+        return (_unpickle_collection, (type(self), self._open_spec()))
+
     @property
     def driver(self):
         """Returns the name of the proper OGR driver."""
         if not self._driver and self.mode in ("a", "r") and self.session:
-            self._driver = self.session.get_driver()
+            self._driver = self._cached_metadata('driver', self.session.get_driver)
         return self._driver
 
     @property
@@ -196,21 +391,21 @@ class Collection(object):
         follows the order of fields in the data file.
         """
         if not self._schema and self.mode in ("a", "r") and self.session:
-            self._schema = self.session.get_schema()
+            self._schema = self._cached_metadata('schema', self.session.get_schema)
         return self._schema
 
     @property
     def crs(self):
         """Returns a Proj4 string."""
         if self._crs is None and self.session:
-            self._crs = self.session.get_crs()
+            self._crs = self._cached_metadata('crs', self.session.get_crs)
         return self._crs
 
     @property
     def crs_wkt(self):
         """Returns a WKT string."""
         if self._crs_wkt is None and self.session:
-            self._crs_wkt = self.session.get_crs_wkt()
+            self._crs_wkt = self._cached_metadata('crs_wkt', self.session.get_crs_wkt)
         return self._crs_wkt
 
     @property
@@ -230,6 +425,22 @@ class Collection(object):
 
         Positional arguments ``stop`` or ``start, stop[, step]`` allows
         iteration to skip over items or stop at a specific item.
+
+        If ``prefetch`` is a positive number, a background thread reads
+        up to that many features ahead while records are decoded. While
+        it reads the layer, other methods of the collection that use the
+        layer, such as ``len()``, ``get()`` or indexing, raise IOError.
+        A new iterator over the collection closes this one, which then
+        raises IOError instead of continuing.
+
+        If ``with_bbox`` is True, records have a 'bbox' item, the
+        (minx, miny, maxx, maxy) envelope of their geometry computed by
+        OGR while decoding. Records with null or empty geometries have
+        none.
+
+        If ``precision`` is not negative, the coordinates of geometries
+        and bboxes are rounded to that many decimal places while they
+        are decoded.
         """
         if self.closed:
             raise ValueError("I/O operation on closed collection")
@@ -246,8 +457,13 @@ class Collection(object):
         mask = kwds.get('mask')
         if bbox and mask:
             raise ValueError("mask and bbox can not be set together")
+        self._close_arrow_reader()
+        self._close_iterator()
         self.iterator = Iterator(
-            self, start, stop, step, bbox, mask)
+            self, start, stop, step, bbox, mask,
+            prefetch=kwds.get('prefetch', 0),
+            with_bbox=kwds.get('with_bbox', False),
+            precision=kwds.get('precision', -1))
         return self.iterator
 
     def items(self, *args, **kwds):
@@ -258,6 +474,10 @@ class Collection(object):
 
         Positional arguments ``stop`` or ``start, stop[, step]`` allows
         iteration to skip over items or stop at a specific item.
+
+        ``prefetch`` reads features ahead in a background thread,
+        ``with_bbox`` adds the envelopes of geometries to records and
+        ``precision`` rounds their coordinates as with ``filter()``.
         """
         if self.closed:
             raise ValueError("I/O operation on closed collection")
@@ -274,8 +494,13 @@ class Collection(object):
         mask = kwds.get('mask')
         if bbox and mask:
             raise ValueError("mask and bbox can not be set together")
+        self._close_arrow_reader()
+        self._close_iterator()
         self.iterator = ItemsIterator(
-            self, start, stop, step, bbox, mask)
+            self, start, stop, step, bbox, mask,
+            prefetch=kwds.get('prefetch', 0),
+            with_bbox=kwds.get('with_bbox', False),
+            precision=kwds.get('precision', -1))
         return self.iterator
 
     def keys(self, *args, **kwds):
@@ -302,11 +527,175 @@ class Collection(object):
         mask = kwds.get('mask')
         if bbox and mask:
             raise ValueError("mask and bbox can not be set together")
+        self._close_arrow_reader()
+        self._close_iterator()
         self.iterator = KeysIterator(
             self, start, stop, step, bbox, mask)
         return self.iterator
 
+    def read_batches(self, batch_size=DEFAULT_BATCH_SIZE, **kwds):
+        """Returns an iterator over batches of records in columnar form,
+        optionally filtered by a test for spatial intersection with the
+        provided ``bbox``, a (minx, miny, maxx, maxy) tuple or a geometry
+        ``mask``.
+
+        Each batch is a dict of at most ``batch_size`` records with an
+        "fid" array, a "geometry" array of WKB bytes (WKT text or shapely
+        geometries if the collection's ``geometry_format`` is 'wkt' or
+        'shapely'), and a "properties" mapping of field names to NumPy
+        arrays. Integer, float and bool fields are masked arrays in
+        which null values are masked. No GeoJSON-like records are
+        constructed. Requires NumPy.
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed collection")
+        elif self.mode != 'r':
+            raise IOError("collection not open for reading")
+        bbox = kwds.get('bbox')
+        mask = kwds.get('mask')
+        if bbox and mask:
+            raise ValueError("mask and bbox can not be set together")
+        self._close_arrow_reader()
+        self._close_iterator()
+        self.iterator = BatchIterator(
+            self, None, None, None, bbox, mask, batch_size=batch_size)
+        return self.iterator
+
+    def iter_arrow_batches(self, batch_size=DEFAULT_BATCH_SIZE, **kwds):
+        """Returns an iterator over pyarrow RecordBatches of records,
+        optionally filtered by a test for spatial intersection with the
+        provided ``bbox``, a (minx, miny, maxx, maxy) tuple or a geometry
+        ``mask``.
+
+        Batches are read through OGR's Arrow stream interface and have
+        WKB encoded geometry columns. Requires GDAL 3.6 and pyarrow.
+        """
+        return iter(self._open_arrow_reader(batch_size, **kwds))
+
+    def to_arrow(self, batch_size=DEFAULT_BATCH_SIZE, **kwds):
+        """Returns a pyarrow Table of records, optionally filtered by a
+        test for spatial intersection with the provided ``bbox``, a
+        (minx, miny, maxx, maxy) tuple or a geometry ``mask``.
+
+        Requires GDAL 3.6 and pyarrow.
+        """
+        reader = self._open_arrow_reader(batch_size, **kwds)
+        try:
+            return reader.read_all()
+        finally:
+            self._close_arrow_reader()
+
+    def _open_arrow_reader(self, batch_size, **kwds):
+        if self.closed:
+            raise ValueError("I/O operation on closed collection")
+        elif self.mode != 'r':
+            raise IOError("collection not open for reading")
+        bbox = kwds.get('bbox')
+        mask = kwds.get('mask')
+        if bbox and mask:
+            raise ValueError("mask and bbox can not be set together")
+        self._close_arrow_reader()
+        self._close_iterator()
+        self._arrow_reader = self.session.get_arrow_reader(
+            batch_size=batch_size, bbox=bbox, mask=mask)
+        return self._arrow_reader
+
+    def partitions(self, n, by='index', bbox=None, mask=None):
+        """Splits the layer into partitions that can be read in parallel
+
+        Partitions are picklable descriptors of parts of the layer,
+        which are opened independently, for example in worker processes.
+        See fiona.parallel.
+
+        Parameters
+        ----------
+        n : int
+            Number of partitions
+        by : str
+            'index' splits the features, optionally filtered by a
+            ``bbox`` or a ``mask``, into n ranges of indexes. 'bbox'
+            splits the extent of the layer into n tiles, which requires
+            a spatial index and GeoJSON-like geometries in the layer's
+            CRS. A feature is in the tile of its first vertex. The tiles
+            along the edges of the extent are unbounded on those edges.
+            Features without geometry are not in any tile.
+        bbox : tuple, optional
+            A (minx, miny, maxx, maxy) spatial filter
+        mask : dict, optional
+            A GeoJSON-like geometry spatial filter
+
+        Returns
+        -------
+        list of Partition
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed collection")
+        elif self.mode != 'r':
+            raise IOError("collection not open for reading")
+        if not isinstance(n, integer_types) or n < 1:
+            raise ValueError("invalid number of partitions: %r" % n)
+        if bbox and mask:
+            raise ValueError("mask and bbox can not be set together")
+
+        options = {'encoding': self.encoding,
+                   'enabled_drivers': self.enabled_drivers,
+                   'ignore_fields': self.ignore_fields,
+                   'ignore_geometry': self.ignore_geometry,
+                   'geometry_format': self.geometry_format,
+                   'dst_crs': self.dst_crs}
+        options = dict((k, v) for k, v in options.items() if v is not None)
+
+        self._close_arrow_reader()
+        self._close_iterator()
+
+        if by == 'index':
+            count = self.session.get_feature_count(bbox, mask)
+            return [
+                Partition(self.path, self.name, i, start, stop,
+                          bbox=bbox, mask=mask, options=options)
+                for i, (start, stop) in enumerate(index_partitions(n, count))]
+
+        elif by == 'bbox':
+            if bbox or mask:
+                raise ValueError("tiles of the layer can not be filtered")
+            if self.ignore_geometry or self.geometry_format not in ('geojson', 'numpy'):
+                raise ValueError("tiles require GeoJSON-like geometries")
+            if self.dst_crs is not None:
+                raise ValueError("tiles can not be read in a dst_crs")
+            if not self.session.has_spatial_index():
+                raise ValueError("tiles require a spatial index")
+            return [
+                Partition(self.path, self.name, i, tile=tile, options=options)
+                for i, tile in enumerate(tile_partitions(n, self.bounds))]
+
+        else:
+            raise ValueError("invalid partitioning: %r" % by)
+
+    def _close_arrow_reader(self):
+        """Release an Arrow stream before the layer is used otherwise"""
+        if self._arrow_reader is not None:
+            self._arrow_reader.close()
+            self._arrow_reader = None
+
+    def _close_iterator(self):
+        """Stop the prefetching of an iterator before the layer is used
+        otherwise"""
+        if self.iterator is not None:
+            self.iterator.close()
+
+    def _release_layer(self):
+        """Prepare the layer to be used by a method of the collection
+
+        Raises IOError while a prefetching iterator reads the layer.
+        Closes an open Arrow stream, which GDAL does not allow the layer
+        to be read otherwise alongside.
+        """
+        if self.iterator is not None and self.iterator.is_prefetching():
+            raise IOError("layer is in use by a prefetching iterator")
+        self._close_arrow_reader()
+
     def __contains__(self, fid):
+        self._release_layer()
         return self.session.has_feature(fid)
 
     values = filter
@@ -327,28 +716,89 @@ class Collection(object):
     next = __next__
 
     def __getitem__(self, item):
+        self._release_layer()
         return self.session.__getitem__(item)
 
     def get(self, item):
+        self._release_layer()
         return self.session.get(item)
 
     def writerecords(self, records):
-        """Stages multiple records for writing to disk."""
+        """Stages multiple records for writing to disk.
+
+        The geometry of a record may be a GeoJSON-like mapping, WKB
+        bytes, or an object with a ``wkb`` attribute or a
+        ``__geo_interface__`` such as a shapely geometry. WKB is
+        converted to OGR geometries without building mappings.
+        """
         if self.closed:
             raise ValueError("I/O operation on closed collection")
         if self.mode not in ('a', 'w'):
             raise IOError("collection not open for writing")
+        self._flush_write_buffer()
         self.session.writerecs(records, self)
-        self._len = self.session.get_length()
-        self._bounds = self.session.get_extent()
+        self._invalidate_length_and_bounds()
+
+    def write_columns(self, columns, geometry=None):
+        """Writes records given as columns of values.
+
+        ``columns`` maps field names to NumPy arrays or sequences of
+        values of the same length. Null values of integer, bool and
+        float fields are masked values of masked arrays. ``geometry``
+        is a sequence of WKB geometries of the same length, or of any
+        other geometries accepted by writerecords. Null geometries are
+        None. If ``geometry`` is None, all geometries are null.
+
+        No GeoJSON-like records are constructed: the rows are written in
+        a single loop over the columns, within the same transactions as
+        writerecords. Returns the number of records written.
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed collection")
+        if self.mode not in ('a', 'w'):
+            raise IOError("collection not open for writing")
+        self._flush_write_buffer()
+        count = self.session.writecols(columns, geometry, self)
+        self._invalidate_length_and_bounds()
+        return count
 
     def write(self, record):
         """Stages a record for writing to disk.
         
-        Note: Each call of this method will start and commit a
-        unique transaction with the data source.
+        Note: Unless the collection is buffered, each call of this
+        method will start and commit a unique transaction with the data
+        source.
         """
-        self.writerecords([record])
+        if self._write_buffer is None:
+            self.writerecords([record])
+            return
+        if self.closed:
+            raise ValueError("I/O operation on closed collection")
+        if self.mode not in ('a', 'w'):
+            raise IOError("collection not open for writing")
+        if self._write_buffer.append(record):
+            self._flush_write_buffer()
+
+    def _flush_write_buffer(self):
+        """Writes the queued records of a buffered collection
+
+        The records stay queued if writing them raises an exception.
+        """
+        if self._write_buffer and self.session is not None:
+            log.debug("Writing %d buffered records", len(self._write_buffer))
+            self.session.writerecs(self._write_buffer.records, self)
+            self._write_buffer.take()
+            self._invalidate_length_and_bounds()
+
+    def _invalidate_length_and_bounds(self):
+        """Marks the length and bounds as stale after a write
+
+        They are queried again from the session when next accessed.
+        Writing sessions count the written features and extend the
+        extent by their envelopes, so this does not scan the layer.
+        """
+        self._len = 0
+        self._bounds = None
 
     def validate_record(self, record):
         """Compares the record to the collection's schema.
@@ -367,23 +817,27 @@ class Collection(object):
 
         Returns ``True`` if the record matches, else ``False``.
         """
+        geometry_type = _geometry_type_name(
+            _normalize_geometry(record['geometry']))
         # Shapefiles welcome mixes of line/multis and polygon/multis.
         # OGR reports these mixed files as type "Polygon" or "LineString"
         # but will return either these or their multi counterparts when
         # reading features.
         if (self.driver == "ESRI Shapefile" and
-                "Point" not in record['geometry']['type']):
-            return record['geometry']['type'].lstrip(
+                "Point" not in geometry_type):
+            return geometry_type.lstrip(
                 "Multi") == self.schema['geometry'].lstrip("3D ").lstrip(
                     "Multi")
         else:
             return (
-                record['geometry']['type'] ==
+                geometry_type ==
                 self.schema['geometry'].lstrip("3D "))
 
     def __len__(self):
+        self._flush_write_buffer()
         if self._len <= 0 and self.session is not None:
-            self._len = self.session.get_length()
+            self._len = self._cached_metadata(
+                'count', self.session.get_length, uses_layer=True)
         if self._len < 0:
             # Raise TypeError when we don't know the length so that Python
             # will treat Collection as a generator
@@ -393,10 +847,64 @@ class Collection(object):
     @property
     def bounds(self):
         """Returns (minx, miny, maxx, maxy)."""
+        self._flush_write_buffer()
         if self._bounds is None and self.session is not None:
-            self._bounds = self.session.get_extent()
+            self._bounds = tuple(self._cached_metadata(
+                'bounds', self.session.get_extent, uses_layer=True))
         return self._bounds
 
+    def get_bounds(self, approx=False):
+        """Returns (minx, miny, maxx, maxy).
+
+        If ``approx`` is True, the layer is not scanned. The bounds are
+        those already known to the collection, those of its metadata
+        cache, or those the driver has at hand, for example in a file
+        header or a spatial index, which may be larger than the exact
+        bounds. If none are available, None is returned.
+        """
+        if not approx:
+            return self.bounds
+        self._flush_write_buffer()
+        if self._bounds is not None or self.session is None:
+            return self._bounds
+        if self.metadata_cache is not None and self.dst_crs is None:
+            bounds = self.metadata_cache.get(
+                self.path, self._metadata_layer).get('bounds')
+            if bounds is not None:
+                self._bounds = tuple(bounds)
+                return self._bounds
+        self._release_layer()
+        return self.session.get_extent(approx=True)
+
+    def _cached_metadata(self, item, compute, uses_layer=False):
+        """Gets an item of the layer's metadata from the metadata
+        cache, or computes it and adds it to the cache
+
+        Items that depend on how the collection was opened or is
+        filtered are not those of the layer and are not cached: the CRS
+        and bounds of a collection read in a destination CRS, the schema
+        of a collection with ignored fields or geometry, and the count
+        and bounds while a spatial filter is set.
+
+        If ``uses_layer`` is True, computing the item reads the layer,
+        which is released first.
+        """
+        cache = self.metadata_cache
+        cacheable = cache is not None and not (
+            (self.dst_crs is not None and item in ('crs', 'crs_wkt', 'bounds')) or
+            (item == 'schema' and (self.ignore_fields or self.ignore_geometry)) or
+            (item in ('count', 'bounds') and self.session.has_spatial_filter()))
+        if cacheable:
+            metadata = cache.get(self.path, self._metadata_layer)
+            if item in metadata:
+                return metadata[item]
+        if uses_layer:
+            self._release_layer()
+        value = compute()
+        if cacheable:
+            cache.update(self.path, self._metadata_layer, **{item: value})
+        return value
+
     def _check_schema_driver_support(self):
         """Check support for the schema against the driver
 
@@ -429,18 +937,23 @@ class Collection(object):
     def flush(self):
         """Flush the buffer."""
         if self.session is not None:
+            self._flush_write_buffer()
             self.session.sync(self)
-            new_len = self.session.get_length()
-            self._len = new_len > self._len and new_len or self._len
-            self._bounds = self.session.get_extent()
+            self._invalidate_length_and_bounds()
 
     def close(self):
         """In append or write mode, flushes data to disk, then ends
         access."""
-        if self.session is not None and self.session.isactive():
+        self._reopen_spec = None
+        _open_collections.discard(self)
+        if self._session is not None and self._session.isactive():
             if self.mode in ('a', 'w'):
                 self.flush()
+                if self.bulk_load:
+                    self.bulk_load_timings = self.session.end_bulk_load()
             log.debug("Flushed buffer")
+            self._close_arrow_reader()
+            self._close_iterator()
             self.session.stop()
             log.debug("Stopped session")
             self.session = None
@@ -471,6 +984,110 @@ class Collection(object):
         self.close()
 
 
+def _unpickle_collection(cls, spec):
+    """Makes a collection that is opened from spec when first used"""
+    collection = cls.__new__(cls)
+    collection.path = spec['path']
+    collection.name = spec['layer']
+    collection.mode = 'r'
+    collection._arrow_reader = None
+    collection._write_buffer = None
+    collection._reopen_spec = spec
+    return collection
+
+
+def _after_fork_in_child():
+    """Detaches the datasets of collections inherited by a forked
+    child process"""
+    for collection in list(_open_collections):
+        collection._after_fork()
+    _open_collections.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+class WriteBuffer(object):
+    """A queue of records to be written in one transaction
+
+    The buffer is full when it holds ``size`` records, an estimated
+    ``nbytes`` bytes, or when its first record was queued more than
+    ``interval`` seconds ago. Thresholds that are None are not checked.
+    Sizes of records are estimated from the lengths of their string and
+    bytes values and WKB geometries and the number of coordinates of
+    their other geometries.
+    """
+
+    def __init__(self, size=None, nbytes=None, interval=None):
+        for name, value in (('size', size), ('nbytes', nbytes), ('interval', interval)):
+            if value is not None and value <= 0:
+                raise ValueError("buffer %s must be positive: %r" % (name, value))
+        self.size = size
+        self.nbytes = nbytes
+        self.interval = interval
+        self.records = []
+        self.bytes = 0
+        self.started = None
+
+    def __len__(self):
+        return len(self.records)
+
+    def append(self, record):
+        """Queues a record, returns True if the buffer is then full"""
+        if not self.records:
+            self.started = time.monotonic()
+        self.records.append(record)
+        if self.nbytes is not None:
+            self.bytes += _record_size(record)
+        return (
+            (self.size is not None and len(self.records) >= self.size) or
+            (self.nbytes is not None and self.bytes >= self.nbytes) or
+            (self.interval is not None and
+             time.monotonic() - self.started >= self.interval))
+
+    def take(self):
+        """Empties the buffer, returns its records"""
+        records = self.records
+        self.records = []
+        self.bytes = 0
+        self.started = None
+        return records
+
+
+def _value_size(value):
+    """Estimated size in bytes of a property value"""
+    if isinstance(value, (string_types, binary_type)):
+        return len(value)
+    return 8
+
+
+def _coordinates_size(coordinates):
+    """Estimated size in bytes of a coordinates sequence"""
+    if hasattr(coordinates, 'nbytes'):
+        return coordinates.nbytes
+    if not coordinates:
+        return 0
+    if isinstance(coordinates[0], (int, float)):
+        return 8 * len(coordinates)
+    return sum(_coordinates_size(part) for part in coordinates)
+
+
+def _record_size(record):
+    """Estimated size in bytes of a record"""
+    size = sum(_value_size(value) for value in record['properties'].values())
+    geometry = _normalize_geometry(record.get('geometry'))
+    if isinstance(geometry, binary_type):
+        size += len(geometry)
+    elif geometry is not None:
+        if 'geometries' in geometry:
+            size += sum(_coordinates_size(g.get('coordinates'))
+                        for g in geometry['geometries'])
+        else:
+            size += _coordinates_size(geometry.get('coordinates'))
+    return size
+
+
 ALL_GEOMETRY_TYPES = set([
     geom_type for geom_type in GEOMETRY_TYPES.values()
     if "3D " not in geom_type and geom_type != "None"])
@@ -72,8 +72,14 @@ def cat(ctx, files, precision, indent, compact, ignore_errors, dst_crs,
         for i, path in enumerate(files, 1):
             for lyr in layer[str(i)]:
                 with fiona.open(path, layer=lyr) as src:
-                    for i, feat in src.items(bbox=bbox):
-                        if dst_crs or precision >= 0:
+                    # Without reprojection, coordinates are rounded as
+                    # features are read. Otherwise they are rounded after
+                    # they are transformed.
+                    items = src.items(
+                        bbox=bbox, precision=precision if not dst_crs else -1,
+                        with_bbox=not dst_crs and precision >= 0)
+                    for i, feat in items:
+                        if dst_crs:
                             g = transform_geom(
                                 src.crs, dst_crs, feat['geometry'],
                                 antimeridian_cutting=True,
@@ -94,7 +94,7 @@ def dump(ctx, input, encoding, precision, indent, compact, record_buffered,
                 # Try the first record.
                 try:
                     i, first = 0, next(itr)
-                    first = transformer(first)
+                    first = transformer(source.crs, first)
                     if with_ld_context:
                         first = helpers.id_record(first)
                     if indented:
@@ -127,7 +127,7 @@ def dump(ctx, input, encoding, precision, indent, compact, record_buffered,
                 # we'll write the item separator before each of the
                 # remaining features.
                 for i, rec in enumerate(itr, 1):
-                    rec = transformer(rec)
+                    rec = transformer(source.crs, rec)
                     try:
                         if with_ld_context:
                             rec = helpers.id_record(rec)
@@ -169,7 +169,7 @@ def dump(ctx, input, encoding, precision, indent, compact, record_buffered,
                     collection['@context'] = helpers.make_ld_context(
                         add_ld_context_item)
                     collection['features'] = [
-                        helpers.id_record(transformer(rec))
+                        helpers.id_record(transformer(source.crs, rec))
                         for rec in source]
                 else:
                     collection['features'] = [
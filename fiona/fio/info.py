@@ -10,6 +10,7 @@ from cligj import indent_opt
 import fiona
 import fiona.crs
 from fiona.fio import options, with_context_env
+from fiona.metacache import MetadataCache
 
 
 @click.command()
@@ -33,9 +34,13 @@ from fiona.fio import options, with_context_env
                    "(left, bottom, right, top).")
 @click.option('--name', 'meta_member', flag_value='name',
               help="Print the datasource's name.")
+@click.option('--metadata-cache', type=click.Path(dir_okay=False),
+              help="Cache the information in a SQLite file. It is reused "
+                   "while the dataset's file has the same size and "
+                   "modification time.")
 @click.pass_context
 @with_context_env
-def info(ctx, input, indent, meta_member, layer):
+def info(ctx, input, indent, meta_member, layer, metadata_cache):
     """
     Print information about a dataset.
 
@@ -45,26 +50,31 @@ def info(ctx, input, indent, meta_member, layer):
 
     logger = logging.getLogger(__name__)
     try:
-        with fiona.open(input, layer=layer) as src:
-            info = src.meta
-            info.update(bounds=src.bounds, name=src.name)
-            try:
-                info.update(count=len(src))
-            except TypeError:
-                info.update(count=None)
-                logger.debug("Setting 'count' to None/null - layer does "
-                             "not support counting")
-            proj4 = fiona.crs.to_string(src.crs)
-            if proj4.startswith('+init=epsg'):
-                proj4 = proj4.split('=')[1].upper()
-            info['crs'] = proj4
-            if meta_member:
-                if isinstance(info[meta_member], (list, tuple)):
-                    click.echo(" ".join(map(str, info[meta_member])))
-                else:
-                    click.echo(info[meta_member])
+        cache = MetadataCache(metadata_cache) if metadata_cache else None
+        info = cache.get(input, layer).get('info') if cache else None
+        if info is None:
+            with fiona.open(input, layer=layer, metadata_cache=cache) as src:
+                info = src.meta
+                info.update(bounds=src.bounds, name=src.name)
+                try:
+                    info.update(count=len(src))
+                except TypeError:
+                    info.update(count=None)
+                    logger.debug("Setting 'count' to None/null - layer does "
+                                 "not support counting")
+                proj4 = fiona.crs.to_string(src.crs)
+                if proj4.startswith('+init=epsg'):
+                    proj4 = proj4.split('=')[1].upper()
+                info['crs'] = proj4
+            if cache:
+                cache.update(input, layer, info=info)
+        if meta_member:
+            if isinstance(info[meta_member], (list, tuple)):
+                click.echo(" ".join(map(str, info[meta_member])))
             else:
-                click.echo(json.dumps(info, indent=indent))
+                click.echo(info[meta_member])
+        else:
+            click.echo(json.dumps(info, indent=indent))
 
     except Exception:
         logger.exception("Exception caught during processing")
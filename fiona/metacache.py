@@ -0,0 +1,146 @@
+"""A cache of layer metadata keyed by file identity
+
+The schema, CRS, driver, feature count and extent of a layer are
+computed by OGR every time a collection is opened, which for some
+formats means a scan of the whole layer. A MetadataCache keeps them,
+in memory or in a SQLite file, for as long as the layer's file keeps
+the same size and modification time:
+
+  >>> from fiona.metacache import MetadataCache
+  >>> cache = MetadataCache('metadata.sqlite')
+  >>> with fiona.open('tests/data/coutwildrnp.shp', metadata_cache=cache) as src:
+  ...     print(src.bounds)
+
+Only layers of local files are cached.
+"""
+
+from collections import OrderedDict
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+
+log = logging.getLogger(__name__)
+
+
+class MetadataCache(object):
+    """A cache of layer metadata
+
+    Metadata are mappings of items such as 'schema', 'crs', 'crs_wkt',
+    'driver', 'count' and 'bounds' to JSON serializable values. They
+    are keyed by the absolute path of a file and the name or index of a
+    layer, and are valid while the file's size and modification time
+    are unchanged.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of a SQLite file in which metadata are persisted. By
+        default, metadata are kept in memory.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups of valid metadata
+    misses : int
+        Number of lookups of missing or stale metadata
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path or ':memory:', check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "path TEXT, layer TEXT, size INTEGER, mtime INTEGER, data TEXT, "
+                "PRIMARY KEY (path, layer))")
+
+    def __repr__(self):
+        return "<MetadataCache %r hits=%d misses=%d>" % (
+            self.path or ':memory:', self.hits, self.misses)
+
+    def close(self):
+        """Closes the cache's SQLite connection"""
+        self._conn.close()
+
+    def key(self, path, layer=None):
+        """Gets the key and identity of a layer's file
+
+        Parameters
+        ----------
+        path : str
+            Path of the dataset
+        layer : str or int, optional
+            Name or index of the layer, by default the first
+
+        Returns
+        -------
+        tuple
+            The (path, layer) key and the (size, mtime) identity of the
+            file, or None if the path is not that of a local file
+        """
+        try:
+            stat = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        layer = json.dumps(0 if layer is None else layer)
+        return (os.path.abspath(path), layer), (stat.st_size, stat.st_mtime_ns)
+
+    def get(self, path, layer=None):
+        """Gets the metadata of a layer
+
+        Returns
+        -------
+        dict
+            The metadata, empty if they are missing, stale, or if the
+            path is not that of a local file
+        """
+        key = self.key(path, layer)
+        if key is None:
+            return {}
+        (path, layer), identity = key
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime, data FROM metadata WHERE path = ? AND layer = ?",
+                (path, layer)).fetchone()
+            if row is None or tuple(row[:2]) != identity:
+                if row is not None:
+                    log.debug("Metadata of %s are stale", path)
+                self.misses += 1
+                return {}
+            self.hits += 1
+        return json.loads(row[2], object_pairs_hook=OrderedDict)
+
+    def update(self, path, layer=None, **items):
+        """Adds items to the metadata of a layer
+
+        Stale metadata are replaced. Nothing is stored if the path is
+        not that of a local file.
+        """
+        key = self.key(path, layer)
+        if key is None:
+            return
+        (path, layer), identity = key
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime, data FROM metadata WHERE path = ? AND layer = ?",
+                (path, layer)).fetchone()
+            metadata = OrderedDict()
+            if row is not None and tuple(row[:2]) == identity:
+                metadata = json.loads(row[2], object_pairs_hook=OrderedDict)
+            metadata.update(items)
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?)",
+                    (path, layer, identity[0], identity[1], json.dumps(metadata)))
+
+    def clear(self):
+        """Removes all metadata"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM metadata")
@@ -3,14 +3,21 @@
 from __future__ import absolute_import
 
 import datetime
+import itertools
 import json
 import locale
 import logging
 import os
+import queue
+import sys
+import threading
 import warnings
 import math
+import time
 import uuid
-from collections import namedtuple, OrderedDict
+import weakref
+from collections import deque, namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from six import integer_types, string_types, text_type
 
@@ -18,18 +25,20 @@ from fiona._shim cimport *
 
 from fiona._geometry cimport (
     GeomBuilder, OGRGeomBuilder, geometry_type_code,
-    normalize_geometry_type_code, base_geometry_type_code)
+    normalize_geometry_type_code, base_geometry_type_code,
+    _createOgrGeomFromWKB, round_coordinates, round_ogr_geometry)
 from fiona._err cimport exc_wrap_int, exc_wrap_pointer, exc_wrap_vsilfile
+from fiona._transform cimport Transformer
 
 import fiona
 from fiona._env import GDALVersion, get_gdal_version_num
 from fiona._err import cpl_errs, FionaNullPointerError, CPLE_BaseError, CPLE_OpenFailedError
-from fiona._geometry import GEOMETRY_TYPES
+from fiona._geometry import GEOMETRY_TYPES, geometry_bounds, wkb_geometry_type
 from fiona import compat
 from fiona.errors import (
     DriverError, DriverIOError, SchemaError, CRSError, FionaValueError,
     TransactionError, GeometryTypeValidationError, DatasetDeleteError,
-    FionaDeprecationWarning)
+    DriverSupportError, FionaDeprecationWarning)
 from fiona.compat import strencode
 from fiona.rfc3339 import parse_date, parse_datetime, parse_time
 from fiona.rfc3339 import FionaDateType, FionaDateTimeType, FionaTimeType
@@ -38,7 +47,8 @@ from fiona.path import vsi_path
 
 from fiona._shim cimport is_field_null, osr_get_name, osr_set_traditional_axis_mapping_strategy
 
-from libc.stdlib cimport malloc, free
+from libc.stdint cimport uintptr_t
+from libc.stdlib cimport malloc, calloc, free
 from libc.string cimport strcmp
 from cpython cimport PyBytes_FromStringAndSize, PyBytes_AsString
 
@@ -54,9 +64,40 @@ cdef extern from "ogr_api.h" nogil:
     ctypedef void * OGRGeometryH
 
 
+# The Arrow C stream interface. See
+# https://arrow.apache.org/docs/format/CStreamInterface.html.
+cdef struct ArrowArrayStream:
+    void *get_schema
+    void *get_next
+    void *get_last_error
+    void (*release)(ArrowArrayStream *stream)
+    void *private_data
+
+
 log = logging.getLogger(__name__)
 
 DEFAULT_TRANSACTION_SIZE = 20000
+DEFAULT_BATCH_SIZE = 10000
+
+# Number of records converted to OGR features by a worker thread at a
+# time when writing with write_workers, and number of converted chunks
+# queued per worker for the writing thread.
+WRITE_CHUNK_SIZE = 1000
+WRITE_QUEUE_CHUNKS_PER_WORKER = 2
+
+# Seconds between checks of a prefetching thread for the closing of its
+# iterator while its queue is full.
+PREFETCH_POLL_INTERVAL = 0.1
+
+# Drivers supporting bulk loads and the SQLite settings relaxed during
+# them.
+BULK_LOAD_DRIVERS = ('GPKG', 'SQLite')
+BULK_LOAD_PRAGMAS = (('journal_mode', 'MEMORY'), ('synchronous', 'OFF'))
+
+# Modes of validation of written records against a collection's schema
+# and the interval between validated records in 'sample' mode.
+VALIDATION_MODES = ('full', 'sample', 'none')
+VALIDATION_SAMPLE_INTERVAL = 1000
 
 # OGR Driver capability
 cdef const char * ODrCCreateDataSource = "CreateDataSource"
@@ -107,36 +148,286 @@ def _explode(coords):
 
 def _bounds(geometry):
     """Bounding box of a GeoJSON geometry"""
-    try:
-        xyz = tuple(zip(*list(_explode(geometry['coordinates']))))
-        return min(xyz[0]), min(xyz[1]), max(xyz[0]), max(xyz[1])
-    except (KeyError, TypeError):
-        return None
+    return geometry_bounds(geometry)
 
 
 cdef int GDAL_VERSION_NUM = get_gdal_version_num()
 
 
+def _import_numpy():
+    """Import NumPy, which is required by the columnar API"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required for columnar access to features")
+    return numpy
+
+
+def _import_shapely():
+    """Import shapely, which is required by the 'shapely' geometry format"""
+    try:
+        import shapely.wkb
+    except ImportError:
+        raise ImportError("Shapely is required for the 'shapely' geometry format")
+    return shapely
+
+
+def _shapely_from_wkb(geometries):
+    """Convert an object array of WKB bytes to shapely geometries
+
+    Shapely 2.0's vectorized from_wkb is used when available. Null
+    geometries remain None.
+    """
+    shapely = _import_shapely()
+    if hasattr(shapely, 'from_wkb'):
+        return shapely.from_wkb(geometries)
+    np = _import_numpy()
+    result = np.empty(len(geometries), dtype=object)
+    result[:] = [None if wkb is None else shapely.wkb.loads(wkb) for wkb in geometries]
+    return result
+
+
+# Names of the formats in which features' geometries may be returned.
+GEOMETRY_FORMATS = ('geojson', 'wkb', 'wkt', 'shapely', 'numpy')
+
+cdef enum GeometryFormat:
+    GEOMETRY_FORMAT_GEOJSON
+    GEOMETRY_FORMAT_WKB
+    GEOMETRY_FORMAT_WKT
+    GEOMETRY_FORMAT_SHAPELY
+    GEOMETRY_FORMAT_NUMPY
+
+
+# Kinds of field values. Codes up to FIELD_KIND_BOOL are stored in
+# typed buffers by BatchIterator, the others are Python objects.
+cdef enum FieldKind:
+    FIELD_KIND_INT32
+    FIELD_KIND_INT64
+    FIELD_KIND_FLOAT
+    FIELD_KIND_BOOL
+    FIELD_KIND_STR
+    FIELD_KIND_BYTES
+    FIELD_KIND_DATE
+    FIELD_KIND_TIME
+    FIELD_KIND_DATETIME
+
+
+# Kinds of the columns written by WritingSession.writecols. Integer and
+# float columns are written from typed buffers.
+cdef enum ColumnKind:
+    COLUMN_KIND_INT
+    COLUMN_KIND_FLOAT
+    COLUMN_KIND_OBJECT
+
+
+# Kinds of the fields of written records by normalized schema type.
+WRITE_FIELD_KINDS = {
+    'int32': FIELD_KIND_INT32,
+    'int64': FIELD_KIND_INT64,
+    'float': FIELD_KIND_FLOAT,
+    'bool': FIELD_KIND_BOOL,
+    'str': FIELD_KIND_STR,
+    'bytes': FIELD_KIND_BYTES,
+    'date': FIELD_KIND_DATE,
+    'time': FIELD_KIND_TIME,
+    'datetime': FIELD_KIND_DATETIME,
+}
+
+
+cdef int get_field_kind(void *fdefn):
+    """Classify an OGR field definition, returns -1 if unsupported"""
+    fieldtypename = FIELD_TYPES[OGR_Fld_GetType(fdefn)]
+    if not fieldtypename:
+        return -1
+    elif fieldtypename in ('int32', 'int64') and get_field_subtype(fdefn) == OFSTBoolean:
+        return FIELD_KIND_BOOL
+    elif fieldtypename == 'int32':
+        return FIELD_KIND_INT32
+    elif fieldtypename == 'int64':
+        return FIELD_KIND_INT64
+    elif fieldtypename == 'float':
+        return FIELD_KIND_FLOAT
+    elif fieldtypename == 'str':
+        return FIELD_KIND_STR
+    elif fieldtypename == 'bytes':
+        return FIELD_KIND_BYTES
+    elif fieldtypename == 'date':
+        return FIELD_KIND_DATE
+    elif fieldtypename == 'time':
+        return FIELD_KIND_TIME
+    else:
+        return FIELD_KIND_DATETIME
+
+
+cdef object get_field_value(void *feature, int i, int kind, object encoding, object driver):
+    """Get the value of a non-null field of an OGR feature
+
+    Parameters
+    ----------
+    feature : void *
+        An OGR feature handle
+    i : int
+        Index of the field
+    kind : int
+        One of the FieldKind codes
+    encoding : str
+        The encoding of OGR feature attributes
+    driver : str
+        OGR format driver name like 'GeoJSON'
+
+    Returns
+    -------
+    object
+    """
+    cdef int y = 0
+    cdef int m = 0
+    cdef int d = 0
+    cdef int hh = 0
+    cdef int mm = 0
+    cdef int ss = 0
+    cdef int tz = 0
+    cdef unsigned char *data = NULL
+    cdef int l
+
+    if kind == FIELD_KIND_INT32:
+        return OGR_F_GetFieldAsInteger(feature, i)
+
+    elif kind == FIELD_KIND_INT64:
+        return OGR_F_GetFieldAsInteger64(feature, i)
+
+    elif kind == FIELD_KIND_BOOL:
+        return bool(OGR_F_GetFieldAsInteger64(feature, i))
+
+    elif kind == FIELD_KIND_FLOAT:
+        return OGR_F_GetFieldAsDouble(feature, i)
+
+    elif kind == FIELD_KIND_STR:
+        val = OGR_F_GetFieldAsString(feature, i)
+        try:
+            val = val.decode(encoding)
+        except UnicodeDecodeError:
+            log.warning(
+                "Failed to decode %s using %s codec", val, encoding)
+
+        # Does the text contain a JSON object? Let's check.
+        # Let's check as cheaply as we can.
+        if driver == 'GeoJSON' and val.startswith('{'):
+            try:
+                val = json.loads(val)
+            except ValueError as err:
+                log.warning(str(err))
+
+        return val
+
+    elif kind == FIELD_KIND_BYTES:
+        data = OGR_F_GetFieldAsBinary(feature, i, &l)
+        return data[:l]
+
+    else:
+        OGR_F_GetFieldAsDateTime(
+            feature, i, &y, &m, &d, &hh, &mm, &ss, &tz)
+        try:
+            if kind == FIELD_KIND_DATE:
+                return datetime.date(y, m, d).isoformat()
+            elif kind == FIELD_KIND_TIME:
+                return datetime.time(hh, mm, ss).isoformat()
+            else:
+                return datetime.datetime(
+                    y, m, d, hh, mm, ss).isoformat()
+        except ValueError as err:
+            log.exception(err)
+            return None
+
+
+cdef object ogr_geometry_wkb(void *cogr_geometry):
+    """Export an OGR geometry to little endian WKB"""
+    cdef int size = OGR_G_WkbSize(cogr_geometry)
+    wkb = PyBytes_FromStringAndSize(NULL, size)
+    OGR_G_ExportToWkb(cogr_geometry, 1, PyBytes_AsString(wkb))
+    return wkb
+
+
+cdef object ogr_geometry_wkt(void *cogr_geometry):
+    """Export an OGR geometry to WKT"""
+    cdef char *wkt_c = NULL
+    if OGR_G_ExportToWkt(cogr_geometry, &wkt_c) != OGRERR_NONE:
+        CPLFree(wkt_c)
+        raise ValueError("Failed to export geometry to WKT")
+    try:
+        wkt_b = wkt_c
+        return wkt_b.decode('ascii')
+    finally:
+        CPLFree(wkt_c)
+
+
+cdef int transform_ogr_geometry(Transformer transformer, void *cogr_geometry) except -1:
+    """Transform an OGR geometry in place"""
+    if OGR_G_Transform(cogr_geometry, transformer.ct) != OGRERR_NONE:
+        raise ValueError("Failed to transform geometry")
+    return 0
+
+
+def _normalize_geometry(geometry):
+    """Returns a record's geometry as a GeoJSON-like mapping or WKB
+
+    Geometries of records may be GeoJSON-like mappings, WKB bytes, or
+    objects with a ``wkb`` attribute or a ``__geo_interface__``, such as
+    shapely geometries. WKB is preferred over the geo interface.
+    """
+    if geometry is None or isinstance(geometry, dict):
+        return geometry
+    elif isinstance(geometry, (bytes, bytearray)):
+        return bytes(geometry)
+    wkb = getattr(geometry, 'wkb', None)
+    if isinstance(wkb, bytes):
+        return wkb
+    geo_interface = getattr(geometry, '__geo_interface__', None)
+    if geo_interface is not None:
+        return geo_interface
+    return geometry
+
+
+def _geometry_type_name(geometry):
+    """Returns the GeoJSON type name of a normalized geometry"""
+    if isinstance(geometry, bytes):
+        return wkb_geometry_type(geometry)
+    return geometry['type']
+
+
 # Feature extension classes and functions follow.
 
 cdef class FeatureBuilder:
     """Build Fiona features from OGR feature pointers.
 
+    A builder is compiled once for a layer definition into a table of
+    field indexes, interned property keys, and value kinds and is then
+    reused for every feature of the layer.
+
     No OGR objects are allocated by this function and the feature
     argument is not destroyed.
     """
 
-    cdef build(self, void *feature, encoding='utf-8', bbox=False, driver=None, ignore_fields=None, ignore_geometry=False):
-        """Build a Fiona feature object from an OGR feature
-
+    cdef int nfields
+    cdef int *field_index
+    cdef int *field_kind
+    cdef list field_keys
+    cdef object encoding
+    cdef object driver
+    cdef object ignore_fields
+    cdef bint ignore_geometry
+    cdef int geometry_format
+    cdef object shapely_loads
+    cdef GeomBuilder geom_builder
+    cdef Transformer transformer
+
+    def __init__(self, encoding='utf-8', driver=None, ignore_fields=None,
+                 ignore_geometry=False, geometry_format='geojson',
+                 transformer=None):
+        """
         Parameters
         ----------
-        feature : void *
-            The OGR feature # TODO: use a real typedef
         encoding : str
             The encoding of OGR feature attributes
-        bbox : bool
-            Not used
         driver : str
             OGR format driver name like 'GeoJSON'
         ignore_fields : sequence
@@ -144,255 +435,429 @@ cdef class FeatureBuilder:
             in the Fiona feature properties
         ignore_geometry : bool
             Flag for whether the OGR geometry field is to be ignored
+        geometry_format : str
+            One of GEOMETRY_FORMATS: 'geojson' for GeoJSON-like mappings,
+            'wkb' for WKB bytes, 'wkt' for WKT text, 'shapely' for
+            shapely geometries, or 'numpy' for GeoJSON-like mappings
+            with NumPy array coordinate sequences
+        transformer : Transformer, optional
+            A transformer from the CRS of the layer to which geometries
+            are transformed before they are built
+        """
+        if geometry_format not in GEOMETRY_FORMATS:
+            raise ValueError("invalid geometry_format: %r" % geometry_format)
+        self.encoding = encoding
+        self.driver = driver
+        self.ignore_fields = set(ignore_fields or [])
+        self.ignore_geometry = ignore_geometry
+        self.geometry_format = GEOMETRY_FORMATS.index(geometry_format)
+        self.shapely_loads = None
+        if self.geometry_format == GEOMETRY_FORMAT_SHAPELY:
+            self.shapely_loads = _import_shapely().wkb.loads
+        self.geom_builder = GeomBuilder(
+            ndarray_coords=self.geometry_format == GEOMETRY_FORMAT_NUMPY)
+        self.transformer = transformer
+        self.field_keys = []
+
+    def __dealloc__(self):
+        free(self.field_index)
+        free(self.field_kind)
+
+    cdef int compile(self, void *cogr_featuredefn) except -1:
+        """Compile the builder's field table from a layer definition
+
+        Parameters
+        ----------
+        cogr_featuredefn : void *
+            The OGR feature definition of a layer
 
         Returns
         -------
-        dict
+        int
         """
-        cdef void *fdefn = NULL
-        cdef int i
-        cdef int y = 0
-        cdef int m = 0
-        cdef int d = 0
-        cdef int hh = 0
-        cdef int mm = 0
-        cdef int ss = 0
-        cdef int tz = 0
-        cdef unsigned char *data = NULL
-        cdef int l
-        cdef int retval
-        cdef int fieldsubtype
+        cdef void *cogr_fielddefn = NULL
         cdef const char *key_c = NULL
+        cdef int i
+        cdef int n
+        cdef int kind
 
-        # Skeleton of the feature to be returned.
-        fid = OGR_F_GetFID(feature)
-        props = OrderedDict()
-        fiona_feature = {
-            "type": "Feature",
-            "id": str(fid),
-            "properties": props,
-        }
-
-        ignore_fields = set(ignore_fields or [])
+        if cogr_featuredefn == NULL:
+            raise ValueError("Null feature definition")
 
-        # Iterate over the fields of the OGR feature.
-        for i in range(OGR_F_GetFieldCount(feature)):
-            fdefn = OGR_F_GetFieldDefnRef(feature, i)
-            if fdefn == NULL:
-                raise ValueError("Null feature definition")
-            key_c = OGR_Fld_GetNameRef(fdefn)
+        n = OGR_FD_GetFieldCount(cogr_featuredefn)
+        free(self.field_index)
+        free(self.field_kind)
+        self.field_index = <int *>malloc(max(n, 1) * sizeof(int))
+        self.field_kind = <int *>malloc(max(n, 1) * sizeof(int))
+        if self.field_index == NULL or self.field_kind == NULL:
+            raise MemoryError()
+        self.field_keys = []
+        self.nfields = 0
+
+        for i in range(n):
+            cogr_fielddefn = OGR_FD_GetFieldDefn(cogr_featuredefn, i)
+            if cogr_fielddefn == NULL:
+                raise ValueError("Null field definition")
+            key_c = OGR_Fld_GetNameRef(cogr_fielddefn)
             if key_c == NULL:
                 raise ValueError("Null field name reference")
             key_b = key_c
-            key = key_b.decode(encoding)
+            key = sys.intern(key_b.decode(self.encoding))
 
-            if key in ignore_fields:
+            if key in self.ignore_fields:
                 continue
 
-            fieldtypename = FIELD_TYPES[OGR_Fld_GetType(fdefn)]
-            fieldsubtype = get_field_subtype(fdefn)
-            if not fieldtypename:
+            kind = get_field_kind(cogr_fielddefn)
+            if kind < 0:
                 log.warning(
                     "Skipping field %s: invalid type %s",
                     key,
-                    OGR_Fld_GetType(fdefn))
+                    OGR_Fld_GetType(cogr_fielddefn))
                 continue
 
-            # TODO: other types
-            fieldtype = FIELD_TYPES_MAP[fieldtypename]
+            self.field_index[self.nfields] = i
+            self.field_kind[self.nfields] = kind
+            self.field_keys.append(key)
+            self.nfields += 1
+
+        return 0
+
+    cdef build(self, void *feature, bint with_bbox=False, int precision=-1):
+        """Build a Fiona feature object from an OGR feature
+
+        Parameters
+        ----------
+        feature : void *
+            The OGR feature # TODO: use a real typedef
+        with_bbox : bool
+            If True, the feature has a 'bbox' item, the (minx, miny,
+            maxx, maxy) envelope of its geometry computed by OGR, unless
+            the geometry is null or empty
+        precision : int
+            If not negative, the coordinates of the geometry and of its
+            bbox are rounded to this number of decimal places
+
+        Returns
+        -------
+        dict
+        """
+        cdef int i
+        cdef int j
+        cdef int kind
+
+        # Skeleton of the feature to be returned.
+        fid = OGR_F_GetFID(feature)
+        props = OrderedDict()
+        fiona_feature = {
+            "type": "Feature",
+            "id": str(fid),
+            "properties": props,
+        }
+
+        # Iterate over the compiled fields of the OGR feature.
+        for j in range(self.nfields):
+            i = self.field_index[j]
+            kind = self.field_kind[j]
+            key = self.field_keys[j]
 
             if is_field_null(feature, i):
                 props[key] = None
+            elif kind == FIELD_KIND_INT32:
+                props[key] = OGR_F_GetFieldAsInteger(feature, i)
+            elif kind == FIELD_KIND_INT64:
+                props[key] = OGR_F_GetFieldAsInteger64(feature, i)
+            elif kind == FIELD_KIND_FLOAT:
+                props[key] = OGR_F_GetFieldAsDouble(feature, i)
+            else:
+                props[key] = get_field_value(feature, i, kind, self.encoding, self.driver)
 
-            elif fieldtypename is 'int32':
-                if fieldsubtype == OFSTBoolean:
-                    props[key] = bool(OGR_F_GetFieldAsInteger(feature, i))
-                else:
-                    props[key] = OGR_F_GetFieldAsInteger(feature, i)
+        cdef void *cogr_geometry = NULL
+        cdef bint owned = False
+        cdef OGREnvelope envelope
+        cdef double bounds[4]
 
-            elif fieldtype is int:
-                if fieldsubtype == OFSTBoolean:
-                    props[key] = bool(OGR_F_GetFieldAsInteger64(feature, i))
-                else:
-                    props[key] = OGR_F_GetFieldAsInteger64(feature, i)
+        if not self.ignore_geometry:
+            cogr_geometry = self.get_geometry(feature, &owned)
 
-            elif fieldtype is float:
-                props[key] = OGR_F_GetFieldAsDouble(feature, i)
+            if cogr_geometry is not NULL:
 
-            elif fieldtype is text_type:
-                val = OGR_F_GetFieldAsString(feature, i)
                 try:
-                    val = val.decode(encoding)
-                except UnicodeDecodeError:
-                    log.warning(
-                        "Failed to decode %s using %s codec", val, encoding)
-
-                # Does the text contain a JSON object? Let's check.
-                # Let's check as cheaply as we can.
-                if driver == 'GeoJSON' and val.startswith('{'):
-                    try:
-                        val = json.loads(val)
-                    except ValueError as err:
-                        log.warning(str(err))
+                    self.transform_geometry(cogr_geometry)
+                    if with_bbox and not OGR_G_IsEmpty(cogr_geometry):
+                        OGR_G_GetEnvelope(cogr_geometry, &envelope)
+                        bounds = [envelope.MinX, envelope.MinY, envelope.MaxX, envelope.MaxY]
+                        if precision >= 0:
+                            round_coordinates(bounds, 4, precision)
+                        fiona_feature["bbox"] = (bounds[0], bounds[1], bounds[2], bounds[3])
+                    fiona_feature["geometry"] = self.build_geometry(cogr_geometry, precision)
+                finally:
+                    if owned:
+                        OGR_G_DestroyGeometry(cogr_geometry)
 
-                # Now add to the properties object.
-                props[key] = val
+            else:
 
-            elif fieldtype in (FionaDateType, FionaTimeType, FionaDateTimeType):
-                retval = OGR_F_GetFieldAsDateTime(
-                    feature, i, &y, &m, &d, &hh, &mm, &ss, &tz)
-                try:
-                    if fieldtype is FionaDateType:
-                        props[key] = datetime.date(y, m, d).isoformat()
-                    elif fieldtype is FionaTimeType:
-                        props[key] = datetime.time(hh, mm, ss).isoformat()
-                    else:
-                        props[key] = datetime.datetime(
-                            y, m, d, hh, mm, ss).isoformat()
-                except ValueError as err:
-                    log.exception(err)
-                    props[key] = None
+                fiona_feature["geometry"] = None
 
-            elif fieldtype is bytes:
-                data = OGR_F_GetFieldAsBinary(feature, i, &l)
-                props[key] = data[:l]
+        return fiona_feature
 
-            else:
-                props[key] = None
+    cdef void *get_geometry(self, void *feature, bint *owned):
+        """Get the geometry of an OGR feature, with curves linearized
 
-        cdef void *cogr_geometry = NULL
+        Parameters
+        ----------
+        feature : void *
+            The OGR feature
+        owned : bint *
+            Set to True if the returned geometry is a new geometry which
+            the caller must destroy, False if it belongs to the feature
+
+        Returns
+        -------
+        void *
+            The geometry, or NULL if the feature has none
+        """
+        cdef void *cogr_geometry = OGR_F_GetGeometryRef(feature)
         cdef void *org_geometry = NULL
 
-        if not ignore_geometry:
-            cogr_geometry = OGR_F_GetGeometryRef(feature)
+        owned[0] = False
+        if cogr_geometry == NULL:
+            return NULL
 
-            if cogr_geometry is not NULL:
+        code = base_geometry_type_code(OGR_G_GetGeometryType(cogr_geometry))
 
-                code = base_geometry_type_code(OGR_G_GetGeometryType(cogr_geometry))
+        if 8 <= code <= 14:  # Curves.
+            cogr_geometry = get_linear_geometry(cogr_geometry)
+            owned[0] = True
 
-                if 8 <= code <= 14:  # Curves.
-                    cogr_geometry = get_linear_geometry(cogr_geometry)
-                    geom = GeomBuilder().build(cogr_geometry)
-                    OGR_G_DestroyGeometry(cogr_geometry)
+        elif 15 <= code <= 17:
+            # We steal the geometry: the geometry of the in-memory feature is now null
+            # and we are responsible for cogr_geometry.
+            org_geometry = OGR_F_StealGeometry(feature)
 
-                elif 15 <= code <= 17:
-                    # We steal the geometry: the geometry of the in-memory feature is now null
-                    # and we are responsible for cogr_geometry.
-                    org_geometry = OGR_F_StealGeometry(feature)
+            if code in (15, 16):
+                cogr_geometry = OGR_G_ForceToMultiPolygon(org_geometry)
+            elif code == 17:
+                cogr_geometry = OGR_G_ForceToPolygon(org_geometry)
+            owned[0] = True
 
-                    if code in (15, 16):
-                        cogr_geometry = OGR_G_ForceToMultiPolygon(org_geometry)
-                    elif code == 17:
-                        cogr_geometry = OGR_G_ForceToPolygon(org_geometry)
+        return cogr_geometry
 
-                    geom = GeomBuilder().build(cogr_geometry)
-                    OGR_G_DestroyGeometry(cogr_geometry)
+    cdef int transform_geometry(self, void *cogr_geometry) except -1:
+        """Transform an OGR geometry in place with the builder's
+        transformer, if any
 
-                else:
-                    geom = GeomBuilder().build(cogr_geometry)
+        Parameters
+        ----------
+        cogr_geometry : void *
+            The OGR geometry
 
-                fiona_feature["geometry"] = geom
+        Returns
+        -------
+        int
+        """
+        if self.transformer is not None:
+            transform_ogr_geometry(self.transformer, cogr_geometry)
+        return 0
 
-            else:
+    cdef object build_geometry(self, void *cogr_geometry, int precision=-1):
+        """Build a geometry in the builder's format from an OGR geometry
 
-                fiona_feature["geometry"] = None
+        Parameters
+        ----------
+        cogr_geometry : void *
+            The OGR geometry, which is not destroyed
+        precision : int
+            If not negative, coordinates are rounded to this number of
+            decimal places: by the GeomBuilder as vertices are fetched,
+            or in the OGR geometry itself before it is exported
 
-        return fiona_feature
+        Returns
+        -------
+        dict, bytes, str, or shapely geometry
+        """
+        if precision >= 0 and self.geometry_format in (
+                GEOMETRY_FORMAT_WKB, GEOMETRY_FORMAT_WKT, GEOMETRY_FORMAT_SHAPELY):
+            round_ogr_geometry(cogr_geometry, precision)
+        self.geom_builder.precision = precision
+
+        if self.geometry_format == GEOMETRY_FORMAT_WKB:
+            return ogr_geometry_wkb(cogr_geometry)
+        elif self.geometry_format == GEOMETRY_FORMAT_WKT:
+            return ogr_geometry_wkt(cogr_geometry)
+        elif self.geometry_format == GEOMETRY_FORMAT_SHAPELY:
+            return self.shapely_loads(ogr_geometry_wkb(cogr_geometry))
+        else:
+            return self.geom_builder.build(cogr_geometry)
 
 
 cdef class OGRFeatureBuilder:
 
     """Builds an OGR Feature from a Fiona feature mapping.
 
+    A builder is compiled once for a writing session into a write plan:
+    the OGR field index and value kind of each schema property, and the
+    encoding of the layer. The plan is then reused for every record.
+
     Allocates one OGR Feature which should be destroyed by the caller.
-    Borrows a layer definition from the collection.
+    Borrows a layer definition from the session.
+
+    The geometry of the feature may be a GeoJSON-like mapping, WKB
+    bytes, or an object with a ``wkb`` attribute or a
+    ``__geo_interface__``. A caller that has already normalized the
+    geometry with _normalize_geometry may pass it as ``geometry``.
+    WKB is converted to an OGR geometry by OGR itself.
     """
 
-    cdef void * build(self, feature, collection) except NULL:
-        cdef void *cogr_geometry = NULL
-        cdef const char *string_c = NULL
-        cdef WritingSession session
-        session = collection.session
-        cdef void *cogr_layer = session.cogr_layer
-        if cogr_layer == NULL:
+    cdef void *cogr_featuredefn
+    cdef int nfields
+    cdef int *field_index
+    cdef int *field_kind
+    cdef dict field_positions
+    cdef object encoding
+
+    def __dealloc__(self):
+        free(self.field_index)
+        free(self.field_kind)
+
+    cdef int compile(self, WritingSession session, collection) except -1:
+        """Compile the builder's write plan for a session's layer
+
+        Parameters
+        ----------
+        session : WritingSession
+            A started writing session
+        collection : Collection
+            The session's collection
+
+        Returns
+        -------
+        int
+        """
+        cdef int j
+        if session.cogr_layer == NULL:
             raise ValueError("Null layer")
-        cdef void *cogr_featuredefn = OGR_L_GetLayerDefn(cogr_layer)
-        if cogr_featuredefn == NULL:
+        self.cogr_featuredefn = OGR_L_GetLayerDefn(session.cogr_layer)
+        if self.cogr_featuredefn == NULL:
             raise ValueError("Null feature definition")
-        cdef void *cogr_feature = OGR_F_Create(cogr_featuredefn)
-        if cogr_feature == NULL:
-            raise ValueError("Null feature")
-
-        if feature['geometry'] is not None:
-            cogr_geometry = OGRGeomBuilder().build(
-                                feature['geometry'])
-        OGR_F_SetGeometryDirectly(cogr_feature, cogr_geometry)
 
         # OGR_F_SetFieldString takes encoded strings ('bytes' in Python 3).
-        encoding = session._get_internal_encoding()
+        self.encoding = session._get_internal_encoding()
 
-        for key, value in feature['properties'].items():
+        properties = collection.schema['properties']
+        n = len(properties)
+        free(self.field_index)
+        free(self.field_kind)
+        self.field_index = <int *>malloc(max(n, 1) * sizeof(int))
+        self.field_kind = <int *>malloc(max(n, 1) * sizeof(int))
+        if self.field_index == NULL or self.field_kind == NULL:
+            raise MemoryError()
+        self.field_positions = {}
+        self.nfields = n
+
+        for j, (key, value) in enumerate(properties.items()):
             ogr_key = session._schema_mapping[key]
+            key_bytes = strencode(ogr_key, self.encoding)
+            self.field_index[j] = OGR_FD_GetFieldIndex(self.cogr_featuredefn, key_bytes)
+            self.field_kind[j] = WRITE_FIELD_KINDS[normalize_field_type(value)]
+            self.field_positions[key] = j
 
-            schema_type = normalize_field_type(collection.schema['properties'][key])
+        return 0
 
-            key_bytes = strencode(ogr_key, encoding)
-            key_c = key_bytes
-            i = OGR_F_GetFieldIndex(cogr_feature, key_c)
-            if i < 0:
-                continue
+    cdef int set_field(self, void *cogr_feature, int i, int kind, object value) except -1:
+        """Set the value of the i-th field of an OGR feature
 
-            # Special case: serialize dicts to assist OGR.
-            if isinstance(value, dict):
-                value = json.dumps(value)
+        The OGR setter is chosen by the type of the value and, for
+        integers, dates, times and bytes, by the field's kind.
 
-            # Continue over the standard OGR types.
-            if isinstance(value, integer_types):
-                if schema_type == 'int32':
-                    OGR_F_SetFieldInteger(cogr_feature, i, value)
-                else:
-                    OGR_F_SetFieldInteger64(cogr_feature, i, value)
-
-            elif isinstance(value, float):
-                OGR_F_SetFieldDouble(cogr_feature, i, value)
-            elif (isinstance(value, string_types)
-            and schema_type in ['date', 'time', 'datetime']):
-                if schema_type == 'date':
-                    y, m, d, hh, mm, ss, ff = parse_date(value)
-                elif schema_type == 'time':
-                    y, m, d, hh, mm, ss, ff = parse_time(value)
-                else:
-                    y, m, d, hh, mm, ss, ff = parse_datetime(value)
-                OGR_F_SetFieldDateTime(
-                    cogr_feature, i, y, m, d, hh, mm, ss, 0)
-            elif (isinstance(value, datetime.date)
-            and schema_type == 'date'):
-                y, m, d = value.year, value.month, value.day
-                OGR_F_SetFieldDateTime(
-                    cogr_feature, i, y, m, d, 0, 0, 0, 0)
-            elif (isinstance(value, datetime.datetime)
-            and schema_type == 'datetime'):
-                y, m, d = value.year, value.month, value.day
-                hh, mm, ss = value.hour, value.minute, value.second
-                OGR_F_SetFieldDateTime(
-                    cogr_feature, i, y, m, d, hh, mm, ss, 0)
-            elif (isinstance(value, datetime.time)
-            and schema_type == 'time'):
-                hh, mm, ss = value.hour, value.minute, value.second
-                OGR_F_SetFieldDateTime(
-                    cogr_feature, i, 0, 0, 0, hh, mm, ss, 0)
-            elif isinstance(value, bytes) and schema_type == "bytes":
-                string_c = value
-                OGR_F_SetFieldBinary(cogr_feature, i, len(value),
-                    <unsigned char*>string_c)
-            elif isinstance(value, string_types):
-                value_bytes = strencode(value, encoding)
-                string_c = value_bytes
-                OGR_F_SetFieldString(cogr_feature, i, string_c)
-            elif value is None:
-                set_field_null(cogr_feature, i)
+        Returns
+        -------
+        int
+        """
+        cdef const char *string_c = NULL
+
+        # Special case: serialize dicts to assist OGR.
+        if isinstance(value, dict):
+            value = json.dumps(value)
+
+        # Continue over the standard OGR types.
+        if isinstance(value, integer_types):
+            if kind == FIELD_KIND_INT32:
+                OGR_F_SetFieldInteger(cogr_feature, i, value)
+            else:
+                OGR_F_SetFieldInteger64(cogr_feature, i, value)
+
+        elif isinstance(value, float):
+            OGR_F_SetFieldDouble(cogr_feature, i, value)
+        elif (isinstance(value, string_types)
+        and kind in (FIELD_KIND_DATE, FIELD_KIND_TIME, FIELD_KIND_DATETIME)):
+            if kind == FIELD_KIND_DATE:
+                y, m, d, hh, mm, ss, ff = parse_date(value)
+            elif kind == FIELD_KIND_TIME:
+                y, m, d, hh, mm, ss, ff = parse_time(value)
             else:
-                raise ValueError("Invalid field type %s" % type(value))
+                y, m, d, hh, mm, ss, ff = parse_datetime(value)
+            OGR_F_SetFieldDateTime(
+                cogr_feature, i, y, m, d, hh, mm, ss, 0)
+        elif (isinstance(value, datetime.date)
+        and kind == FIELD_KIND_DATE):
+            y, m, d = value.year, value.month, value.day
+            OGR_F_SetFieldDateTime(
+                cogr_feature, i, y, m, d, 0, 0, 0, 0)
+        elif (isinstance(value, datetime.datetime)
+        and kind == FIELD_KIND_DATETIME):
+            y, m, d = value.year, value.month, value.day
+            hh, mm, ss = value.hour, value.minute, value.second
+            OGR_F_SetFieldDateTime(
+                cogr_feature, i, y, m, d, hh, mm, ss, 0)
+        elif (isinstance(value, datetime.time)
+        and kind == FIELD_KIND_TIME):
+            hh, mm, ss = value.hour, value.minute, value.second
+            OGR_F_SetFieldDateTime(
+                cogr_feature, i, 0, 0, 0, hh, mm, ss, 0)
+        elif isinstance(value, bytes) and kind == FIELD_KIND_BYTES:
+            string_c = value
+            OGR_F_SetFieldBinary(cogr_feature, i, len(value),
+                <unsigned char*>string_c)
+        elif isinstance(value, string_types):
+            value_bytes = strencode(value, self.encoding)
+            string_c = value_bytes
+            OGR_F_SetFieldString(cogr_feature, i, string_c)
+        elif value is None:
+            set_field_null(cogr_feature, i)
+        else:
+            raise ValueError("Invalid field type %s" % type(value))
+        return 0
+
+    cdef void * build(self, feature, object geometry=None) except NULL:
+        cdef void *cogr_geometry = NULL
+        cdef int i
+        cdef int j
+        if self.cogr_featuredefn == NULL:
+            raise ValueError("Null feature definition")
+        cdef void *cogr_feature = OGR_F_Create(self.cogr_featuredefn)
+        if cogr_feature == NULL:
+            raise ValueError("Null feature")
+
+        try:
+            if geometry is None:
+                geometry = _normalize_geometry(feature['geometry'])
+            if isinstance(geometry, bytes):
+                cogr_geometry = _createOgrGeomFromWKB(geometry)
+            elif geometry is not None:
+                cogr_geometry = OGRGeomBuilder().build(geometry)
+            OGR_F_SetGeometryDirectly(cogr_feature, cogr_geometry)
+
+            for key, value in feature['properties'].items():
+                j = self.field_positions[key]
+                i = self.field_index[j]
+                if i < 0:
+                    continue
+                self.set_field(cogr_feature, i, self.field_kind[j], value)
+
+        except:
+            _deleteOgrFeature(cogr_feature)
+            raise
+
         return cogr_feature
 
 
@@ -403,24 +868,125 @@ cdef _deleteOgrFeature(void *cogr_feature):
     cogr_feature = NULL
 
 
+cdef void *_get_next_feature(void *cogr_layer):
+    """Fetch the next feature of a layer with the GIL released"""
+    cdef void *cogr_feature = NULL
+    with nogil:
+        cogr_feature = OGR_L_GetNextFeature(cogr_layer)
+    return cogr_feature
+
+
+cdef class OGRFeatureBatch:
+
+    """OGR features built from a chunk of records
+
+    Batches are built by WritingSession.build_features, possibly in a
+    worker thread, and consumed by WritingSession.insert_features.
+    Features that have not been inserted are destroyed with the batch.
+    """
+
+    cdef void **features
+    cdef int count
+    cdef object records
+
+    def __cinit__(self, records):
+        self.records = records
+        self.count = 0
+        self.features = <void **>calloc(max(len(records), 1), sizeof(void *))
+        if self.features == NULL:
+            raise MemoryError()
+
+    def __dealloc__(self):
+        cdef int k
+        if self.features != NULL:
+            for k in range(self.count):
+                _deleteOgrFeature(self.features[k])
+            free(self.features)
+            self.features = NULL
+
+
 def featureRT(feature, collection):
     # For testing purposes only, leaks the JSON data
-    cdef void *cogr_feature = OGRFeatureBuilder().build(feature, collection)
+    cdef FeatureBuilder builder
+    cdef WritingSession session = collection.session
+    cdef void *cogr_feature = session._ogr_feature_builder.build(feature)
     cdef void *cogr_geometry = OGR_F_GetGeometryRef(cogr_feature)
     if cogr_geometry == NULL:
         raise ValueError("Null geometry")
-    result = FeatureBuilder().build(
-        cogr_feature,
-        encoding='utf-8',
-        bbox=False,
-        driver=collection.driver
-    )
+    builder = FeatureBuilder(encoding='utf-8', driver=collection.driver)
+    builder.compile(OGR_L_GetLayerDefn(session.cogr_layer))
+    result = builder.build(cogr_feature)
     _deleteOgrFeature(cogr_feature)
     return result
 
 
 # Collection-related extension classes and functions
 
+cdef class DatasetHandle:
+
+    """A dataset opened in read-only mode to be shared by sessions
+
+    Handles are opened and cached by fiona.pool.DatasetPool and are
+    used by one session at a time.
+
+    Attributes
+    ----------
+    key : object
+        The key of the handle in its pool
+    mtime : float or None
+        Modification time of the dataset's file when it was opened
+    released : float
+        Time of the last release of the handle to its pool
+    """
+
+    cdef void *cogr_ds
+    cdef public object key
+    cdef public object mtime
+    cdef public double released
+
+    def __cinit__(self):
+        self.cogr_ds = NULL
+
+    def __init__(self, path, drivers=None, options=None):
+        cdef const char *path_c = NULL
+        path_b = path.encode('utf-8')
+        path_c = path_b
+        self.cogr_ds = gdal_open_vector(path_c, 0, drivers, options or {})
+
+    def __dealloc__(self):
+        if self.cogr_ds != NULL:
+            GDALClose(self.cogr_ds)
+            self.cogr_ds = NULL
+
+    @property
+    def closed(self):
+        return self.cogr_ds == NULL
+
+    def reset(self):
+        """Clears the spatial filters, ignored fields and read cursors
+        of the dataset's layers"""
+        cdef int i
+        cdef void *cogr_layer = NULL
+        if self.cogr_ds == NULL:
+            return
+        for i in range(GDALDatasetGetLayerCount(self.cogr_ds)):
+            cogr_layer = GDALDatasetGetLayer(self.cogr_ds, i)
+            OGR_L_SetSpatialFilter(cogr_layer, NULL)
+            OGR_L_SetIgnoredFields(cogr_layer, NULL)
+            OGR_L_ResetReading(cogr_layer)
+
+    def close(self):
+        """Closes the dataset"""
+        if self.cogr_ds != NULL:
+            GDALClose(self.cogr_ds)
+            self.cogr_ds = NULL
+
+    def detach(self):
+        """Forgets the dataset without closing it, as in a forked child
+        process"""
+        self.cogr_ds = NULL
+
+
 cdef class Session:
 
     cdef void *cogr_ds
@@ -428,12 +994,22 @@ cdef class Session:
     cdef object _fileencoding
     cdef object _encoding
     cdef object collection
+    cdef FeatureBuilder _feature_builder
+    cdef object _dataset_pool
+    cdef DatasetHandle _dataset_handle
+    cdef Transformer _transformer
+    cdef Transformer _inverse_transformer
 
     def __init__(self):
         self.cogr_ds = NULL
         self.cogr_layer = NULL
         self._fileencoding = None
         self._encoding = None
+        self._feature_builder = None
+        self._dataset_pool = None
+        self._dataset_handle = None
+        self._transformer = None
+        self._inverse_transformer = None
 
     def __dealloc__(self):
         self.stop()
@@ -463,7 +1039,15 @@ cdef class Session:
         if encoding:
             kwargs['encoding'] = encoding.upper()
 
-        self.cogr_ds = gdal_open_vector(path_c, 0, drivers, kwargs)
+        # A dataset is leased from the collection's pool, if any, and
+        # is returned to it when the session is stopped.
+        if collection.pool is not None:
+            self._dataset_pool = collection.pool
+            self._dataset_handle = self._dataset_pool.acquire(
+                collection.path, drivers, kwargs)
+            self.cogr_ds = self._dataset_handle.cogr_ds
+        else:
+            self.cogr_ds = gdal_open_vector(path_c, 0, drivers, kwargs)
 
         if isinstance(collection.name, string_types):
             name_b = collection.name.encode('utf-8')
@@ -471,35 +1055,75 @@ cdef class Session:
             self.cogr_layer = GDALDatasetGetLayerByName(self.cogr_ds, name_c)
         elif isinstance(collection.name, int):
             self.cogr_layer = GDALDatasetGetLayer(self.cogr_ds, collection.name)
-            name_c = OGR_L_GetName(self.cogr_layer)
-            name_b = name_c
-            collection.name = name_b.decode('utf-8')
+            if self.cogr_layer != NULL:
+                name_c = OGR_L_GetName(self.cogr_layer)
+                name_b = name_c
+                collection.name = name_b.decode('utf-8')
 
         if self.cogr_layer == NULL:
+            if self._dataset_handle is not None:
+                self.stop()
             raise ValueError("Null layer: " + repr(collection.name))
 
         encoding = self._get_internal_encoding()
 
-        if collection.ignore_fields:
+        if collection.ignore_fields or collection.ignore_geometry:
             try:
-                for name in collection.ignore_fields:
+                for name in collection.ignore_fields or []:
                     try:
                         name_b = name.encode(encoding)
                     except AttributeError:
                         raise TypeError("Ignored field \"{}\" has type \"{}\", expected string".format(name, name.__class__.__name__))
                     ignore_fields = CSLAddString(ignore_fields, <const char *>name_b)
+                if collection.ignore_geometry:
+                    ignore_fields = CSLAddString(ignore_fields, "OGR_GEOMETRY")
                 OGR_L_SetIgnoredFields(self.cogr_layer, <const char**>ignore_fields)
             finally:
                 CSLDestroy(ignore_fields)
 
+        # Geometries, extents and spatial filters are transformed
+        # between the layer's CRS and a destination CRS.
+        if collection.dst_crs:
+            layer_crs_wkt = self.get_crs_wkt()
+            if not layer_crs_wkt:
+                self.stop()
+                raise CRSError("Layer has no CRS to transform from")
+            try:
+                self._transformer = Transformer(layer_crs_wkt, collection.dst_crs)
+                self._inverse_transformer = Transformer(collection.dst_crs, layer_crs_wkt)
+            except CRSError:
+                self.stop()
+                raise
+
         self.collection = collection
 
     cpdef stop(self):
+        self._feature_builder = None
+        self._transformer = None
+        self._inverse_transformer = None
         self.cogr_layer = NULL
+        if self._dataset_handle is not None:
+            handle = self._dataset_handle
+            self._dataset_handle = None
+            self.cogr_ds = NULL
+            self._dataset_pool.release(handle)
         if self.cogr_ds != NULL:
             GDALClose(self.cogr_ds)
         self.cogr_ds = NULL
 
+    def detach(self):
+        """Forgets the session's dataset without closing it
+
+        Datasets inherited by a forked child process belong to the
+        parent and must not be used or closed by the child.
+        """
+        self._feature_builder = None
+        self.cogr_layer = NULL
+        self.cogr_ds = NULL
+        if self._dataset_handle is not None:
+            self._dataset_handle.detach()
+            self._dataset_handle = None
+
     def get_fileencoding(self):
         """DEPRECATED"""
         warnings.warn("get_fileencoding is deprecated and will be removed in a future version.", FionaDeprecationWarning)
@@ -550,22 +1174,82 @@ cdef class Session:
         else:
             return self._fileencoding or self._get_fallback_encoding()
 
+    cdef FeatureBuilder get_feature_builder(self):
+        """Get the feature builder compiled for the layer
+
+        The builder is compiled on first use and shared by all read
+        paths of the session.
+
+        Returns
+        -------
+        FeatureBuilder
+        """
+        if self._feature_builder is None:
+            if self.cogr_layer == NULL:
+                raise ValueError("Null layer")
+            builder = FeatureBuilder(
+                encoding=self._get_internal_encoding(),
+                driver=self.collection.driver,
+                ignore_fields=self.collection.ignore_fields,
+                ignore_geometry=self.collection.ignore_geometry,
+                geometry_format=self.collection.geometry_format,
+                transformer=self._transformer)
+            builder.compile(OGR_L_GetLayerDefn(self.cogr_layer))
+            self._feature_builder = builder
+        return self._feature_builder
+
     def get_length(self):
         if self.cogr_layer == NULL:
             raise ValueError("Null layer")
         return OGR_L_GetFeatureCount(self.cogr_layer, 0)
 
-    def get_driver(self):
-        cdef void *cogr_driver = GDALGetDatasetDriver(self.cogr_ds)
-        if cogr_driver == NULL:
-            raise ValueError("Null driver")
-        cdef const char *name = OGR_Dr_GetName(cogr_driver)
-        driver_name = name
-        return driver_name.decode()
+    def get_feature_count(self, bbox=None, mask=None):
+        """Counts the features of the layer, scanning it if need be
 
-    def get_schema(self):
-        cdef int i
-        cdef int n
+        Parameters
+        ----------
+        bbox : tuple, optional
+            Count only features intersecting a (minx, miny, maxx, maxy)
+            tuple
+        mask : dict, optional
+            Count only features intersecting a GeoJSON-like geometry
+
+        Returns
+        -------
+        int
+        """
+        if self.cogr_layer == NULL:
+            raise ValueError("Null layer")
+        self.set_spatial_filter(bbox, mask)
+        try:
+            return OGR_L_GetFeatureCount(self.cogr_layer, 1)
+        finally:
+            self.set_spatial_filter(None, None)
+
+    def has_spatial_index(self):
+        """True if the layer's spatial filters are fast, as they are
+        with a spatial index"""
+        if self.cogr_layer == NULL:
+            raise ValueError("Null layer")
+        return bool(OGR_L_TestCapability(self.cogr_layer, OLC_FASTSPATIALFILTER))
+
+    def has_spatial_filter(self):
+        """True if a spatial filter is set on the layer"""
+        if self.cogr_layer == NULL:
+            raise ValueError("Null layer")
+        return OGR_L_GetSpatialFilter(self.cogr_layer) != NULL
+
+    def get_driver(self):
+        cdef void *cogr_driver = GDALGetDatasetDriver(self.cogr_ds)
+        if cogr_driver == NULL:
+            raise ValueError("Null driver")
+        cdef const char *name = OGR_Dr_GetName(cogr_driver)
+        driver_name = name
+        return driver_name.decode()
+
+    def get_schema(self):
+        cdef int i
+        cdef int n
         cdef void *cogr_featuredefn = NULL
         cdef void *cogr_fielddefn = NULL
         cdef const char *key_c
@@ -648,6 +1332,8 @@ cdef class Session:
     def get_crs(self):
         """Get the layer's CRS
 
+        The CRS is the destination CRS of the collection, if any.
+
         Returns
         -------
         CRS
@@ -661,12 +1347,15 @@ cdef class Session:
         if self.cogr_layer == NULL:
             raise ValueError("Null layer")
 
-        try:
-            cogr_crs = exc_wrap_pointer(OGR_L_GetSpatialRef(self.cogr_layer))
-        # TODO: we don't intend to use try/except for flow control
-        # this is a work around for a GDAL issue.
-        except FionaNullPointerError:
-            log.debug("Layer has no coordinate system")
+        if self._transformer is not None:
+            cogr_crs = self._transformer.dst
+        else:
+            try:
+                cogr_crs = exc_wrap_pointer(OGR_L_GetSpatialRef(self.cogr_layer))
+            # TODO: we don't intend to use try/except for flow control
+            # this is a work around for a GDAL issue.
+            except FionaNullPointerError:
+                log.debug("Layer has no coordinate system")
 
         if cogr_crs is not NULL:
 
@@ -736,19 +1425,22 @@ cdef class Session:
         if self.cogr_layer == NULL:
             raise ValueError("Null layer")
 
-        try:
-            cogr_crs = exc_wrap_pointer(OGR_L_GetSpatialRef(self.cogr_layer))
-
-        # TODO: we don't intend to use try/except for flow control
-        # this is a work around for a GDAL issue.
-        except FionaNullPointerError:
-            log.debug("Layer has no coordinate system")
-        except fiona._err.CPLE_OpenFailedError as exc:
-            log.debug("A support file wasn't opened. See the preceding ERROR level message.")
-            cogr_crs = OGR_L_GetSpatialRef(self.cogr_layer)
-            log.debug("Called OGR_L_GetSpatialRef() again without error checking.")
-            if cogr_crs == NULL:
-                raise exc
+        if self._transformer is not None:
+            cogr_crs = self._transformer.dst
+        else:
+            try:
+                cogr_crs = exc_wrap_pointer(OGR_L_GetSpatialRef(self.cogr_layer))
+
+            # TODO: we don't intend to use try/except for flow control
+            # this is a work around for a GDAL issue.
+            except FionaNullPointerError:
+                log.debug("Layer has no coordinate system")
+            except fiona._err.CPLE_OpenFailedError as exc:
+                log.debug("A support file wasn't opened. See the preceding ERROR level message.")
+                cogr_crs = OGR_L_GetSpatialRef(self.cogr_layer)
+                log.debug("Called OGR_L_GetSpatialRef() again without error checking.")
+                if cogr_crs == NULL:
+                    raise exc
 
         if cogr_crs is not NULL:
             log.debug("Got coordinate system")
@@ -768,14 +1460,37 @@ cdef class Session:
             log.debug("Projection not found (cogr_crs was NULL)")
             return ""
 
-    def get_extent(self):
+    def get_extent(self, approx=False):
+        """Gets the extent of the layer
+
+        Parameters
+        ----------
+        approx : bool
+            If True, the layer is not scanned: the extent is only
+            returned if the driver has it at hand, for example in a
+            header or a spatial index.
+
+        Returns
+        -------
+        tuple or None
+            (minx, miny, maxx, maxy), or None if approx is True and the
+            extent is not at hand. The extent of a layer read in another
+            CRS is the envelope of its transformed extent.
+        """
         cdef OGREnvelope extent
+        cdef OGRErr result
 
         if self.cogr_layer == NULL:
             raise ValueError("Null layer")
 
-        result = OGR_L_GetExtent(self.cogr_layer, &extent, 1)
-        return (extent.MinX, extent.MinY, extent.MaxX, extent.MaxY)
+        extent.MinX = extent.MinY = extent.MaxX = extent.MaxY = 0.0
+        result = OGR_L_GetExtent(self.cogr_layer, &extent, 0 if approx else 1)
+        if approx and result != OGRERR_NONE:
+            return None
+        bounds = (extent.MinX, extent.MinY, extent.MaxX, extent.MaxY)
+        if self._transformer is not None and result == OGRERR_NONE:
+            bounds = self._transformer.transform_bounds(bounds)
+        return bounds
 
     def has_feature(self, fid):
         """Provides access to feature data by FID.
@@ -800,14 +1515,7 @@ cdef class Session:
         fid = int(fid)
         cogr_feature = OGR_L_GetFeature(self.cogr_layer, fid)
         if cogr_feature != NULL:
-            feature = FeatureBuilder().build(
-                cogr_feature,
-                encoding=self._get_internal_encoding(),
-                bbox=False,
-                driver=self.collection.driver,
-                ignore_fields=self.collection.ignore_fields,
-                ignore_geometry=self.collection.ignore_geometry,
-            )
+            feature = self.get_feature_builder().build(cogr_feature)
             _deleteOgrFeature(cogr_feature)
             return feature
         else:
@@ -834,14 +1542,7 @@ cdef class Session:
             cogr_feature = OGR_L_GetFeature(self.cogr_layer, index)
             if cogr_feature == NULL:
                 return None
-            feature = FeatureBuilder().build(
-                cogr_feature,
-                encoding=self._get_internal_encoding(),
-                bbox=False,
-                driver=self.collection.driver,
-                ignore_fields=self.collection.ignore_fields,
-                ignore_geometry=self.collection.ignore_geometry,
-            )
+            feature = self.get_feature_builder().build(cogr_feature)
             _deleteOgrFeature(cogr_feature)
             return feature
 
@@ -851,10 +1552,125 @@ cdef class Session:
         else:
             return 0
 
+    cdef set_spatial_filter(self, bbox, mask):
+        """Set or clear the spatial filter of the layer
+
+        Parameters
+        ----------
+        bbox : tuple
+            A (minx, miny, maxx, maxy) tuple
+        mask : dict
+            A GeoJSON-like geometry
+
+        Returns
+        -------
+        None
+        """
+        cdef void *cogr_geometry = NULL
+
+        if bbox and mask:
+            raise ValueError("mask and bbox can not be set together")
+
+        # Filters in the destination CRS of the session are
+        # transformed back to the layer's CRS.
+        if bbox:
+            if self._inverse_transformer is not None:
+                bbox = self._inverse_transformer.transform_bounds(bbox)
+            OGR_L_SetSpatialFilterRect(
+                self.cogr_layer, bbox[0], bbox[1], bbox[2], bbox[3])
+        elif mask:
+            cogr_geometry = OGRGeomBuilder().build(mask)
+            if self._inverse_transformer is not None:
+                try:
+                    transform_ogr_geometry(self._inverse_transformer, cogr_geometry)
+                except Exception:
+                    OGR_G_DestroyGeometry(cogr_geometry)
+                    raise
+            OGR_L_SetSpatialFilter(self.cogr_layer, cogr_geometry)
+            OGR_G_DestroyGeometry(cogr_geometry)
+        else:
+            OGR_L_SetSpatialFilter(self.cogr_layer, NULL)
+
+    def get_arrow_reader(self, batch_size=DEFAULT_BATCH_SIZE, bbox=None, mask=None):
+        """Get a reader of the layer's features as Arrow record batches
+
+        The reader is built on OGR's Arrow C stream interface and
+        requires GDAL 3.6 or newer and pyarrow. Geometries are WKB
+        encoded. The reader must be closed before the session is
+        stopped.
+
+        Parameters
+        ----------
+        batch_size : int
+            Maximum number of features in a batch
+        bbox : tuple
+            A (minx, miny, maxx, maxy) tuple
+        mask : dict
+            A GeoJSON-like geometry
+
+        Returns
+        -------
+        pyarrow.RecordBatchReader
+        """
+        cdef ArrowArrayStream *stream = NULL
+        cdef char **options = NULL
+
+        if self.cogr_layer == NULL:
+            raise ValueError("Null layer")
+        if self._transformer is not None:
+            raise ValueError("Arrow batches can not be read in a dst_crs")
+
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("pyarrow is required for Arrow access to features")
+
+        self.set_spatial_filter(bbox, mask)
+        OGR_L_ResetReading(self.cogr_layer)
+
+        batch_size_b = str(int(batch_size)).encode('utf-8')
+        options = CSLSetNameValue(options, "MAX_FEATURES_IN_BATCH", <const char *>batch_size_b)
+        options = CSLSetNameValue(options, "INCLUDE_FID", "YES")
+        options = CSLSetNameValue(options, "GEOMETRY_ENCODING", "WKB")
+
+        stream = <ArrowArrayStream *>calloc(1, sizeof(ArrowArrayStream))
+        if stream == NULL:
+            CSLDestroy(options)
+            raise MemoryError()
+
+        try:
+            get_arrow_stream(self.cogr_layer, stream, options)
+            try:
+                # pyarrow moves the stream out of our struct and takes
+                # responsibility for releasing it.
+                return pyarrow.RecordBatchReader._import_from_c(<size_t>stream)
+            except Exception:
+                if stream.release != NULL:
+                    stream.release(stream)
+                raise
+        finally:
+            CSLDestroy(options)
+            free(stream)
+
 
 cdef class WritingSession(Session):
 
     cdef object _schema_mapping
+    cdef object _schema_keys
+    cdef OGRFeatureBuilder _ogr_feature_builder
+    cdef long long _nrecords
+    cdef int _features_in_transaction
+    cdef int _transaction_size
+    cdef bint _bulk_load
+    cdef bint _spatial_index_deferred
+    cdef object _bulk_load_pragmas
+    cdef double _commit_time
+    cdef object _base_length
+    cdef object _base_extent
+    cdef bint _base_extent_known
+    cdef long long _written_count
+    cdef OGREnvelope _written_extent
+    cdef bint _has_written_extent
 
     def start(self, collection, **kwargs):
         cdef OGRSpatialReferenceH cogr_srs = NULL
@@ -868,6 +1684,18 @@ cdef class WritingSession(Session):
         cdef int ret
         path = collection.path
         self.collection = collection
+        self._transaction_size = collection.transaction_size
+        self._bulk_load = collection.bulk_load
+        self._spatial_index_deferred = False
+        self._bulk_load_pragmas = None
+        self._commit_time = 0.0
+        # The length and extent of a layer in 'a' mode are queried
+        # once. Those of a new layer are known to be empty.
+        self._base_length = None if collection.mode == 'a' else 0
+        self._base_extent = None
+        self._base_extent_known = collection.mode == 'w'
+        self._written_count = 0
+        self._has_written_extent = False
 
         userencoding = kwargs.get('encoding')
 
@@ -898,7 +1726,19 @@ cdef class WritingSession(Session):
             else:
                 self._fileencoding = userencoding or self._get_fallback_encoding()
 
+            driver = self.get_driver()
+            if self._bulk_load and driver not in BULK_LOAD_DRIVERS:
+                OGRReleaseDataSource(self.cogr_ds)
+                self.cogr_ds = NULL
+                self.cogr_layer = NULL
+                raise DriverSupportError(
+                    "bulk_load is not supported by the %s driver" % driver)
+
         elif collection.mode == 'w':
+            if self._bulk_load and collection.driver not in BULK_LOAD_DRIVERS:
+                raise DriverSupportError(
+                    "bulk_load is not supported by the %s driver" % collection.driver)
+
             path_b = strencode(path)
             path_c = path_b
 
@@ -1026,6 +1866,15 @@ cdef class WritingSession(Session):
                 geometry_type = "Unknown"
             geometry_code = geometry_type_code(geometry_type)
 
+            # Defer the spatial index of a bulk load to its end unless
+            # the option is given. SQLite layers have spatial indexes
+            # only in SpatiaLite databases.
+            if (self._bulk_load and geometry_type != "None"
+                    and not any(k.lower() == 'spatial_index' for k in kwargs)
+                    and (collection.driver == 'GPKG' or kwargs.get('spatialite'))):
+                options = CSLSetNameValue(options, "SPATIAL_INDEX", "NO")
+                self._spatial_index_deferred = True
+
             try:
                 self.cogr_layer = exc_wrap_pointer(
                     GDALDatasetCreateLayer(
@@ -1120,70 +1969,564 @@ cdef class WritingSession(Session):
         self._schema_mapping = dict(zip(
             collection.schema['properties'].keys(),
             ogr_schema['properties'].keys() ))
+        self._schema_keys = frozenset(collection.schema['properties'].keys())
+
+        # Compile the write plan shared by all records.
+        self._ogr_feature_builder = OGRFeatureBuilder()
+        self._ogr_feature_builder.compile(self, collection)
+        self._nrecords = 0
+
+        if self._bulk_load:
+            self._bulk_load_pragmas = []
+            for pragma, value in BULK_LOAD_PRAGMAS:
+                previous = self.execute_sql("PRAGMA %s" % pragma)
+                if previous is not None:
+                    self._bulk_load_pragmas.append((pragma, previous))
+                self.execute_sql("PRAGMA %s = %s" % (pragma, value))
+            log.debug("Relaxed %r for bulk load", self._bulk_load_pragmas)
 
         log.debug("Writing started")
 
-    def writerecs(self, records, collection):
-        """Writes buffered records to OGR."""
-        cdef void *cogr_driver
-        cdef void *cogr_feature
-        cdef int features_in_transaction = 0
+    def get_length(self):
+        """Counts the features of the layer
 
-        cdef void *cogr_layer = self.cogr_layer
-        if cogr_layer == NULL:
-            raise ValueError("Null layer")
+        The count of the layer is queried once and then incremented by
+        the features written in the session.
+        """
+        if self._base_length is None:
+            length = Session.get_length(self)
+            if length < 0:
+                return length
+            self._base_length = length
+            self._written_count = 0
+        return self._base_length + self._written_count
+
+    def get_extent(self, approx=False):
+        """Gets the extent of the layer
+
+        The extent of the layer is queried once and then extended by the
+        envelopes of the geometries written in the session. See
+        Session.get_extent().
+        """
+        cdef OGREnvelope *written = &self._written_extent
 
-        schema_geom_type = collection.schema['geometry']
-        cogr_driver = GDALGetDatasetDriver(self.cogr_ds)
-        driver_name = OGR_Dr_GetName(cogr_driver).decode("utf-8")
+        if not self._base_extent_known:
+            if Session.get_length(self) == 0:
+                extent = None
+            else:
+                extent = Session.get_extent(self, approx)
+                if extent is None:
+                    return None
+            self._base_extent = extent
+            self._base_extent_known = True
+            self._has_written_extent = False
+
+        extent = self._base_extent
+        if self._has_written_extent:
+            if extent is None:
+                extent = (written.MinX, written.MinY, written.MaxX, written.MaxY)
+            else:
+                extent = (
+                    min(extent[0], written.MinX), min(extent[1], written.MinY),
+                    max(extent[2], written.MaxX), max(extent[3], written.MaxY))
+        return extent or (0.0, 0.0, 0.0, 0.0)
 
-        valid_geom_types = collection._valid_geom_types
-        def validate_geometry_type(record):
-            if record["geometry"] is None:
-                return True
-            return record["geometry"]["type"].lstrip("3D ") in valid_geom_types
+    cdef int validate_geometry(self, geometry, collection) except -1:
+        """Validate a normalized geometry against the collection's schema
 
-        log.debug("Starting transaction (initial)")
+        Parameters
+        ----------
+        geometry : dict or bytes
+            A normalized geometry, not None
+        collection : Collection
+            The session's collection
+
+        Returns
+        -------
+        int
+        """
+        geometry_type = _geometry_type_name(geometry)
+        if geometry_type.lstrip("3D ") not in collection._valid_geom_types:
+            raise GeometryTypeValidationError(
+                "Record's geometry type does not match "
+                "collection schema's geometry type: %r != %r" % (
+                    geometry_type,
+                    collection.schema['geometry'] ))
+        return 0
+
+    cdef int validate_record(self, record, geometry, collection) except -1:
+        """Validate a record against the collection's schema
+
+        Parameters
+        ----------
+        record : dict
+            A record to be written
+        geometry : dict or bytes
+            The record's normalized geometry
+        collection : Collection
+            The session's collection
+
+        Returns
+        -------
+        int
+        """
+        if geometry is not None:
+            self.validate_geometry(geometry, collection)
+        # Validate against collection's schema to give useful message.
+        # Dict key views compare with sets without building a set.
+        props_keys = record['properties'].keys()
+        if props_keys != self._schema_keys and set(props_keys) != self._schema_keys:
+            raise SchemaError(
+                "Record does not match collection schema: %r != %r" % (
+                    record['properties'].keys(),
+                    list(self._schema_keys) ))
+        return 0
+
+    cdef long long validation_interval(self, collection) except -1:
+        """Interval between validated records, 0 for no validation"""
+        if collection.validate == 'full':
+            return 1
+        elif collection.validate == 'sample':
+            return VALIDATION_SAMPLE_INTERVAL
+        else:
+            return 0
+
+    cdef int start_transaction(self, label) except -1:
+        log.debug("Starting transaction (%s)", label)
         result = gdal_start_transaction(self.cogr_ds, 0)
         if result == OGRERR_FAILURE:
             raise TransactionError("Failed to start transaction")
+        self._features_in_transaction = 0
+        return 0
 
-        schema_props_keys = set(collection.schema['properties'].keys())
-        for record in records:
-            if not validate_geometry_type(record):
-                raise GeometryTypeValidationError(
-                    "Record's geometry type does not match "
-                    "collection schema's geometry type: %r != %r" % (
-                        record['geometry']['type'],
-                        collection.schema['geometry'] ))
-            # Validate against collection's schema to give useful message
-            if set(record['properties'].keys()) != schema_props_keys:
-                raise SchemaError(
-                    "Record does not match collection schema: %r != %r" % (
-                        record['properties'].keys(),
-                        list(schema_props_keys) ))
-            cogr_feature = OGRFeatureBuilder().build(record, collection)
-            result = OGR_L_CreateFeature(cogr_layer, cogr_feature)
-            if result != OGRERR_NONE:
-                raise RuntimeError("Failed to write record: %s" % record)
-            _deleteOgrFeature(cogr_feature)
-
-            features_in_transaction += 1
-            if features_in_transaction == DEFAULT_TRANSACTION_SIZE:
-                log.debug("Committing transaction (intermediate)")
-                result = gdal_commit_transaction(self.cogr_ds)
-                if result == OGRERR_FAILURE:
-                    raise TransactionError("Failed to commit transaction")
-                log.debug("Starting transaction (intermediate)")
-                result = gdal_start_transaction(self.cogr_ds, 0)
-                if result == OGRERR_FAILURE:
-                    raise TransactionError("Failed to start transaction")
-                features_in_transaction = 0
-
-        log.debug("Committing transaction (final)")
+    cdef int commit_transaction(self, label) except -1:
+        log.debug("Committing transaction (%s)", label)
+        t0 = time.monotonic()
         result = gdal_commit_transaction(self.cogr_ds)
+        self._commit_time += time.monotonic() - t0
         if result == OGRERR_FAILURE:
             raise TransactionError("Failed to commit transaction")
+        return 0
+
+    cdef object execute_sql(self, sql):
+        """Execute an SQL statement in the dataset
+
+        Parameters
+        ----------
+        sql : str
+            The statement
+
+        Returns
+        -------
+        str or None
+            The first field of the first row of the statement's result,
+            or None if there is no result
+        """
+        cdef void *cogr_result = NULL
+        cdef void *cogr_feature = NULL
+        cdef const char *sql_c = NULL
+
+        sql_b = sql.encode('utf-8')
+        sql_c = sql_b
+        cogr_result = GDALDatasetExecuteSQL(self.cogr_ds, <char *>sql_c, NULL, NULL)
+        if cogr_result == NULL:
+            return None
+        try:
+            cogr_feature = OGR_L_GetNextFeature(cogr_result)
+            if cogr_feature == NULL:
+                return None
+            try:
+                if OGR_F_GetFieldCount(cogr_feature) < 1 or is_field_null(cogr_feature, 0):
+                    return None
+                value_b = OGR_F_GetFieldAsString(cogr_feature, 0)
+                return value_b.decode('utf-8')
+            finally:
+                OGR_F_Destroy(cogr_feature)
+        finally:
+            GDALDatasetReleaseResultSet(self.cogr_ds, cogr_result)
+
+    def end_bulk_load(self):
+        """Ends a bulk load
+
+        Builds the spatial index deferred by the load and restores the
+        relaxed settings.
+
+        Returns
+        -------
+        dict
+            Seconds spent committing transactions ('commit') and
+            building the spatial index ('spatial_index')
+        """
+        if not self._bulk_load:
+            return None
+
+        t0 = time.monotonic()
+        if self._spatial_index_deferred:
+            self._spatial_index_deferred = False
+            table = OGR_L_GetName(self.cogr_layer).decode('utf-8')
+            column = OGR_L_GetGeometryColumn(self.cogr_layer).decode('utf-8')
+            if column:
+                log.debug("Creating spatial index of %s.%s", table, column)
+                result = self.execute_sql("SELECT CreateSpatialIndex('%s', '%s')" % (
+                    table.replace("'", "''"), column.replace("'", "''")))
+                if result != '1':
+                    log.warning("Failed to create spatial index of %s.%s", table, column)
+        spatial_index_time = time.monotonic() - t0
+
+        for pragma, value in self._bulk_load_pragmas or ():
+            self.execute_sql("PRAGMA %s = %s" % (pragma, value))
+        self._bulk_load = False
+
+        timings = {'commit': self._commit_time, 'spatial_index': spatial_index_time}
+        log.info("Bulk load committed in %.3f s, spatial index built in %.3f s",
+                 timings['commit'], timings['spatial_index'])
+        return timings
+
+    cdef int create_feature(self, void *cogr_feature, object description) except -1:
+        """Create a feature in the layer, committing the transaction
+        every transaction_size features
+
+        Parameters
+        ----------
+        cogr_feature : void *
+            The OGR feature, which is not destroyed
+        description : object
+            The record or row number reported if the feature can't be
+            written
+
+        Returns
+        -------
+        int
+        """
+        cdef void *cogr_layer = self.cogr_layer
+        cdef OGRErr result
+        # Other threads may build features while OGR inserts this one.
+        with nogil:
+            result = OGR_L_CreateFeature(cogr_layer, cogr_feature)
+        if result != OGRERR_NONE:
+            raise RuntimeError("Failed to write record: %s" % description)
+
+        self._written_count += 1
+        self.extend_written_extent(OGR_F_GetGeometryRef(cogr_feature))
+
+        self._features_in_transaction += 1
+        if self._features_in_transaction == self._transaction_size:
+            self.commit_transaction("intermediate")
+            self.start_transaction("intermediate")
+        return 0
+
+    cdef void extend_written_extent(self, void *cogr_geometry):
+        """Extends the extent of the written features by the envelope
+        of a geometry"""
+        cdef OGREnvelope envelope
+        cdef OGREnvelope *written = &self._written_extent
+
+        if cogr_geometry == NULL or OGR_G_IsEmpty(cogr_geometry):
+            return
+        OGR_G_GetEnvelope(cogr_geometry, &envelope)
+        if not self._has_written_extent:
+            written[0] = envelope
+            self._has_written_extent = True
+        else:
+            written.MinX = min(written.MinX, envelope.MinX)
+            written.MinY = min(written.MinY, envelope.MinY)
+            written.MaxX = max(written.MaxX, envelope.MaxX)
+            written.MaxY = max(written.MaxY, envelope.MaxY)
+
+    def build_features(self, records, long long first, long long interval, collection):
+        """Converts records to OGR features
+
+        This is the first stage of writing. It may run in worker threads
+        while the writing thread inserts features of other batches.
+
+        Parameters
+        ----------
+        records : list
+            The records
+        first : int
+            Number in the session of the first record
+        interval : int
+            Interval between validated records, 0 for no validation
+        collection : Collection
+            The session's collection
+
+        Returns
+        -------
+        OGRFeatureBatch
+        """
+        cdef OGRFeatureBuilder builder = self._ogr_feature_builder
+        cdef OGRFeatureBatch batch = OGRFeatureBatch(records)
+
+        for record in records:
+            geometry = _normalize_geometry(record['geometry'])
+            if interval and (first + batch.count) % interval == 0:
+                self.validate_record(record, geometry, collection)
+            batch.features[batch.count] = builder.build(record, geometry)
+            batch.count += 1
+        return batch
+
+    cdef int insert_features(self, OGRFeatureBatch batch) except -1:
+        """Inserts a batch of features in the layer
+
+        This is the second stage of writing. Inserted features are
+        destroyed.
+        """
+        cdef int k
+        for k in range(batch.count):
+            self.create_feature(batch.features[k], batch.records[k])
+            _deleteOgrFeature(batch.features[k])
+            batch.features[k] = NULL
+        return 0
+
+    cdef int writerecs_pipelined(self, records, long long interval, collection) except -1:
+        """Writes records, converting them in a pool of worker threads
+
+        Chunks of WRITE_CHUNK_SIZE records are converted by
+        collection.write_workers threads. The converted batches are
+        queued in order, at most WRITE_QUEUE_CHUNKS_PER_WORKER per
+        worker, and inserted by the calling thread.
+        """
+        cdef int workers = collection.write_workers
+        cdef int maxsize = workers * WRITE_QUEUE_CHUNKS_PER_WORKER
+        cdef long long first = self._nrecords
+        records = iter(records)
+        queue = deque()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                while True:
+                    chunk = list(itertools.islice(records, WRITE_CHUNK_SIZE))
+                    if not chunk:
+                        break
+                    queue.append(executor.submit(
+                        self.build_features, chunk, first, interval, collection))
+                    first += len(chunk)
+                    if len(queue) >= maxsize:
+                        self.insert_features(queue.popleft().result())
+                while queue:
+                    self.insert_features(queue.popleft().result())
+            finally:
+                # Pending batches are discarded on error. Batches being
+                # built are destroyed when the executor has joined them.
+                for future in queue:
+                    future.cancel()
+                queue.clear()
+                self._nrecords = first
+        return 0
+
+    def writerecs(self, records, collection):
+        """Writes buffered records to OGR.
+
+        Records are validated against the collection's schema according
+        to the collection's validate mode: every record ('full'), the
+        first record and every VALIDATION_SAMPLE_INTERVAL-th record of
+        the session ('sample'), or none ('none').
+
+        If the collection has write_workers, records are converted to
+        OGR features in that many threads while this thread inserts
+        them.
+        """
+        cdef void *cogr_feature
+        cdef long long interval
+        cdef OGRFeatureBuilder builder = self._ogr_feature_builder
+
+        if self.cogr_layer == NULL:
+            raise ValueError("Null layer")
+
+        interval = self.validation_interval(collection)
+
+        self.start_transaction("initial")
+
+        if collection.write_workers:
+            self.writerecs_pipelined(records, interval, collection)
+            self.commit_transaction("final")
+            return
+
+        for record in records:
+            geometry = _normalize_geometry(record['geometry'])
+            if interval and self._nrecords % interval == 0:
+                self.validate_record(record, geometry, collection)
+            self._nrecords += 1
+
+            cogr_feature = builder.build(record, geometry)
+            try:
+                self.create_feature(cogr_feature, record)
+            finally:
+                _deleteOgrFeature(cogr_feature)
+
+        self.commit_transaction("final")
+
+    def writecols(self, columns, geometry, collection):
+        """Writes columns of records to OGR.
+
+        Integer, bool and float NumPy arrays are written from typed
+        buffers and masked values are written as nulls. Values of other
+        arrays and of sequences are set like the values of records.
+
+        Parameters
+        ----------
+        columns : mapping
+            Field names mapped to NumPy arrays or sequences of values,
+            all of the same length
+        geometry : sequence
+            WKB geometries or other geometries accepted by writerecs,
+            None for null geometries. If None, all geometries are null.
+        collection : Collection
+            The session's collection
+
+        Returns
+        -------
+        int
+            The number of records written
+        """
+        cdef OGRFeatureBuilder builder = self._ogr_feature_builder
+        cdef void *cogr_feature = NULL
+        cdef void *cogr_geometry = NULL
+        cdef void **buffers = NULL
+        cdef unsigned char **nulls = NULL
+        cdef int *field_index = NULL
+        cdef int *field_kind = NULL
+        cdef int *column_kind = NULL
+        cdef long long interval
+        cdef Py_ssize_t n
+        cdef Py_ssize_t row
+        cdef int i
+        cdef int j
+        cdef int ncols
+
+        if self.cogr_layer == NULL:
+            raise ValueError("Null layer")
+
+        names = list(columns.keys())
+        unknown = set(names) - self._schema_keys
+        if unknown:
+            raise SchemaError(
+                "Columns are not in the collection schema: %r" % sorted(unknown))
+        if collection.validate != 'none' and set(names) != self._schema_keys:
+            raise SchemaError(
+                "Columns do not match collection schema: %r != %r" % (
+                    names, list(self._schema_keys)))
+
+        lengths = set(len(columns[name]) for name in names)
+        if geometry is not None:
+            lengths.add(len(geometry))
+        if len(lengths) > 1:
+            raise ValueError("Columns and geometry must have the same length")
+        n = lengths.pop() if lengths else 0
+        if n == 0:
+            return 0
+
+        interval = self.validation_interval(collection)
+        ncols = len(names)
+        values = [None] * ncols
+        masks = []
+
+        buffers = <void **>calloc(max(ncols, 1), sizeof(void *))
+        nulls = <unsigned char **>calloc(max(ncols, 1), sizeof(unsigned char *))
+        field_index = <int *>calloc(max(ncols, 1), sizeof(int))
+        field_kind = <int *>calloc(max(ncols, 1), sizeof(int))
+        column_kind = <int *>calloc(max(ncols, 1), sizeof(int))
+
+        try:
+            if (buffers == NULL or nulls == NULL or field_index == NULL
+                    or field_kind == NULL or column_kind == NULL):
+                raise MemoryError()
+
+            for j, name in enumerate(names):
+                pos = builder.field_positions[name]
+                field_index[j] = builder.field_index[pos]
+                field_kind[j] = builder.field_kind[pos]
+                column = columns[name]
+
+                if isinstance(column, (list, tuple)):
+                    column_kind[j] = COLUMN_KIND_OBJECT
+                    values[j] = column
+                    continue
+
+                np = _import_numpy()
+                column = np.asanyarray(column)
+                mask = None
+                if np.ma.isMaskedArray(column):
+                    mask = np.ascontiguousarray(np.ma.getmaskarray(column))
+                    if mask.any():
+                        masks.append(mask)
+                        nulls[j] = <unsigned char *>_array_data(mask)
+                    else:
+                        mask = None
+                    column = column.data
+
+                if column.dtype.kind in 'iub':
+                    # Check the range before converting, as the conversion
+                    # and OGR_F_SetFieldInteger would wrap or truncate
+                    # values that writing records rejects.
+                    limits = np.iinfo('int32' if field_kind[j] == FIELD_KIND_INT32 else 'int64')
+                    valid = column if mask is None else column[~mask]
+                    if valid.size and (int(valid.min()) < limits.min or int(valid.max()) > limits.max):
+                        raise OverflowError(
+                            "Values of column %r are out of the range of %s" % (name, limits.dtype))
+                    column = np.ascontiguousarray(column, dtype='int64')
+                    column_kind[j] = COLUMN_KIND_INT
+                    buffers[j] = _array_data(column)
+                elif column.dtype.kind == 'f':
+                    column = np.ascontiguousarray(column, dtype='float64')
+                    column_kind[j] = COLUMN_KIND_FLOAT
+                    buffers[j] = _array_data(column)
+                else:
+                    column = column.tolist()
+                    column_kind[j] = COLUMN_KIND_OBJECT
+                values[j] = column
+
+            self.start_transaction("initial")
+
+            for row in range(n):
+                geom = None
+                if geometry is not None:
+                    geom = _normalize_geometry(geometry[row])
+                    if interval and geom is not None and self._nrecords % interval == 0:
+                        self.validate_geometry(geom, collection)
+                self._nrecords += 1
+
+                cogr_feature = OGR_F_Create(builder.cogr_featuredefn)
+                if cogr_feature == NULL:
+                    raise ValueError("Null feature")
+                try:
+                    cogr_geometry = NULL
+                    if isinstance(geom, bytes):
+                        cogr_geometry = _createOgrGeomFromWKB(geom)
+                    elif geom is not None:
+                        cogr_geometry = OGRGeomBuilder().build(geom)
+                    OGR_F_SetGeometryDirectly(cogr_feature, cogr_geometry)
+
+                    for j in range(ncols):
+                        i = field_index[j]
+                        if i < 0:
+                            continue
+                        if nulls[j] != NULL and nulls[j][row]:
+                            set_field_null(cogr_feature, i)
+                        elif column_kind[j] == COLUMN_KIND_INT:
+                            if field_kind[j] == FIELD_KIND_INT32:
+                                OGR_F_SetFieldInteger(cogr_feature, i, (<long long *>buffers[j])[row])
+                            else:
+                                OGR_F_SetFieldInteger64(cogr_feature, i, (<long long *>buffers[j])[row])
+                        elif column_kind[j] == COLUMN_KIND_FLOAT:
+                            OGR_F_SetFieldDouble(cogr_feature, i, (<double *>buffers[j])[row])
+                        else:
+                            builder.set_field(cogr_feature, i, field_kind[j], values[j][row])
+
+                    self.create_feature(cogr_feature, row)
+                finally:
+                    _deleteOgrFeature(cogr_feature)
+
+            self.commit_transaction("final")
+
+        finally:
+            free(buffers)
+            free(nulls)
+            free(field_index)
+            free(field_kind)
+            free(column_kind)
+
+        return n
 
     def sync(self, collection):
         """Syncs OGR to disk."""
@@ -1203,6 +2546,7 @@ cdef class Iterator:
 
     # Reference to its Collection
     cdef collection
+    cdef FeatureBuilder builder
     cdef encoding
     cdef int next_index
     cdef stop
@@ -1210,35 +2554,39 @@ cdef class Iterator:
     cdef step
     cdef fastindex
     cdef stepsign
+    cdef object prefetch_queue
+    cdef object prefetch_thread
+    cdef object prefetch_stopped
+    cdef bint prefetch_done
+    cdef bint prefetch_closed
+    cdef object bbox
+    cdef object mask
+    cdef bint with_bbox
+    cdef int precision
+    cdef long long consumed
+    cdef object __weakref__
 
     def __cinit__(self, collection, start=None, stop=None, step=None,
-                  bbox=None, mask=None):
+                  bbox=None, mask=None, prefetch=0, with_bbox=False,
+                  precision=-1, **kwargs):
         if collection.session is None:
             raise ValueError("I/O operation on closed collection")
         self.collection = collection
         cdef Session session
-        cdef void *cogr_geometry
         session = self.collection.session
         cdef void *cogr_layer = session.cogr_layer
         if cogr_layer == NULL:
             raise ValueError("Null layer")
         OGR_L_ResetReading(cogr_layer)
 
-        if bbox and mask:
-            raise ValueError("mask and bbox can not be set together")
+        session.set_spatial_filter(bbox, mask)
+        self.bbox = bbox
+        self.mask = mask
+        self.with_bbox = with_bbox
+        self.precision = -1 if precision is None else precision
 
-        if bbox:
-            OGR_L_SetSpatialFilterRect(
-                cogr_layer, bbox[0], bbox[1], bbox[2], bbox[3])
-        elif mask:
-            cogr_geometry = OGRGeomBuilder().build(mask)
-            OGR_L_SetSpatialFilter(cogr_layer, cogr_geometry)
-            OGR_G_DestroyGeometry(cogr_geometry)
-
-        else:
-            OGR_L_SetSpatialFilter(cogr_layer, NULL)
-
-        self.encoding = session._get_internal_encoding()
+        self.builder = session.get_feature_builder()
+        self.encoding = self.builder.encoding
 
         self.fastindex = OGR_L_TestCapability(
             session.cogr_layer, OLC_FASTSETNEXTBYINDEX)
@@ -1274,9 +2622,102 @@ cdef class Iterator:
         self.next_index = start
         OGR_L_SetNextByIndex(session.cogr_layer, self.next_index)
 
+        # Features are fetched by a background thread into a queue of
+        # at most prefetch features, from which they are decoded. The
+        # thread holds a weak reference to the iterator so that an
+        # abandoned iterator, and its collection, can be collected.
+        if prefetch:
+            self.prefetch_queue = queue.Queue(maxsize=prefetch)
+            self.prefetch_stopped = threading.Event()
+            self.prefetch_thread = threading.Thread(
+                target=_prefetch,
+                args=(weakref.ref(self), self.prefetch_queue, self.prefetch_stopped),
+                name="fiona-prefetch")
+            self.prefetch_thread.daemon = True
+            self.prefetch_thread.start()
+
+    def __dealloc__(self):
+        if self.prefetch_thread is not None:
+            self.prefetch_stopped.set()
+            if self.prefetch_thread is not threading.current_thread():
+                self.prefetch_thread.join()
+
     def __iter__(self):
         return self
 
+    def get_state(self):
+        """Gets the iterator's filters and cursor position
+
+        Returns
+        -------
+        dict
+            The name of the iterator's class ('iterator'), and the
+            'start', 'stop', 'step', 'bbox', 'mask', 'with_bbox' and
+            'precision' of an iterator over the features not yet consumed
+        """
+        return {
+            'iterator': type(self).__name__,
+            'start': self.start + self.consumed * self.step,
+            'stop': self.stop,
+            'step': self.step,
+            'bbox': self.bbox,
+            'mask': self.mask,
+            'with_bbox': self.with_bbox,
+            'precision': self.precision}
+
+    def is_prefetching(self):
+        """True while the prefetching thread may read the layer"""
+        return self.prefetch_thread is not None and self.prefetch_thread.is_alive()
+
+    def close(self):
+        """Stops prefetching and destroys the prefetched features
+
+        The layer may be used otherwise once the iterator is closed. An
+        iteration that was not exhausted raises IOError when continued.
+        """
+        if self.prefetch_thread is None:
+            return
+        self.prefetch_stopped.set()
+        if self.prefetch_thread is not threading.current_thread():
+            self.prefetch_thread.join()
+        self.prefetch_thread = None
+        _drain_prefetch_queue(self.prefetch_queue)
+        if not self.prefetch_done:
+            self.prefetch_closed = True
+        self.prefetch_done = True
+
+    cdef void *fetch(self) except NULL:
+        """Fetches the next feature of the iteration
+
+        The feature is taken from the prefetch queue if the iterator
+        prefetches, and is otherwise read from the layer with the GIL
+        released. Raises StopIteration at the end of the iteration.
+        """
+        cdef Session session
+        cdef void *cogr_feature = NULL
+
+        if self.prefetch_queue is not None:
+            if self.prefetch_closed:
+                raise IOError("prefetching iterator was closed before the end of its iteration")
+            if self.prefetch_done:
+                raise StopIteration
+            item = self.prefetch_queue.get()
+            if isinstance(item, integer_types):
+                self.consumed += 1
+                return <void *><uintptr_t>item
+            self.prefetch_done = True
+            if item is None:
+                raise StopIteration
+            raise item
+
+        session = self.collection.session
+        self._next()
+        cogr_feature = _get_next_feature(session.cogr_layer)
+        if cogr_feature == NULL:
+            raise StopIteration
+        self.consumed += 1
+        return cogr_feature
+
     def _next(self):
         """Internal method to set read cursor to next item"""
 
@@ -1301,7 +2742,7 @@ cdef class Iterator:
         elif self.step > 1 and not self.fastindex and not self.next_index == self.start:
             for _ in range(self.step - 1):
                 # TODO rbuffat add test -> OGR_L_GetNextFeature increments cursor by 1, therefore self.step - 1 as one increment was performed when feature is read
-                cogr_feature = OGR_L_GetNextFeature(session.cogr_layer)
+                cogr_feature = _get_next_feature(session.cogr_layer)
                 if cogr_feature == NULL:
                     raise StopIteration
         elif self.step > 1 and not self.fastindex and self.next_index == self.start:
@@ -1326,27 +2767,79 @@ cdef class Iterator:
         if not session or not session.isactive:
             raise FionaValueError("Session is inactive, dataset is closed or layer is unavailable.")
 
-        # Update read cursor
-        self._next()
-
         # Get the next feature.
-        cogr_feature = OGR_L_GetNextFeature(session.cogr_layer)
-        if cogr_feature == NULL:
-            raise StopIteration
+        cogr_feature = self.fetch()
 
         try:
-            return FeatureBuilder().build(
-                cogr_feature,
-                encoding=self.collection.session._get_internal_encoding(),
-                bbox=False,
-                driver=self.collection.driver,
-                ignore_fields=self.collection.ignore_fields,
-                ignore_geometry=self.collection.ignore_geometry,
-            )
+            return self.builder.build(cogr_feature, self.with_bbox, self.precision)
         finally:
             _deleteOgrFeature(cogr_feature)
 
 
+def _prefetch(iterator_ref, prefetch_queue, stopped):
+    """Fetches the features of an iterator into its prefetch queue
+
+    Runs in the prefetching thread until the iteration is exhausted,
+    the iterator is closed or it is collected. The iterator, and so its
+    layer, is only referenced while a feature is fetched. The queue ends
+    with None or with the exception raised by the fetch, and is drained
+    if the iterator was collected.
+    """
+    cdef Iterator iterator = None
+    cdef Session session
+    cdef void *cogr_feature = NULL
+    end = None
+
+    try:
+        while not stopped.is_set():
+            iterator = iterator_ref()
+            if iterator is None:
+                break
+            iterator._next()
+            session = iterator.collection.session
+            cogr_feature = _get_next_feature(session.cogr_layer)
+            iterator = None
+            session = None
+            if cogr_feature == NULL:
+                break
+            if not _prefetch_put(iterator_ref, prefetch_queue, stopped, <uintptr_t>cogr_feature):
+                _deleteOgrFeature(cogr_feature)
+                break
+    except StopIteration:
+        pass
+    except Exception as exc:
+        end = exc
+    iterator = None
+    session = None
+    _prefetch_put(iterator_ref, prefetch_queue, stopped, end)
+    if iterator_ref() is None:
+        _drain_prefetch_queue(prefetch_queue)
+
+
+cdef bint _prefetch_put(iterator_ref, prefetch_queue, stopped, item) except -1:
+    """Puts an item in a prefetch queue, False if the iterator was
+    closed or collected while the queue was full"""
+    while not stopped.is_set() and iterator_ref() is not None:
+        try:
+            prefetch_queue.put(item, timeout=PREFETCH_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+cdef int _drain_prefetch_queue(prefetch_queue) except -1:
+    """Destroys the features left in a prefetch queue"""
+    while True:
+        try:
+            item = prefetch_queue.get_nowait()
+        except queue.Empty:
+            break
+        if isinstance(item, integer_types):
+            _deleteOgrFeature(<void *><uintptr_t>item)
+    return 0
+
+
 cdef class ItemsIterator(Iterator):
 
     def __next__(self):
@@ -1356,24 +2849,14 @@ cdef class ItemsIterator(Iterator):
         cdef Session session
         session = self.collection.session
 
-        #Update read cursor
-        self._next()
-
         # Get the next feature.
-        cogr_feature = OGR_L_GetNextFeature(session.cogr_layer)
-        if cogr_feature == NULL:
-            raise StopIteration
+        cogr_feature = self.fetch()
 
         fid = OGR_F_GetFID(cogr_feature)
-        feature = FeatureBuilder().build(
-            cogr_feature,
-            encoding=self.collection.session._get_internal_encoding(),
-            bbox=False,
-            driver=self.collection.driver,
-            ignore_fields=self.collection.ignore_fields,
-            ignore_geometry=self.collection.ignore_geometry,
-        )
-        _deleteOgrFeature(cogr_feature)
+        try:
+            feature = self.builder.build(cogr_feature, self.with_bbox, self.precision)
+        finally:
+            _deleteOgrFeature(cogr_feature)
 
         return fid, feature
 
@@ -1386,13 +2869,8 @@ cdef class KeysIterator(Iterator):
         cdef Session session
         session = self.collection.session
 
-        #Update read cursor
-        self._next()
-
         # Get the next feature.
-        cogr_feature = OGR_L_GetNextFeature(session.cogr_layer)
-        if cogr_feature == NULL:
-            raise StopIteration
+        cogr_feature = self.fetch()
 
         fid = OGR_F_GetFID(cogr_feature)
         _deleteOgrFeature(cogr_feature)
@@ -1400,6 +2878,177 @@ cdef class KeysIterator(Iterator):
         return fid
 
 
+cdef void *_array_data(object arr) except NULL:
+    """Pointer to the data of a non-empty, contiguous NumPy array"""
+    cdef unsigned char[::1] view = arr.view('uint8')
+    return <void *>&view[0]
+
+
+cdef class BatchIterator(Iterator):
+
+    """Provides iterated access to feature data in columnar batches.
+
+    Each batch is a dict with an "fid" array of int64, a "geometry"
+    array, and a "properties" mapping of field names to arrays. Geometries
+    are WKB bytes unless the collection's geometry_format is 'wkt' or
+    'shapely'. Null geometries are None. Integer, float and bool fields
+    are returned as NumPy masked arrays where null values are masked.
+    Other fields are object arrays in which null values are None.
+    """
+
+    cdef int batch_size
+
+    def __cinit__(self, collection, start=None, stop=None, step=None,
+                  bbox=None, mask=None, batch_size=DEFAULT_BATCH_SIZE, **kwargs):
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        self.batch_size = batch_size
+
+    def get_state(self):
+        """Batch iterators are not resumed, their state is None"""
+        return None
+
+    def __next__(self):
+        cdef OGRFeatureH cogr_feature = NULL
+        cdef void *cogr_geometry = NULL
+        cdef bint owned = False
+        cdef Session session
+        cdef void **buffers = NULL
+        cdef unsigned char **nulls = NULL
+        cdef long long *fid_buffer = NULL
+        cdef int i
+        cdef int j
+        cdef int kind
+        cdef int n = 0
+        cdef FeatureBuilder builder = self.builder
+
+        session = self.collection.session
+
+        if not session or not session.isactive():
+            raise FionaValueError("Session is inactive, dataset is closed or layer is unavailable.")
+
+        np = _import_numpy()
+
+        encoding = builder.encoding
+        driver = builder.driver
+        ignore_geometry = builder.ignore_geometry
+
+        fids = np.zeros(self.batch_size, dtype='int64')
+        geometries = np.empty(self.batch_size, dtype=object)
+        columns = []
+        masks = []
+
+        buffers = <void **>malloc(max(builder.nfields, 1) * sizeof(void *))
+        nulls = <unsigned char **>malloc(max(builder.nfields, 1) * sizeof(unsigned char *))
+        if buffers == NULL or nulls == NULL:
+            free(buffers)
+            free(nulls)
+            raise MemoryError()
+
+        try:
+            fid_buffer = <long long *>_array_data(fids)
+
+            for j in range(builder.nfields):
+                kind = builder.field_kind[j]
+                if kind == FIELD_KIND_INT32:
+                    column = np.zeros(self.batch_size, dtype='int32')
+                elif kind == FIELD_KIND_INT64:
+                    column = np.zeros(self.batch_size, dtype='int64')
+                elif kind == FIELD_KIND_FLOAT:
+                    column = np.zeros(self.batch_size, dtype='float64')
+                elif kind == FIELD_KIND_BOOL:
+                    column = np.zeros(self.batch_size, dtype='bool')
+                else:
+                    column = np.empty(self.batch_size, dtype=object)
+                null_mask = np.zeros(self.batch_size, dtype='bool')
+                columns.append(column)
+                masks.append(null_mask)
+                if kind <= FIELD_KIND_BOOL:
+                    buffers[j] = _array_data(column)
+                else:
+                    buffers[j] = NULL
+                nulls[j] = <unsigned char *>_array_data(null_mask)
+
+            while n < self.batch_size:
+
+                # Update read cursor
+                try:
+                    self._next()
+                except StopIteration:
+                    break
+
+                # Get the next feature.
+                cogr_feature = _get_next_feature(session.cogr_layer)
+                if cogr_feature == NULL:
+                    break
+
+                try:
+                    fid_buffer[n] = OGR_F_GetFID(cogr_feature)
+
+                    for j in range(builder.nfields):
+                        i = builder.field_index[j]
+                        kind = builder.field_kind[j]
+
+                        if is_field_null(cogr_feature, i):
+                            nulls[j][n] = 1
+                        elif kind == FIELD_KIND_INT32:
+                            (<int *>buffers[j])[n] = OGR_F_GetFieldAsInteger(cogr_feature, i)
+                        elif kind == FIELD_KIND_INT64:
+                            (<long long *>buffers[j])[n] = OGR_F_GetFieldAsInteger64(cogr_feature, i)
+                        elif kind == FIELD_KIND_FLOAT:
+                            (<double *>buffers[j])[n] = OGR_F_GetFieldAsDouble(cogr_feature, i)
+                        elif kind == FIELD_KIND_BOOL:
+                            (<unsigned char *>buffers[j])[n] = OGR_F_GetFieldAsInteger64(cogr_feature, i) != 0
+                        else:
+                            columns[j][n] = get_field_value(cogr_feature, i, kind, encoding, driver)
+
+                    if not ignore_geometry:
+                        cogr_geometry = builder.get_geometry(cogr_feature, &owned)
+                        if cogr_geometry != NULL:
+                            try:
+                                builder.transform_geometry(cogr_geometry)
+                                if builder.geometry_format == GEOMETRY_FORMAT_WKT:
+                                    geometries[n] = ogr_geometry_wkt(cogr_geometry)
+                                else:
+                                    geometries[n] = ogr_geometry_wkb(cogr_geometry)
+                            finally:
+                                if owned:
+                                    OGR_G_DestroyGeometry(cogr_geometry)
+
+                finally:
+                    _deleteOgrFeature(cogr_feature)
+
+                n += 1
+
+        finally:
+            free(buffers)
+            free(nulls)
+
+        if n == 0:
+            raise StopIteration
+
+        properties = OrderedDict()
+        for j in range(builder.nfields):
+            if builder.field_kind[j] <= FIELD_KIND_BOOL:
+                properties[builder.field_keys[j]] = np.ma.MaskedArray(
+                    columns[j][:n], mask=masks[j][:n])
+            else:
+                properties[builder.field_keys[j]] = columns[j][:n]
+
+        if ignore_geometry:
+            geometries = None
+        elif builder.geometry_format == GEOMETRY_FORMAT_SHAPELY:
+            geometries = _shapely_from_wkb(geometries[:n])
+        else:
+            geometries = geometries[:n]
+
+        return {
+            "fid": fids[:n],
+            "geometry": geometries,
+            "properties": properties,
+        }
+
+
 def _remove(path, driver=None):
     """Deletes an OGR data source
     """
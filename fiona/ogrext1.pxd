@@ -206,6 +206,7 @@ cdef extern from "ogr_api.h":
     void *  OGR_FD_Create (char *name)
     int     OGR_FD_GetFieldCount (void *featuredefn)
     void *  OGR_FD_GetFieldDefn (void *featuredefn, int n)
+    int     OGR_FD_GetFieldIndex (void *featuredefn, char *name)
     int     OGR_FD_GetGeomType (void *featuredefn)
     char *  OGR_FD_GetName (void *featuredefn)
     void *  OGR_Fld_Create (char *name, OGRFieldType fieldtype)
@@ -225,28 +226,33 @@ cdef extern from "ogr_api.h":
     void    OGR_G_DestroyGeometry (void *geometry)
     unsigned char *  OGR_G_ExportToJson (void *geometry)
     void    OGR_G_ExportToWkb (void *geometry, int endianness, char *buffer)
+    int     OGR_G_ExportToWkt (void *geometry, char **wkt)
     int     OGR_G_GetCoordinateDimension (void *geometry)
+    void    OGR_G_GetEnvelope (void *geometry, void *envelope)
     int     OGR_G_GetGeometryCount (void *geometry)
     unsigned char *  OGR_G_GetGeometryName (void *geometry)
     int     OGR_G_GetGeometryType (void *geometry)
     void *  OGR_G_GetGeometryRef (void *geometry, int n)
     int     OGR_G_GetPointCount (void *geometry)
+    int     OGR_G_IsEmpty (void *geometry)
     double  OGR_G_GetX (void *geometry, int n)
     double  OGR_G_GetY (void *geometry, int n)
     double  OGR_G_GetZ (void *geometry, int n)
     void    OGR_G_ImportFromWkb (void *geometry, unsigned char *bytes, int nbytes)
     int     OGR_G_WkbSize (void *geometry)
+    OGRErr  OGR_G_Transform (void *geometry, void *ct)
     void *  OGR_G_ForceToMultiPolygon (void *geometry)
     void *  OGR_G_ForceToPolygon (void *geometry)
     void *  OGR_G_Clone(void *geometry)
-    OGRErr  OGR_L_CreateFeature (void *layer, void *feature)
+    OGRErr  OGR_L_CreateFeature (void *layer, void *feature) nogil
     OGRErr  OGR_L_CreateField (void *layer, void *fielddefn, int flexible)
     OGRErr  OGR_L_GetExtent (void *layer, void *extent, int force)
     void *  OGR_L_GetFeature (void *layer, int n)
+    const char * OGR_L_GetGeometryColumn (void *layer)
     int     OGR_L_GetFeatureCount (void *layer, int m)
     void *  OGR_L_GetLayerDefn (void *layer)
     char *  OGR_L_GetName (void *layer)
-    void *  OGR_L_GetNextFeature (void *layer)
+    void *  OGR_L_GetNextFeature (void *layer) nogil
     void *  OGR_L_GetSpatialFilter (void *layer)
     void *  OGR_L_GetSpatialRef (void *layer)
     void    OGR_L_ResetReading (void *layer)
@@ -0,0 +1,200 @@
+"""Parallel reading of the partitions of a layer
+
+A layer is split into partitions by Collection.partitions(). Partitions
+are small picklable descriptors that are opened independently, for
+example in the processes of a pool. Functions mapped over partitions
+must be picklable, for example defined at the top level of a module:
+
+  >>> from fiona.parallel import map_partitions
+  >>> from mymodule import count_features
+  >>> sum(map_partitions('tests/data/coutwildrnp.shp', count_features, processes=4))
+  67
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import math
+import numbers
+import os
+
+import fiona
+
+
+log = logging.getLogger(__name__)
+
+
+class Partition(object):
+    """A part of a layer that can be read independently
+
+    A partition is either a range of feature indexes, optionally
+    filtered by a ``bbox`` or a ``mask``, or a ``tile`` of the layer's
+    extent. A tile holds the features whose first vertex lies within
+    it. The tiles along the edges of the extent are unbounded on those
+    edges, so that features outside of the extent, for example added
+    since the partitioning, are in a tile. Features without geometry
+    are not in any tile.
+
+    Attributes
+    ----------
+    path : str
+        Path of the dataset
+    layer : str or int
+        Name or index of the layer
+    index : int
+        Number of the partition
+    start, stop : int or None
+        Range of feature indexes of the partition
+    bbox : tuple or None
+        A (minx, miny, maxx, maxy) spatial filter
+    mask : dict or None
+        A GeoJSON-like geometry spatial filter
+    tile : tuple or None
+        A (minx, miny, maxx, maxy) tile, which excludes its maximum
+        edges. Unbounded edges are infinite.
+    options : dict
+        Keyword arguments of fiona.open()
+    """
+
+    def __init__(self, path, layer=None, index=0, start=None, stop=None,
+                 bbox=None, mask=None, tile=None, options=None):
+        self.path = path
+        self.layer = layer
+        self.index = index
+        self.start = start
+        self.stop = stop
+        self.bbox = bbox
+        self.mask = mask
+        self.tile = tile
+        self.options = options or {}
+
+    def __repr__(self):
+        if self.tile is not None:
+            part = "tile=%r" % (self.tile,)
+        else:
+            part = "start=%r, stop=%r" % (self.start, self.stop)
+        return "<Partition %d of '%s:%s', %s>" % (
+            self.index, self.path, self.layer, part)
+
+    def open(self):
+        """Opens the partition's collection"""
+        return fiona.open(self.path, layer=self.layer, **self.options)
+
+    def items(self):
+        """Returns an iterator over the FID, record pairs of the
+        partition"""
+        with self.open() as src:
+            if self.tile is None:
+                for item in src.items(
+                        self.start, self.stop, bbox=self.bbox, mask=self.mask):
+                    yield item
+            else:
+                for fid, feature in src.items(bbox=self._filter(src)):
+                    if self.contains(feature['geometry']):
+                        yield fid, feature
+
+    def _filter(self, src):
+        """The tile's spatial filter: the tile with its unbounded edges
+        at those of the extent of the layer when it is read, or None if
+        the layer has no extent"""
+        if not any(math.isinf(v) for v in self.tile):
+            return self.tile
+        extent = src.bounds
+        if extent is None:
+            return None
+        minx, miny, maxx, maxy = self.tile
+        return (
+            min(extent[0], maxx) if math.isinf(minx) else minx,
+            min(extent[1], maxy) if math.isinf(miny) else miny,
+            max(extent[2], minx) if math.isinf(maxx) else maxx,
+            max(extent[3], miny) if math.isinf(maxy) else maxy)
+
+    def __iter__(self):
+        for fid, feature in self.items():
+            yield feature
+
+    def contains(self, geometry):
+        """True if the first vertex of a GeoJSON-like geometry is in the
+        partition's tile"""
+        x, y = _first_vertex(geometry)[:2]
+        minx, miny, maxx, maxy = self.tile
+        return minx <= x < maxx and miny <= y < maxy
+
+
+def _first_vertex(geometry):
+    """The first vertex of a GeoJSON-like geometry"""
+    while geometry['type'] == 'GeometryCollection':
+        geometry = geometry['geometries'][0]
+    coordinates = geometry['coordinates']
+    while not isinstance(coordinates[0], numbers.Number):
+        coordinates = coordinates[0]
+    return coordinates
+
+
+def index_partitions(n, count):
+    """Splits count feature indexes into n (start, stop) ranges
+
+    The stop of the last range is None so that features added since
+    the count are included.
+    """
+    bounds = [i * count // n for i in range(n)] + [None]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def tile_partitions(n, extent):
+    """Splits an extent into n tiles of a grid
+
+    The grid has as many rows as the largest divisor of n that is not
+    larger than its square root. The edges of the tiles along the edges
+    of the extent are infinite, so that the tiles cover the plane.
+    """
+    rows = max(d for d in range(1, int(math.sqrt(n)) + 1) if n % d == 0)
+    cols = n // rows
+    minx, miny, maxx, maxy = extent
+    dx = (maxx - minx) / cols
+    dy = (maxy - miny) / rows
+    tiles = []
+    for row in range(rows):
+        for col in range(cols):
+            tiles.append((
+                -math.inf if col == 0 else minx + col * dx,
+                -math.inf if row == 0 else miny + row * dy,
+                math.inf if col == cols - 1 else minx + (col + 1) * dx,
+                math.inf if row == rows - 1 else miny + (row + 1) * dy))
+    return tiles
+
+
+def map_partitions(path, func, processes=None, partitions=None, by='index',
+                   layer=None, **kwargs):
+    """Runs a function over every partition of a layer in a pool of
+    processes
+
+    Parameters
+    ----------
+    path : str
+        Path of the dataset
+    func : callable
+        A picklable function of a Partition
+    processes : int, optional
+        Number of processes, by default the number of CPUs
+    partitions : int, optional
+        Number of partitions, by default the number of processes
+    by : str
+        'index' or 'bbox', see Collection.partitions()
+    layer : str or int, optional
+        Name or index of the layer
+    kwargs : dict
+        Keyword arguments of fiona.open()
+
+    Yields
+    ------
+    object
+        The results of the function, in the order of the partitions
+    """
+    processes = processes or os.cpu_count()
+    with fiona.open(path, layer=layer, **kwargs) as src:
+        parts = src.partitions(partitions or processes, by=by)
+    log.debug("Mapping %r over %d partitions in %d processes",
+              func, len(parts), processes)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for result in executor.map(func, parts):
+            yield result
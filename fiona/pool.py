@@ -0,0 +1,188 @@
+"""A pool of datasets opened in read-only mode
+
+Opening a dataset probes drivers and reads its metadata. Services that
+open the same datasets many times can share opened datasets through a
+pool:
+
+  >>> from fiona.pool import DatasetPool
+  >>> pool = DatasetPool(max_open=100, ttl=300)
+  >>> with pool.open('tests/data/coutwildrnp.shp') as src:
+  ...     print(len(src))
+  67
+
+Collections opened with a pool lease a dataset from it instead of
+opening one and return it to the pool when they are closed.
+"""
+
+from collections import OrderedDict
+import logging
+import os
+import threading
+import time
+import weakref
+
+import fiona
+from fiona.ogrext import DatasetHandle
+
+
+log = logging.getLogger(__name__)
+
+# Pools, whose datasets are detached in forked child processes.
+_pools = weakref.WeakSet()
+
+
+class DatasetPool(object):
+    """A process-wide pool of datasets opened in 'r' mode
+
+    Datasets are keyed by their path, drivers and open options. A
+    dataset is leased to one collection, and so to one thread, at a
+    time: if all the datasets of a key are leased, another one is
+    opened. Released datasets are kept open, up to ``max_open`` of them,
+    and the least recently used ones are closed first. Datasets that
+    have been idle for more than ``ttl`` seconds, or whose file has been
+    modified since they were opened, are closed instead of being leased.
+
+    Parameters
+    ----------
+    max_open : int
+        Maximum number of idle datasets kept open
+    ttl : float, optional
+        Seconds after which an idle dataset is closed
+
+    Attributes
+    ----------
+    hits : int
+        Number of leases of an open dataset
+    misses : int
+        Number of leases for which a dataset was opened
+    """
+
+    def __init__(self, max_open=64, ttl=None):
+        if max_open < 0:
+            raise ValueError("invalid max_open: %r" % max_open)
+        self.max_open = max_open
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._idle = {}
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        _pools.add(self)
+
+    def __len__(self):
+        """Number of idle datasets"""
+        return len(self._lru)
+
+    def __repr__(self):
+        return "<DatasetPool idle=%d hits=%d misses=%d>" % (
+            len(self), self.hits, self.misses)
+
+    def open(self, path, **kwargs):
+        """Opens a collection in 'r' mode with a dataset of the pool
+
+        Parameters are those of fiona.open().
+        """
+        return fiona.open(path, 'r', pool=self, **kwargs)
+
+    def acquire(self, path, drivers=None, options=None):
+        """Leases a dataset
+
+        Parameters
+        ----------
+        path : str
+            The dataset's GDAL path
+        drivers : iterable of str, optional
+            Drivers that may open the dataset
+        options : dict, optional
+            Open options of the dataset
+
+        Returns
+        -------
+        DatasetHandle
+        """
+        key = (path, tuple(sorted(drivers)) if drivers else None,
+               tuple(sorted((k, str(v)) for k, v in (options or {}).items())))
+        mtime = _mtime(path)
+
+        with self._lock:
+            self._expire()
+            handles = self._idle.get(key, [])
+            while handles:
+                handle = handles.pop()
+                del self._lru[handle]
+                if handle.mtime == mtime:
+                    self.hits += 1
+                    if not handles:
+                        del self._idle[key]
+                    return handle
+                log.debug("Closing stale dataset %s", path)
+                handle.close()
+            self._idle.pop(key, None)
+            self.misses += 1
+
+        handle = DatasetHandle(path, drivers, options)
+        handle.key = key
+        handle.mtime = mtime
+        return handle
+
+    def release(self, handle):
+        """Returns a leased dataset to the pool"""
+        handle.reset()
+        handle.released = time.monotonic()
+        with self._lock:
+            self._idle.setdefault(handle.key, []).append(handle)
+            self._lru[handle] = None
+            while len(self._lru) > self.max_open:
+                self._evict(next(iter(self._lru)))
+            self._expire()
+
+    def clear(self):
+        """Closes the idle datasets"""
+        with self._lock:
+            while self._lru:
+                self._evict(next(iter(self._lru)))
+
+    def _evict(self, handle):
+        """Closes an idle dataset"""
+        del self._lru[handle]
+        handles = self._idle[handle.key]
+        handles.remove(handle)
+        if not handles:
+            del self._idle[handle.key]
+        handle.close()
+
+    def _expire(self):
+        """Closes the datasets idle for more than ttl seconds"""
+        if self.ttl is None:
+            return
+        now = time.monotonic()
+        while self._lru:
+            handle = next(iter(self._lru))
+            if now - handle.released <= self.ttl:
+                break
+            self._evict(handle)
+
+    def _after_fork(self):
+        """Forgets the datasets inherited from the parent process"""
+        for handle in self._lru:
+            handle.detach()
+        self._idle = {}
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+
+
+def _mtime(path):
+    """Modification time of a file, None if it is not a local file"""
+    try:
+        return os.stat(path).st_mtime
+    except (OSError, ValueError):
+        return None
+
+
+def _after_fork_in_child():
+    for pool in list(_pools):
+        pool._after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
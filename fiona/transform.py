@@ -1,9 +1,19 @@
-"""Coordinate and geometry warping and reprojection"""
+"""Coordinate and geometry warping and reprojection
 
-from fiona._transform import _transform, _transform_geom
+The transform() and transform_geom() functions reuse the transformations
+of the most recently used pairs of CRS of the calling thread. A
+Transformer can also be kept for a pair of CRS:
 
+  >>> transformer = Transformer('EPSG:4326', 'EPSG:26953')
+  >>> transformer.transform_geom({'type': 'Point', 'coordinates': [-105.0, 40.0]})
+  {'type': 'Point', 'coordinates': (957097.0952383667, 378940.8419189212)}
+"""
 
-def transform(src_crs, dst_crs, xs, ys):
+from fiona._transform import (
+    _transform, _transform_geom, get_transformer, Transformer)
+
+
+def transform(src_crs, dst_crs, xs, ys, zs=None, out=None):
     """Transform coordinates from one reference system to another.
 
     Parameters
@@ -17,18 +27,32 @@ def transform(src_crs, dst_crs, xs, ys):
         A string or dict representing the coordinate reference system
         on the "destination" or "to" side of the transformation.
     xs: sequence of float
-        A list or tuple of x coordinate values. Must have the same
-        length as the ``ys`` parameter.
+        A list or tuple of x coordinate values, or a buffer of doubles
+        such as a NumPy float64 array or an array('d'). Must have the
+        same length as the ``ys`` parameter.
     ys: sequence of float
-        A list or tuple of y coordinate values. Must have the same
-        length as the ``xs`` parameter.
+        A list or tuple of y coordinate values, or a buffer of doubles.
+        Must have the same length as the ``xs`` parameter.
+    zs: sequence of float, optional
+        A list or tuple of z coordinate values, or a buffer of doubles.
+        Must have the same length as the ``xs`` parameter.
+    out: tuple, optional
+        Writable contiguous buffers of doubles, one for each of ``xs``,
+        ``ys`` and ``zs``, into which the transformed coordinates are
+        written. Passing the input buffers transforms them in place.
 
     Returns
     -------
-    xp, yp: list of float
-        A pair of transformed coordinate sequences. The elements of
-        ``xp`` and ``yp`` correspond exactly to the elements of the
-        ``xs`` and ``ys`` input parameters.
+    xp, yp[, zp]: list of float or buffers
+        The transformed coordinate sequences: the buffers of ``out`` if
+        given, copies of the input buffers for buffer inputs, lists
+        otherwise. Their elements correspond exactly to the elements of
+        the input parameters.
+
+    Notes
+    -----
+    The GIL is released while the coordinates are transformed, so that
+    several threads can transform coordinates concurrently.
 
     Examples
     --------
@@ -38,7 +62,7 @@ def transform(src_crs, dst_crs, xs, ys):
 
     """
     # Function is implemented in the _transform C extension module.
-    return _transform(src_crs, dst_crs, xs, ys)
+    return _transform(src_crs, dst_crs, xs, ys, zs, out)
 
 
 def transform_geom(
@@ -90,3 +114,60 @@ def transform_geom(
     return _transform_geom(
         src_crs, dst_crs, geom,
         antimeridian_cutting, antimeridian_offset, precision)
+
+
+def transform_geoms(
+        src_crs, dst_crs, geoms,
+        antimeridian_cutting=False, antimeridian_offset=10.0, precision=-1):
+    """Transform geometries from one reference system to another.
+
+    Parameters
+    ----------
+    src_crs: str or dict
+        A string like 'EPSG:4326' or a dict of proj4 parameters
+        representing the coordinate reference system on the "source"
+        or "from" side of the transformation.
+    dst_crs: str or dict
+        A string or dict representing the coordinate reference system
+        on the "destination" or "to" side of the transformation.
+    geoms: iterable
+        GeoJSON-like geometry objects, WKB bytes, objects with a ``wkb``
+        attribute such as shapely geometries, or None.
+    antimeridian_cutting: bool, optional
+        ``True`` to cut output geometries in two at the antimeridian,
+        the default is ``False`.
+    antimeridian_offset: float, optional
+        A distance in decimal degrees from the antimeridian, outside of
+        which geometries will not be cut.
+    precision: int, optional
+        Optional rounding precision of output coordinates, in number
+        of decimal places.
+
+    Returns
+    -------
+    list or iterator
+        The transformed geometries, as GeoJSON-like geometries, WKB
+        bytes, or objects of the input's type. A list is returned for a
+        list or tuple of geometries, otherwise an iterator.
+
+    Notes
+    -----
+    All the geometries are transformed with the same transformation
+    and, unless they are cut at the antimeridian, the vertices of
+    batches of GeoJSON-like geometries are transformed together.
+
+    Examples
+    --------
+
+    >>> transform_geoms(
+    ...     'EPSG:4326', 'EPSG:26953',
+    ...     [{'type': 'Point', 'coordinates': [-105.0, 40.0]}])
+    [{'type': 'Point', 'coordinates': (957097.0952383667, 378940.8419189212)}]
+
+    """
+    transformer = get_transformer(
+        src_crs, dst_crs, antimeridian_cutting, antimeridian_offset)
+    results = transformer.transform_geoms(geoms, precision)
+    if isinstance(geoms, (list, tuple)):
+        return list(results)
+    return results
@@ -66,7 +66,8 @@ class sdist_multi_gdal(sdist):
             "_shim1": "_shim",
             "_shim2": "_shim",
             "_shim22": "_shim",
-            "_shim3": "_shim"
+            "_shim3": "_shim",
+            "_shim36": "_shim"
         }
         for src_a, src_b in sources.items():
             shutil.copy('fiona/{}.pyx'.format(src_a), 'fiona/{}.pyx'.format(src_b))
@@ -214,8 +215,13 @@ if source_is_repo and "clean" not in sys.argv:
             shutil.copy('fiona/_shim2.pyx', 'fiona/_shim.pyx')
             shutil.copy('fiona/_shim2.pxd', 'fiona/_shim.pxd')
     elif gdal_major_version == 3:
-        shutil.copy('fiona/_shim3.pyx', 'fiona/_shim.pyx')
-        shutil.copy('fiona/_shim3.pxd', 'fiona/_shim.pxd')
+        if gdal_minor_version >= 6:
+            log.info("Building Fiona for gdal 3.6+: {0}".format(gdalversion))
+            shutil.copy('fiona/_shim36.pyx', 'fiona/_shim.pyx')
+            shutil.copy('fiona/_shim36.pxd', 'fiona/_shim.pxd')
+        else:
+            shutil.copy('fiona/_shim3.pyx', 'fiona/_shim.pyx')
+            shutil.copy('fiona/_shim3.pxd', 'fiona/_shim.pxd')
 
     ext_modules = cythonize([
         Extension('fiona._geometry', ['fiona/_geometry.pyx'], **ext_options),
@@ -256,9 +262,14 @@ elif "clean" not in sys.argv:
             ext_modules.append(
                 Extension('fiona._shim', ['fiona/_shim2.c'], **ext_options))
     elif gdal_major_version == 3:
-        log.info("Building Fiona for gdal >= 3.0.x: {0}".format(gdalversion))
-        ext_modules.append(
-            Extension('fiona._shim', ['fiona/_shim3.c'], **ext_options))
+        if gdal_minor_version >= 6:
+            log.info("Building Fiona for gdal >= 3.6.x: {0}".format(gdalversion))
+            ext_modules.append(
+                Extension('fiona._shim', ['fiona/_shim36.c'], **ext_options))
+        else:
+            log.info("Building Fiona for gdal >= 3.0.x: {0}".format(gdalversion))
+            ext_modules.append(
+                Extension('fiona._shim', ['fiona/_shim3.c'], **ext_options))
 
 requirements = [
     'attrs>=17',
@@ -271,6 +282,8 @@ requirements = [
 
 extras_require = {
     'calc': ['shapely'],
+    'numpy': ['numpy'],
+    'arrow': ['pyarrow'],
     's3': ['boto3>=1.2.4'],
     'test': ['pytest>=3', 'pytest-cov', 'boto3>=1.2.4', 'mock; python_version<"3.4"']
 }
@@ -196,6 +196,32 @@ def feature_seq_pp_rs():
     return _read_file(os.path.join('data', 'sequence-pp.txt'))
 
 
+@pytest.fixture
+def points_schema():
+    """Schema of the point layers written by tests of writing"""
+    return {
+        'geometry': 'Point',
+        'properties': {'title': 'str', 'count': 'int', 'value': 'float',
+                       'flag': 'bool'}}
+
+
+@pytest.fixture(scope='session')
+def points():
+    """Returns a factory of records matching ``points_schema``
+
+    ``points(n, start=0)`` is a list of n records whose coordinates and
+    values are derived from their index i: point (i, i), title 'r<i>',
+    count i, value i / 2 and flag i % 2 == 0.
+    """
+    def points(n, start=0):
+        return [
+            {'geometry': {'type': 'Point', 'coordinates': (float(i), float(i))},
+             'properties': {'title': 'r%d' % i, 'count': i, 'value': i / 2.0,
+                            'flag': i % 2 == 0}}
+            for i in range(start, start + n)]
+    return points
+
+
 @pytest.fixture(scope='session')
 def runner():
     """Returns a ```click.testing.CliRunner()`` instance."""
@@ -272,6 +298,10 @@ requires_gdal3 = pytest.mark.skipif(
     not gdal_version.major >= 3,
     reason="Requires GDAL 3.x")
 
+requires_gdal36 = pytest.mark.skipif(
+    not gdal_version.at_least('3.6'),
+    reason="Requires GDAL 3.6.x")
+
 
 @pytest.fixture(scope="class")
 def unittest_data_dir(data_dir, request):
@@ -0,0 +1,74 @@
+"""Tests of Arrow stream export"""
+
+import pytest
+
+import fiona
+from fiona._geometry import GeomBuilder
+from fiona.errors import GDALVersionError
+
+from .conftest import requires_gdal36, gdal_version
+
+pa = pytest.importorskip("pyarrow")
+
+
+@requires_gdal36
+def test_to_arrow(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        records = list(src)
+        table = src.to_arrow()
+
+    assert table.num_rows == len(records)
+    assert table.column('NAME').to_pylist() == [
+        rec['properties']['NAME'] for rec in records]
+    geom_column = [name for name in table.column_names if 'geom' in name.lower()][0]
+    for wkb, rec in zip(table.column(geom_column).to_pylist(), records):
+        assert GeomBuilder().build_wkb(wkb) == rec['geometry']
+
+
+@requires_gdal36
+def test_iter_arrow_batches(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        batches = list(src.iter_arrow_batches(batch_size=10))
+        assert sum(batch.num_rows for batch in batches) == len(src)
+        assert max(batch.num_rows for batch in batches) <= 10
+
+
+@requires_gdal36
+def test_arrow_ignore_fields_and_geometry(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp, ignore_fields=['NAME'],
+                    ignore_geometry=True) as src:
+        table = src.to_arrow()
+        assert 'NAME' not in table.column_names
+        assert not [name for name in table.column_names if 'geom' in name.lower()]
+
+
+@requires_gdal36
+def test_arrow_bbox(path_coutwildrnp_shp):
+    bbox = (-107.0, 37.0, -105.0, 39.0)
+    with fiona.open(path_coutwildrnp_shp) as src:
+        expected = len(list(src.filter(bbox=bbox)))
+        assert src.to_arrow(bbox=bbox).num_rows == expected
+
+
+@pytest.mark.skipif(gdal_version.at_least('3.6'), reason="Requires GDAL < 3.6")
+def test_arrow_gdal_version(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        with pytest.raises(GDALVersionError):
+            src.to_arrow()
+
+
+@requires_gdal36
+@pytest.mark.parametrize('use', [
+    len, lambda src: src[3], lambda src: src.get(3), lambda src: 3 in src,
+    lambda src: src.bounds])
+def test_arrow_stream_closed_by_layer_use(path_coutwildrnp_shp, use):
+    """Methods that use the layer close an open Arrow stream first"""
+    with fiona.open(path_coutwildrnp_shp) as src:
+        expected = use(src)
+    with fiona.open(path_coutwildrnp_shp) as src:
+        batches = src.iter_arrow_batches(batch_size=10)
+        next(batches)
+        assert use(src) == expected
+        assert src._arrow_reader is None
+        with pytest.raises(pa.ArrowException):
+            next(batches)
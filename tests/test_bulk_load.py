@@ -0,0 +1,74 @@
+"""Tests of transaction sizes and bulk loads"""
+
+import sqlite3
+
+import pytest
+
+import fiona
+from fiona.errors import DriverSupportError
+
+
+def test_transaction_size(tmpdir, points_schema, points):
+    path = str(tmpdir.join('test.gpkg'))
+    with fiona.open(path, 'w', driver='GPKG', schema=points_schema,
+                    transaction_size=7) as dst:
+        assert dst.transaction_size == 7
+        dst.writerecords(points(50))
+    with fiona.open(path) as src:
+        assert len(src) == 50
+
+
+@pytest.mark.parametrize('transaction_size', [0, -1, 1.5, None])
+def test_transaction_size_invalid(tmpdir, points_schema, transaction_size):
+    with pytest.raises(ValueError):
+        fiona.open(str(tmpdir.join('test.gpkg')), 'w',
+                   driver='GPKG', schema=points_schema,
+                   transaction_size=transaction_size)
+
+
+def test_bulk_load(tmpdir, points_schema, points):
+    """The spatial index is built at close"""
+    path = str(tmpdir.join('test.gpkg'))
+    with fiona.open(path, 'w', driver='GPKG', schema=points_schema,
+                    bulk_load=True, layer='points') as dst:
+        dst.writerecords(points(100))
+        assert dst.bulk_load_timings is None
+    timings = dst.bulk_load_timings
+    assert sorted(timings) == ['commit', 'spatial_index']
+    assert all(t >= 0.0 for t in timings.values())
+
+    conn = sqlite3.connect(path)
+    try:
+        extensions = conn.execute(
+            "SELECT extension_name FROM gpkg_extensions "
+            "WHERE table_name = 'points'").fetchall()
+        assert ('gpkg_rtree_index',) in extensions
+        assert conn.execute("SELECT count(*) FROM rtree_points_geom").fetchone() == (100,)
+    finally:
+        conn.close()
+
+    with fiona.open(path) as src:
+        assert len(src) == 100
+        assert src.bounds == (0.0, 0.0, 99.0, 99.0)
+
+
+def test_bulk_load_append(tmpdir, points_schema, points):
+    path = str(tmpdir.join('test.gpkg'))
+    with fiona.open(path, 'w', driver='GPKG', schema=points_schema) as dst:
+        dst.writerecords(points(10))
+    with fiona.open(path, 'a', bulk_load=True) as dst:
+        dst.writerecords(points(10))
+    assert dst.bulk_load_timings['spatial_index'] >= 0.0
+    with fiona.open(path) as src:
+        assert len(src) == 20
+
+
+def test_bulk_load_unsupported_driver(tmpdir):
+    with pytest.raises(DriverSupportError):
+        fiona.open(str(tmpdir.join('test.shp')), 'w', driver='ESRI Shapefile',
+                   schema={'geometry': 'Point', 'properties': {}}, bulk_load=True)
+
+
+def test_bulk_load_read_mode(path_coutwildrnp_shp):
+    with pytest.raises(ValueError):
+        fiona.open(path_coutwildrnp_shp, bulk_load=True)
@@ -0,0 +1,94 @@
+"""Tests of reading collections in a destination CRS"""
+
+import re
+
+import pytest
+
+import fiona
+from fiona.errors import CRSError
+from fiona.transform import transform_geom, Transformer
+
+
+def test_geometries_transformed(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        src_crs = src.crs
+        expected = [f['geometry'] for f in src]
+    with fiona.open(path_coutwildrnp_shp, dst_crs='EPSG:3857') as src:
+        for feature, geometry in zip(src, expected):
+            g = transform_geom(src_crs, 'EPSG:3857', geometry)
+            assert feature['geometry']['type'] == g['type']
+            assert fiona.bounds(feature) == pytest.approx(fiona.bounds(g))
+
+
+def test_crs(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp, dst_crs='EPSG:3857') as src:
+        assert src.crs == {'init': 'epsg:3857'}
+        assert 'Pseudo-Mercator' in src.crs_wkt
+
+
+def test_bounds(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        bounds = src.bounds
+        src_crs = src.crs
+    with fiona.open(path_coutwildrnp_shp, dst_crs='EPSG:3857') as src:
+        expected = Transformer(src_crs, 'EPSG:3857').transform_bounds(bounds)
+        assert src.bounds == pytest.approx(expected)
+        minx, miny, maxx, maxy = src.bounds
+        for feature in src.filter(with_bbox=True):
+            fminx, fminy, fmaxx, fmaxy = feature['bbox']
+            assert minx <= fminx and fmaxx <= maxx
+            assert miny <= fminy and fmaxy <= maxy
+
+
+def test_bbox_filter(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        src_crs = src.crs
+        expected = [fid for fid, f in src.items(bbox=(-107.0, 37.0, -105.0, 39.0))]
+    bbox = Transformer(src_crs, 'EPSG:3857').transform_bounds((-107.0, 37.0, -105.0, 39.0))
+    with fiona.open(path_coutwildrnp_shp, dst_crs='EPSG:3857') as src:
+        fids = [fid for fid, f in src.items(bbox=bbox)]
+    assert expected
+    assert set(expected) <= set(fids)
+
+
+def test_mask_filter(path_coutwildrnp_shp):
+    mask = {'type': 'Polygon', 'coordinates': [
+        [(-107.0, 37.0), (-105.0, 37.0), (-105.0, 39.0), (-107.0, 39.0), (-107.0, 37.0)]]}
+    with fiona.open(path_coutwildrnp_shp) as src:
+        expected = [fid for fid, f in src.items(mask=mask)]
+        mask = transform_geom(src.crs, 'EPSG:3857', mask)
+    with fiona.open(path_coutwildrnp_shp, dst_crs='EPSG:3857') as src:
+        assert [fid for fid, f in src.items(mask=mask)] == expected
+
+
+def test_get_feature(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp, dst_crs='EPSG:3857') as src:
+        assert src[0]['geometry'] == next(iter(src))['geometry']
+
+
+def test_wkt_format(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp, dst_crs='EPSG:3857', geometry_format='wkt') as src:
+        wkt = next(iter(src))['geometry']
+    x = float(re.search(r'\(\(([-0-9.]+)', wkt).group(1))
+    assert x < -1.0e7
+
+
+def test_dst_crs_write_mode(tmpdir):
+    schema = {'geometry': 'Point', 'properties': {}}
+    with pytest.raises(ValueError):
+        fiona.open(str(tmpdir.join('test.shp')), 'w', driver='ESRI Shapefile',
+                   schema=schema, crs='EPSG:4326', dst_crs='EPSG:3857')
+
+
+def test_invalid_dst_crs(path_coutwildrnp_shp):
+    with pytest.raises(CRSError):
+        fiona.open(path_coutwildrnp_shp, dst_crs='EPSG:0')
+
+
+def test_layer_without_crs(tmpdir):
+    path = str(tmpdir.join('test.shp'))
+    schema = {'geometry': 'Point', 'properties': {}}
+    with fiona.open(path, 'w', driver='ESRI Shapefile', schema=schema) as dst:
+        dst.write({'geometry': {'type': 'Point', 'coordinates': (0.0, 0.0)}, 'properties': {}})
+    with pytest.raises(CRSError):
+        fiona.open(path, dst_crs='EPSG:3857')
@@ -143,3 +143,16 @@ def test_feature_null_field(tmpdir, driver, extension):
     with fiona.open(filename, "r") as src:
         feature = next(iter(src))
         assert(feature["properties"]["RETURN_P"] is None)
+
+
+def test_read_paths_share_decoder(path_coutwildrnp_shp):
+    """Iteration, items, get and indexing decode features the same way"""
+    with fiona.open(path_coutwildrnp_shp, ignore_fields=['NAME']) as src:
+        features = list(src)
+        items = dict(src.items())
+        for feature in features[:5]:
+            fid = int(feature['id'])
+            assert 'NAME' not in feature['properties']
+            assert items[fid] == feature
+            assert src.get(fid) == feature
+            assert src[fid] == feature
@@ -0,0 +1,54 @@
+"""Tests of the bboxes of features and of fiona.bounds()"""
+
+import pytest
+
+import fiona
+
+
+def test_filter_with_bbox(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        for feature in src.filter(with_bbox=True):
+            assert feature['bbox'] == pytest.approx(fiona.bounds(feature['geometry']))
+
+
+def test_items_with_bbox(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        fid, feature = next(src.items(bbox=src.bounds, with_bbox=True))
+        assert feature['bbox'] == pytest.approx(fiona.bounds(feature))
+
+
+def test_no_bbox_by_default(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        assert 'bbox' not in next(iter(src))
+
+
+def test_null_geometry_without_bbox(tmpdir):
+    path = str(tmpdir.join('test.geojson'))
+    schema = {'geometry': 'Point', 'properties': {}}
+    with fiona.open(path, 'w', driver='GeoJSON', schema=schema) as dst:
+        dst.write({'geometry': None, 'properties': {}})
+    with fiona.open(path) as src:
+        feature = next(src.filter(with_bbox=True))
+        assert 'bbox' not in feature
+
+
+def test_bounds_geometry_collection():
+    g = {'type': 'GeometryCollection', 'geometries': [
+        {'type': 'Point', 'coordinates': (10, 10)},
+        {'type': 'LineString', 'coordinates': [(0, 0), (5, 20)]}]}
+    assert fiona.bounds(g) == (0, 0, 10, 20)
+
+
+def test_bounds_empty():
+    assert fiona.bounds({'type': 'LineString', 'coordinates': []}) is None
+
+
+def test_bounds_not_a_geometry():
+    assert fiona.bounds({'type': 'Feature', 'geometry': None}) is None
+
+
+def test_bounds_numpy():
+    np = pytest.importorskip('numpy')
+    g = {'type': 'Polygon', 'coordinates': [
+        np.array([(0.0, 0.0, 1.0), (10.0, 0.0, 1.0), (10.0, 5.0, 1.0), (0.0, 0.0, 1.0)])]}
+    assert fiona.bounds(g) == (0.0, 0.0, 10.0, 5.0)
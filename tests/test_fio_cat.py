@@ -1,12 +1,15 @@
 """Tests for `$ fio cat`."""
 
 
+import json
 import os
 import pytest
 from click.testing import CliRunner
 
+import fiona
 from fiona.fio.main import main_group
 from fiona.fio import cat
+from fiona.transform import transform_geom
 
 
 def test_one(path_coutwildrnp_shp):
@@ -84,3 +87,31 @@ def test_vfs(path_coutwildrnp_zip):
         'cat', 'zip://{}'.format(path_coutwildrnp_zip)])
     assert result.exit_code == 0
     assert result.output.count('"Feature"') == 67
+
+
+def test_precision(path_coutwildrnp_shp):
+    runner = CliRunner()
+    result = runner.invoke(
+        main_group, ['cat', path_coutwildrnp_shp, '--precision', '2'],
+        catch_exceptions=False)
+    assert result.exit_code == 0
+    feature = json.loads(result.output.splitlines()[0])
+    for x, y in feature['geometry']['coordinates'][0]:
+        assert round(x, 2) == x and round(y, 2) == y
+    assert feature['bbox'] == [round(v, 2) for v in feature['bbox']]
+
+
+def test_dst_crs_precision(path_coutwildrnp_shp):
+    """Coordinates are rounded after they are transformed"""
+    runner = CliRunner()
+    result = runner.invoke(
+        main_group,
+        ['cat', path_coutwildrnp_shp, '--dst-crs', 'EPSG:3857', '--precision', '2'],
+        catch_exceptions=False)
+    assert result.exit_code == 0
+    feature = json.loads(result.output.splitlines()[0])
+    with fiona.open(path_coutwildrnp_shp) as src:
+        expected = transform_geom(
+            src.crs, 'EPSG:3857', next(iter(src))['geometry'],
+            antimeridian_cutting=True, precision=2)
+    assert feature['geometry'] == json.loads(json.dumps(expected))
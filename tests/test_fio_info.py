@@ -85,3 +85,19 @@ def test_info_vfs(path_coutwildrnp_zip, path_coutwildrnp_shp):
         'info', path_coutwildrnp_shp])
     assert zip_result.exit_code == shp_result.exit_code == 0
     assert zip_result.output == shp_result.output
+
+
+def test_info_metadata_cache(path_coutwildrnp_shp, tmpdir):
+    """A second run reads the information from the cache"""
+    from fiona.metacache import MetadataCache
+    cache_path = str(tmpdir.join('metadata.sqlite'))
+    runner = CliRunner()
+    outputs = []
+    for _ in range(2):
+        result = runner.invoke(main_group, [
+            'info', '--metadata-cache', cache_path, path_coutwildrnp_shp])
+        assert result.exit_code == 0
+        outputs.append(json.loads(result.output))
+    assert outputs[0] == outputs[1]
+    assert outputs[1]['count'] == 67
+    assert 'info' in MetadataCache(cache_path).get(path_coutwildrnp_shp)
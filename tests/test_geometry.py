@@ -2,7 +2,7 @@
 
 import pytest
 
-from fiona._geometry import GeomBuilder, geometryRT
+from fiona._geometry import GeomBuilder, geometryRT, wkb_geometry_type
 from fiona.errors import UnsupportedGeometryTypeError
 
 
@@ -131,3 +131,99 @@ def test_multipolygon_wkb():
     assert min(y) == 0.0
     assert max(x) == 1.0
     assert max(y) == 1.0
+
+
+@pytest.mark.parametrize('geom_type, coordinates', [
+    ('3D Point', (0.0, 1.0, 2.0)),
+    ('3D LineString', [(0.0, 0.0, 1.0), (1.0, 1.0, 2.0)]),
+    ('3D Polygon',
+     [[(0.0, 0.0, 1.0), (0.0, 1.0, 1.0), (1.0, 1.0, 1.0), (0.0, 0.0, 1.0)]]),
+])
+def test_round_tripping_3d(geom_type, coordinates):
+    result = geometryRT({'type': geom_type, 'coordinates': coordinates})
+    assert result['coordinates'] == coordinates
+
+
+def test_ndarray_coords_wkb():
+    np = pytest.importorskip("numpy")
+    # [1 x 1 box (0, 0, 1, 1)]
+    wkb = bytes.fromhex(
+        "01060000000100000001030000000100000005000000000000000000f03f000000"
+        "0000000000000000000000f03f000000000000f03f000000000000000000000000"
+        "0000f03f00000000000000000000000000000000000000000000f03f0000000000"
+        "000000")
+    geom = GeomBuilder(ndarray_coords=True).build_wkb(wkb)
+    assert geom['type'] == "MultiPolygon"
+    ring = geom['coordinates'][0][0]
+    assert isinstance(ring, np.ndarray)
+    assert ring.shape == (5, 2)
+    assert ring.tolist() == [list(xy) for xy in geometry_wkb(wkb.hex())['coordinates'][0][0]]
+
+
+def test_nested_geometry_collection_round_trip():
+    geom = {
+        'type': "GeometryCollection",
+        'geometries': [
+            {'type': "MultiPolygon", 'coordinates': [
+                [[(0.0, 0.0), (0.0, 1.0), (1.0, 1.0), (0.0, 0.0)]],
+                [[(2.0, 2.0), (2.0, 3.0), (3.0, 3.0), (2.0, 2.0)]]]},
+            {'type': "GeometryCollection", 'geometries': [
+                {'type': "Point", 'coordinates': (0.0, 0.0)}]}]}
+    assert geometryRT(geom) == geom
+
+
+def test_linestring_from_generator():
+    coords = ((float(i), float(i)) for i in range(3))
+    result = geometryRT({'type': 'LineString', 'coordinates': coords})
+    assert result['coordinates'] == [(0.0, 0.0), (1.0, 1.0), (2.0, 2.0)]
+
+
+def test_linestring_mixed_dimensions():
+    result = geometryRT({'type': 'LineString',
+                         'coordinates': [(0.0, 0.0), (1.0, 1.0, 1.0)]})
+    assert result['coordinates'] == [(0.0, 0.0, 0.0), (1.0, 1.0, 1.0)]
+
+
+def test_linestring_invalid_coordinates():
+    with pytest.raises(ValueError):
+        geometryRT({'type': 'LineString', 'coordinates': [(0.0, 0.0), (1.0,)]})
+
+
+def test_flat_array_coordinates():
+    from array import array
+    coords = array('d', [0.0, 0.0, 1.0, 1.0, 2.0, 0.0])
+    result = geometryRT({'type': 'LineString', 'coordinates': coords})
+    assert result['coordinates'] == [(0.0, 0.0), (1.0, 1.0), (2.0, 0.0)]
+
+
+@pytest.mark.parametrize('ndims', [2, 3])
+def test_ndarray_coordinates(ndims):
+    np = pytest.importorskip("numpy")
+    ring = np.array([(0.0, 0.0, 1.0), (0.0, 1.0, 2.0), (1.0, 1.0, 3.0)])[:, :ndims]
+    result = geometryRT({'type': 'Polygon', 'coordinates': [ring]})
+    expected = [tuple(xyz) for xyz in ring.tolist()]
+    assert result['coordinates'] == [expected + expected[:1]]
+
+
+def test_ndarray_coordinates_other_dtype():
+    np = pytest.importorskip("numpy")
+    coords = np.array([(0, 0), (1, 1)], dtype='int32')
+    result = geometryRT({'type': 'LineString', 'coordinates': coords})
+    assert result['coordinates'] == [(0.0, 0.0), (1.0, 1.0)]
+
+
+@pytest.mark.parametrize('wkb, geom_type', [
+    ("010100000000000000000000000000000000000000", "Point"),
+    ("000000000100000000000000000000000000000000", "Point"),
+    ("01e9030000000000000000000000000000000000000000000000000000", "3D Point"),
+    ("0101000080000000000000000000000000000000000000000000000000", "3D Point"),
+    ("010600000000000000", "MultiPolygon"),
+])
+def test_wkb_geometry_type(wkb, geom_type):
+    assert wkb_geometry_type(bytes.fromhex(wkb)) == geom_type
+
+
+def test_wkb_geometry_type_unsupported():
+    # CircularString
+    with pytest.raises(UnsupportedGeometryTypeError):
+        wkb_geometry_type(bytes.fromhex("010800000000000000"))
@@ -0,0 +1,80 @@
+"""Tests of the geometry_format option of collections"""
+
+import pytest
+
+import fiona
+from fiona._geometry import GeomBuilder
+
+
+def test_geometry_format_invalid(path_coutwildrnp_shp):
+    with pytest.raises(ValueError):
+        fiona.open(path_coutwildrnp_shp, geometry_format='geojsonx')
+
+
+def test_geometry_format_default(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        assert src.geometry_format == 'geojson'
+        assert next(iter(src))['geometry']['type'] == 'Polygon'
+
+
+def test_geometry_format_wkb(path_coutwildrnp_shp):
+    """WKB geometries are those of the GeoJSON-like records"""
+    with fiona.open(path_coutwildrnp_shp) as src:
+        records = list(src)
+    with fiona.open(path_coutwildrnp_shp, geometry_format='wkb') as src:
+        for feature, rec in zip(src, records):
+            assert isinstance(feature['geometry'], bytes)
+            assert GeomBuilder().build_wkb(feature['geometry']) == rec['geometry']
+            assert feature['properties'] == rec['properties']
+        assert isinstance(src[0]['geometry'], bytes)
+
+
+def test_geometry_format_wkt(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp, geometry_format='wkt') as src:
+        for fid, feature in src.items(0, 5):
+            assert feature['geometry'].startswith('POLYGON ((')
+
+
+def test_geometry_format_ignore_geometry(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp, geometry_format='wkb',
+                    ignore_geometry=True) as src:
+        assert 'geometry' not in next(iter(src))
+
+
+def test_geometry_format_shapely(path_coutwildrnp_shp):
+    shapely_geometry = pytest.importorskip("shapely.geometry")
+    with fiona.open(path_coutwildrnp_shp) as src:
+        records = list(src)
+    with fiona.open(path_coutwildrnp_shp, geometry_format='shapely') as src:
+        for feature, rec in zip(src, records):
+            expected = shapely_geometry.shape(rec['geometry'])
+            assert feature['geometry'].equals(expected)
+
+
+def test_batch_geometry_format_shapely(path_coutwildrnp_shp):
+    pytest.importorskip("numpy")
+    pytest.importorskip("shapely")
+    with fiona.open(path_coutwildrnp_shp, geometry_format='shapely') as src:
+        batch = next(src.read_batches(batch_size=10))
+        assert len(batch['geometry']) == 10
+        assert all(geom.geom_type == 'Polygon' for geom in batch['geometry'])
+
+
+def test_batch_geometry_format_wkt(path_coutwildrnp_shp):
+    pytest.importorskip("numpy")
+    with fiona.open(path_coutwildrnp_shp, geometry_format='wkt') as src:
+        batch = next(src.read_batches(batch_size=10))
+        assert all(wkt.startswith('POLYGON') for wkt in batch['geometry'])
+
+
+def test_geometry_format_numpy(path_coutwildrnp_shp):
+    np = pytest.importorskip("numpy")
+    with fiona.open(path_coutwildrnp_shp) as src:
+        expected = next(iter(src))['geometry']
+    with fiona.open(path_coutwildrnp_shp, geometry_format='numpy') as src:
+        geom = next(iter(src))['geometry']
+    assert geom['type'] == expected['type']
+    for ring, expected_ring in zip(geom['coordinates'], expected['coordinates']):
+        assert isinstance(ring, np.ndarray)
+        assert ring.shape == (len(expected_ring), 2)
+        assert list(map(tuple, ring.tolist())) == expected_ring
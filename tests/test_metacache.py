@@ -0,0 +1,116 @@
+"""Tests of the layer metadata cache"""
+
+import os
+import shutil
+
+import pytest
+
+import fiona
+from fiona.metacache import MetadataCache
+
+
+def test_cache_update_get(tmpdir):
+    path = str(tmpdir.join('data.txt'))
+    with open(path, 'w') as f:
+        f.write('data')
+    cache = MetadataCache()
+    assert cache.get(path) == {}
+    cache.update(path, count=1)
+    cache.update(path, bounds=[0, 0, 1, 1])
+    assert cache.get(path) == {'count': 1, 'bounds': [0, 0, 1, 1]}
+    assert cache.get(path, 'other') == {}
+    assert cache.hits == 1
+    assert cache.misses == 2
+    cache.clear()
+    assert cache.get(path) == {}
+
+
+def test_cache_stale(tmpdir):
+    """Metadata of a modified file are not used"""
+    path = str(tmpdir.join('data.txt'))
+    with open(path, 'w') as f:
+        f.write('data')
+    cache = MetadataCache()
+    cache.update(path, count=1)
+    with open(path, 'a') as f:
+        f.write('more data')
+    assert cache.get(path) == {}
+    cache.update(path, bounds=[0, 0, 1, 1])
+    assert cache.get(path) == {'bounds': [0, 0, 1, 1]}
+
+
+def test_cache_not_local():
+    cache = MetadataCache()
+    cache.update('/vsimem/test.geojson', count=1)
+    assert cache.get('/vsimem/test.geojson') == {}
+
+
+def test_cache_sidecar(path_coutwildrnp_shp, tmpdir):
+    """Metadata persist in a SQLite file"""
+    cache_path = str(tmpdir.join('metadata.sqlite'))
+    cache = MetadataCache(cache_path)
+    with fiona.open(path_coutwildrnp_shp, metadata_cache=cache) as src:
+        meta = src.meta
+        bounds = src.bounds
+        assert len(src) == 67
+    cache.close()
+
+    cache = MetadataCache(cache_path)
+    with fiona.open(path_coutwildrnp_shp, metadata_cache=cache) as src:
+        assert src.meta == meta
+        assert src.bounds == bounds
+        assert len(src) == 67
+    assert cache.misses == 0
+    assert cache.hits > 0
+
+
+def test_collection_schema_order(path_coutwildrnp_shp):
+    cache = MetadataCache()
+    with fiona.open(path_coutwildrnp_shp, metadata_cache=cache) as src:
+        schema = src.schema
+    with fiona.open(path_coutwildrnp_shp, metadata_cache=cache) as src:
+        assert list(src.schema['properties']) == list(schema['properties'])
+
+
+def test_collection_modified(data_dir, tmpdir):
+    """Appending to a layer invalidates its metadata"""
+    for filename in os.listdir(data_dir):
+        if filename.startswith('coutwildrnp.'):
+            shutil.copy(os.path.join(data_dir, filename), str(tmpdir))
+    path = str(tmpdir.join('coutwildrnp.shp'))
+    cache = MetadataCache()
+    with fiona.open(path, metadata_cache=cache) as src:
+        assert len(src) == 67
+        feature = next(iter(src))
+    with fiona.open(path, 'a') as dst:
+        dst.write(feature)
+    with fiona.open(path, metadata_cache=cache) as src:
+        assert len(src) == 68
+
+
+def test_metadata_cache_write_mode(tmpdir):
+    with pytest.raises(ValueError):
+        fiona.open(str(tmpdir.join('test.gpkg')), 'w', driver='GPKG',
+                   schema={'geometry': 'Point', 'properties': {}},
+                   metadata_cache=MetadataCache())
+
+
+def test_cache_ignore_fields(path_coutwildrnp_shp):
+    """The schema of a collection with ignored fields isn't cached"""
+    cache = MetadataCache()
+    with fiona.open(path_coutwildrnp_shp, metadata_cache=cache,
+                    ignore_fields=['NAME']) as src:
+        assert 'NAME' not in src.schema['properties']
+    with fiona.open(path_coutwildrnp_shp, metadata_cache=cache) as src:
+        assert 'NAME' in src.schema['properties']
+
+
+def test_cache_spatial_filter(path_coutwildrnp_shp):
+    """The count of a filtered collection isn't cached"""
+    cache = MetadataCache()
+    with fiona.open(path_coutwildrnp_shp, metadata_cache=cache) as src:
+        features = list(src.filter(bbox=(-109.0, 37.0, -107.0, 39.0)))
+        assert len(src) == len(features) < 67
+    with fiona.open(path_coutwildrnp_shp, metadata_cache=cache) as src:
+        assert len(src) == 67
+    assert cache.get(path_coutwildrnp_shp)['count'] == 67
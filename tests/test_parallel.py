@@ -0,0 +1,116 @@
+"""Tests of partitioned reading"""
+
+import math
+import pickle
+import shutil
+
+import pytest
+
+import fiona
+from fiona.parallel import Partition, index_partitions, map_partitions, tile_partitions
+
+
+def fids(partition):
+    return [fid for fid, feature in partition.items()]
+
+
+def test_index_partitions():
+    assert index_partitions(3, 10) == [(0, 3), (3, 6), (6, None)]
+    assert index_partitions(1, 10) == [(0, None)]
+
+
+def test_tile_partitions():
+    tiles = tile_partitions(6, (0.0, 0.0, 3.0, 2.0))
+    assert len(tiles) == 6
+    assert tiles[0] == (-math.inf, -math.inf, 1.0, 1.0)
+    assert tiles[4] == (1.0, 1.0, 2.0, math.inf)
+    assert tiles[-1] == (2.0, 1.0, math.inf, math.inf)
+
+
+@pytest.mark.parametrize('n', [1, 4, 10])
+def test_partitions_by_index(path_coutwildrnp_shp, n):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        parts = src.partitions(n)
+    assert len(parts) == n
+    result = [fid for part in parts for fid in fids(part)]
+    assert result == list(range(67))
+
+
+def test_partitions_by_index_filtered(path_coutwildrnp_shp):
+    bbox = (-107.0, 37.0, -105.0, 39.0)
+    with fiona.open(path_coutwildrnp_shp) as src:
+        expected = [fid for fid, _ in src.items(bbox=bbox)]
+        parts = src.partitions(3, bbox=bbox)
+    assert sorted(fid for part in parts for fid in fids(part)) == sorted(expected)
+
+
+@pytest.mark.parametrize('n', [1, 3, 4])
+def test_partitions_by_bbox(path_coutwildrnp_gpkg, n):
+    with fiona.open(path_coutwildrnp_gpkg) as src:
+        expected = sorted(fid for fid, _ in src.items())
+        parts = src.partitions(n, by='bbox')
+    assert len(parts) == n
+    assert sorted(fid for part in parts for fid in fids(part)) == expected
+
+
+def shifted(coordinates, dx, dy):
+    if isinstance(coordinates[0], float):
+        return (coordinates[0] + dx, coordinates[1] + dy)
+    return [shifted(part, dx, dy) for part in coordinates]
+
+
+def test_partitions_by_bbox_added_features(tmpdir, path_coutwildrnp_gpkg):
+    """Features outside of the extent at the partitioning are in the
+    outer tiles"""
+    path = str(tmpdir.join('test.gpkg'))
+    shutil.copy(path_coutwildrnp_gpkg, path)
+    with fiona.open(path) as src:
+        parts = src.partitions(4, by='bbox')
+        feature = next(iter(src))
+    for dx, dy in ((-10.0, -10.0), (10.0, 10.0), (-10.0, 10.0)):
+        geometry = {'type': feature['geometry']['type'],
+                    'coordinates': shifted(feature['geometry']['coordinates'], dx, dy)}
+        with fiona.open(path, 'a') as dst:
+            dst.write({'geometry': geometry, 'properties': feature['properties']})
+    with fiona.open(path) as src:
+        assert len(src) == 70
+    assert sum(count(part) for part in parts) == 70
+
+
+def test_partitions_by_bbox_dst_crs(path_coutwildrnp_gpkg):
+    with fiona.open(path_coutwildrnp_gpkg, dst_crs='EPSG:3857') as src:
+        with pytest.raises(ValueError):
+            src.partitions(4, by='bbox')
+
+
+def test_partitions_by_bbox_no_index(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        with pytest.raises(ValueError):
+            src.partitions(4, by='bbox')
+
+
+def test_partitions_invalid(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        with pytest.raises(ValueError):
+            src.partitions(0)
+        with pytest.raises(ValueError):
+            src.partitions(2, by='fid')
+
+
+def test_partition_pickle(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp, ignore_fields=['NAME']) as src:
+        part = src.partitions(2)[1]
+    clone = pickle.loads(pickle.dumps(part))
+    assert isinstance(clone, Partition)
+    assert fids(clone) == fids(part)
+    assert 'NAME' not in next(iter(clone))['properties']
+
+
+def count(partition):
+    return sum(1 for _ in partition)
+
+
+def test_map_partitions(path_coutwildrnp_shp):
+    results = list(map_partitions(path_coutwildrnp_shp, count, processes=2, partitions=4))
+    assert len(results) == 4
+    assert sum(results) == 67
@@ -0,0 +1,86 @@
+"""Tests of pickling collections and of forking with open collections"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+import pickle
+
+import pytest
+
+import fiona
+
+
+def test_pickle_collection(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp, ignore_fields=['NAME']) as src:
+        expected = list(src)
+        clone = pickle.loads(pickle.dumps(src))
+    assert clone._session is None
+    assert clone.path == src.path
+    assert list(clone) == expected
+    assert 'NAME' not in clone.schema['properties']
+    clone.close()
+    assert clone.closed
+
+
+def test_pickle_collection_iterator(path_coutwildrnp_shp):
+    """The iteration of the pickled collection is resumed"""
+    with fiona.open(path_coutwildrnp_shp) as src:
+        expected = list(src.items(2, 20, 2))
+        iterator = src.items(2, 20, 2)
+        next(iterator)
+        next(iterator)
+        clone = pickle.loads(pickle.dumps(src))
+        assert list(clone.iterator) == expected[2:]
+        assert list(iterator) == expected[2:]
+
+
+def test_pickle_lazy_collection(path_coutwildrnp_shp):
+    """An unused unpickled collection is pickled without opening it"""
+    with fiona.open(path_coutwildrnp_shp) as src:
+        clone = pickle.loads(pickle.dumps(src))
+    clone2 = pickle.loads(pickle.dumps(clone))
+    assert clone._session is None
+    assert len(clone2) == 67
+
+
+def test_pickle_closed_collection(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        pass
+    with pytest.raises(ValueError):
+        pickle.dumps(src)
+
+
+def test_pickle_writing_collection(tmpdir):
+    schema = {'geometry': 'Point', 'properties': {'title': 'str'}}
+    with fiona.open(str(tmpdir.join('test.gpkg')), 'w', driver='GPKG', schema=schema) as dst:
+        with pytest.raises(TypeError):
+            pickle.dumps(dst)
+
+
+def count(collection):
+    return sum(1 for _ in collection)
+
+
+def test_collection_to_process_pool(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(count, src).result() == 67
+
+
+@pytest.mark.skipif(not hasattr(os, 'register_at_fork'), reason="Requires os.register_at_fork")
+def test_fork_reopens_collection(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        iterator = iter(src)
+        next(iterator)
+        pid = os.fork()
+        if pid == 0:
+            # The child reads the inherited collection from a dataset of
+            # its own.
+            status = 1
+            try:
+                if src._session is None and len(list(src)) == 67:
+                    status = 0
+            finally:
+                os._exit(status)
+        _, status = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(status) == 0
+        assert len(list(iterator)) == 66
@@ -0,0 +1,114 @@
+"""Tests of the dataset pool"""
+
+import os
+import shutil
+import threading
+import time
+
+import pytest
+
+import fiona
+from fiona.pool import DatasetPool
+
+
+def test_pool_hits(path_coutwildrnp_shp):
+    pool = DatasetPool()
+    for _ in range(3):
+        with pool.open(path_coutwildrnp_shp) as src:
+            assert len(list(src)) == 67
+    assert pool.misses == 1
+    assert pool.hits == 2
+    assert len(pool) == 1
+    pool.clear()
+    assert len(pool) == 0
+
+
+def test_pool_leases_one_at_a_time(path_coutwildrnp_shp):
+    """A leased dataset is not leased again until it is released"""
+    pool = DatasetPool()
+    with pool.open(path_coutwildrnp_shp) as src1:
+        with pool.open(path_coutwildrnp_shp) as src2:
+            assert next(iter(src1)) == next(iter(src2))
+    assert pool.misses == 2
+    assert len(pool) == 2
+
+
+def test_pool_resets_layers(path_coutwildrnp_shp):
+    """Filters and ignored fields don't leak to the next lease"""
+    pool = DatasetPool()
+    bbox = (-107.0, 37.0, -105.0, 39.0)
+    with pool.open(path_coutwildrnp_shp, ignore_fields=['NAME']) as src:
+        filtered = list(src.filter(bbox=bbox))
+        assert 'NAME' not in filtered[0]['properties']
+    with pool.open(path_coutwildrnp_shp) as src:
+        assert len(src) == 67
+        assert 'NAME' in next(iter(src))['properties']
+    assert pool.hits == 1
+
+
+def test_pool_key_options(path_coutwildrnp_shp):
+    pool = DatasetPool()
+    with pool.open(path_coutwildrnp_shp):
+        pass
+    with pool.open(path_coutwildrnp_shp, encoding='utf-8'):
+        pass
+    assert pool.misses == 2
+
+
+def test_pool_lru_eviction(path_coutwildrnp_shp, path_coutwildrnp_json):
+    pool = DatasetPool(max_open=1)
+    with pool.open(path_coutwildrnp_shp):
+        pass
+    with pool.open(path_coutwildrnp_json):
+        pass
+    assert len(pool) == 1
+    with pool.open(path_coutwildrnp_shp):
+        pass
+    assert pool.misses == 3
+
+
+def test_pool_ttl(path_coutwildrnp_shp):
+    pool = DatasetPool(ttl=0.01)
+    with pool.open(path_coutwildrnp_shp):
+        pass
+    time.sleep(0.05)
+    with pool.open(path_coutwildrnp_shp):
+        pass
+    assert pool.misses == 2
+
+
+def test_pool_stale(tmpdir, path_coutwildrnp_json):
+    path = str(tmpdir.join('test.json'))
+    shutil.copy(path_coutwildrnp_json, path)
+    pool = DatasetPool()
+    with pool.open(path):
+        pass
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    with pool.open(path) as src:
+        assert len(src) == 67
+    assert pool.misses == 2
+
+
+def test_pool_threads(path_coutwildrnp_shp):
+    pool = DatasetPool()
+    counts = []
+
+    def read():
+        for _ in range(5):
+            with pool.open(path_coutwildrnp_shp) as src:
+                counts.append(len(list(src)))
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counts == [67] * 20
+    assert pool.hits + pool.misses == 20
+
+
+def test_pool_write_mode(tmpdir):
+    with pytest.raises(ValueError):
+        fiona.open(str(tmpdir.join('test.gpkg')), 'w', driver='GPKG',
+                   schema={'geometry': 'Point', 'properties': {}}, pool=DatasetPool())
@@ -0,0 +1,82 @@
+"""Tests of the rounding of coordinates as geometries are built"""
+
+import random
+import re
+
+import pytest
+
+import fiona
+from fiona.transform import transform_geom
+
+
+def _rounded(coordinates, precision):
+    return [tuple(round(v, precision) for v in xy) for xy in coordinates]
+
+
+def test_filter_precision(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        features = list(src)
+        for feature, rounded in zip(features, src.filter(precision=3)):
+            ring = feature['geometry']['coordinates'][0]
+            assert rounded['geometry']['coordinates'][0] == pytest.approx(
+                _rounded(ring, 3), abs=1e-9)
+
+
+def test_items_precision_bbox(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        fid, feature = next(src.items(precision=1, with_bbox=True))
+        assert feature['bbox'] == pytest.approx(fiona.bounds(feature), abs=1e-9)
+        assert all(round(v, 1) == pytest.approx(v, abs=1e-9) for v in feature['bbox'])
+
+
+def test_no_precision_by_default(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        first = next(iter(src))
+        assert next(src.filter(precision=-1)) == first
+
+
+def test_precision_wkt(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp, geometry_format='wkt') as src:
+        wkt = next(src.filter(precision=0))['geometry']
+    values = [float(v) for v in re.findall(r'-?[0-9.]+', wkt)]
+    assert values
+    assert all(v == int(v) for v in values)
+
+
+def test_precision_numpy(path_coutwildrnp_shp):
+    np = pytest.importorskip('numpy')
+    with fiona.open(path_coutwildrnp_shp, geometry_format='numpy') as src:
+        ring = next(src.filter(precision=2))['geometry']['coordinates'][0]
+    assert np.allclose(ring, np.round(ring, 2))
+
+
+def test_transform_geom_precision_geometry_collection():
+    geom = {'type': 'GeometryCollection', 'geometries': [
+        {'type': 'Point', 'coordinates': (0.123456, 1.654321)},
+        {'type': 'LineString', 'coordinates': [(0.111, 0.999), (2.56, 3.444)]}]}
+    g = transform_geom(None, None, geom, precision=1)
+    assert g['geometries'][0]['coordinates'] == pytest.approx((0.1, 1.7))
+    assert g['geometries'][1]['coordinates'] == [
+        pytest.approx((0.1, 1.0)), pytest.approx((2.6, 3.4))]
+    assert geom['geometries'][0]['coordinates'] == (0.123456, 1.654321)
+
+
+@pytest.mark.parametrize('value,precision', [
+    (7.5385, 3), (0.125, 2), (0.375, 2), (-0.125, 2), (2.5, 0), (-2.5, 0),
+    (1.0005, 3), (-0.0004, 3), (2.675, 2), (123456.785, 3),
+    (4503599627370497.0, 0), (1e-300, 5)])
+def test_precision_like_round(value, precision):
+    """Coordinates are rounded like round(), including near and at ties"""
+    geom = {'type': 'Point', 'coordinates': (value, -value)}
+    g = transform_geom(None, None, geom, precision=precision)
+    assert g['coordinates'] == (round(value, precision), round(-value, precision))
+
+
+def test_precision_like_round_random():
+    rng = random.Random(0)
+    coordinates = [
+        ((rng.randint(-10 ** 9, 10 ** 9) + 0.5) / 1000.0, rng.uniform(-180, 180))
+        for i in range(1000)]
+    geom = {'type': 'LineString', 'coordinates': coordinates}
+    g = transform_geom(None, None, geom, precision=3)
+    assert g['coordinates'] == _rounded(coordinates, 3)
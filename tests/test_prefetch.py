@@ -0,0 +1,99 @@
+"""Tests of iteration with a prefetching thread"""
+
+import gc
+import threading
+import weakref
+
+import pytest
+
+import fiona
+
+
+@pytest.mark.parametrize('prefetch', [1, 10, 1000])
+def test_filter_prefetch(path_coutwildrnp_shp, prefetch):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        expected = list(src)
+        assert list(src.filter(prefetch=prefetch)) == expected
+
+
+def test_items_prefetch(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        expected = list(src.items())
+        assert list(src.items(prefetch=5)) == expected
+
+
+def test_prefetch_bbox_and_slice(path_coutwildrnp_shp):
+    bbox = (-107.0, 37.0, -105.0, 39.0)
+    with fiona.open(path_coutwildrnp_shp) as src:
+        assert (list(src.filter(bbox=bbox, prefetch=3)) ==
+                list(src.filter(bbox=bbox)))
+        assert list(src.items(2, 30, prefetch=3)) == list(src.items(2, 30))
+        assert list(src.items(0, 30, 4, prefetch=3)) == list(src.items(0, 30, 4))
+
+
+def test_prefetch_exhausted(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        iterator = src.filter(prefetch=2)
+        assert len(list(iterator)) == 67
+        with pytest.raises(StopIteration):
+            next(iterator)
+
+
+def test_prefetch_abandoned(path_coutwildrnp_shp):
+    """An unfinished prefetching iterator is closed by the next one"""
+    with fiona.open(path_coutwildrnp_shp) as src:
+        iterator = src.filter(prefetch=2)
+        first = next(iterator)
+        assert next(iter(src)) == first
+        with pytest.raises(IOError):
+            next(iterator)
+        assert len(list(src)) == 67
+
+
+def test_prefetch_close(path_coutwildrnp_shp):
+    src = fiona.open(path_coutwildrnp_shp)
+    iterator = src.filter(prefetch=2)
+    next(iterator)
+    src.close()
+    assert src.closed
+
+
+def test_prefetch_abandoned_collection(path_coutwildrnp_shp):
+    """A prefetching thread does not keep an abandoned iterator and
+    its collection alive"""
+    src = fiona.open(path_coutwildrnp_shp)
+    for feature in src.filter(prefetch=2):
+        break
+    ref = weakref.ref(src)
+    del src
+    gc.collect()
+    assert ref() is None
+    for thread in threading.enumerate():
+        if thread.name == 'fiona-prefetch':
+            thread.join(5)
+            assert not thread.is_alive()
+
+
+@pytest.mark.parametrize('use', [
+    len, lambda src: src[1], lambda src: src.get(1), lambda src: 1 in src,
+    lambda src: src.bounds])
+def test_prefetch_layer_in_use(path_coutwildrnp_shp, use):
+    """Methods that use the layer fail while a prefetching thread
+    reads it, without ending the iteration"""
+    with fiona.open(path_coutwildrnp_shp) as src:
+        iterator = src.filter(prefetch=2)
+        next(iterator)
+        with pytest.raises(IOError):
+            use(src)
+        assert len(list(iterator)) == 66
+
+
+@pytest.mark.parametrize('use', [len, lambda src: src.bounds])
+def test_prefetch_cached_metadata(path_coutwildrnp_shp, use):
+    """Known lengths and bounds are returned while prefetching"""
+    with fiona.open(path_coutwildrnp_shp) as src:
+        expected = use(src)
+        iterator = src.filter(prefetch=2)
+        next(iterator)
+        assert use(src) == expected
+        assert len(list(iterator)) == 66
@@ -0,0 +1,76 @@
+"""Tests of columnar batch reading"""
+
+import pytest
+
+import fiona
+from fiona._geometry import GeomBuilder
+
+from .conftest import requires_gdal2
+
+np = pytest.importorskip("numpy")
+
+
+def test_batches_cover_layer(path_coutwildrnp_shp):
+    """Batches cover every feature of the layer, in order"""
+    with fiona.open(path_coutwildrnp_shp) as src:
+        batches = list(src.read_batches(batch_size=10))
+        assert [len(batch['fid']) for batch in batches] == [10] * 6 + [7]
+        fids = np.concatenate([batch['fid'] for batch in batches])
+        assert fids.tolist() == list(range(len(src)))
+
+
+def test_batch_columns_match_records(path_coutwildrnp_shp):
+    """Column values are those of the GeoJSON-like records"""
+    with fiona.open(path_coutwildrnp_shp) as src:
+        records = list(src)
+        batch = next(src.read_batches(batch_size=100))
+
+    assert list(batch['properties'].keys()) == list(records[0]['properties'].keys())
+    assert batch['properties']['PERIMETER'].dtype == np.float64
+    assert batch['properties']['WILDRNP020'].dtype.kind == 'i'
+    for key, column in batch['properties'].items():
+        assert column.tolist() == [rec['properties'][key] for rec in records]
+
+    for wkb, rec in zip(batch['geometry'], records):
+        assert GeomBuilder().build_wkb(wkb) == rec['geometry']
+
+
+def test_batch_ignore_fields_and_geometry(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp, ignore_fields=['NAME'],
+                    ignore_geometry=True) as src:
+        batch = next(src.read_batches())
+        assert 'NAME' not in batch['properties']
+        assert batch['geometry'] is None
+
+
+def test_batch_bbox(path_coutwildrnp_shp):
+    bbox = (-107.0, 37.0, -105.0, 39.0)
+    with fiona.open(path_coutwildrnp_shp) as src:
+        expected = [int(fid) for fid, _ in src.items(bbox=bbox)]
+        fids = np.concatenate(
+            [batch['fid'] for batch in src.read_batches(batch_size=3, bbox=bbox)])
+        assert fids.tolist() == expected
+
+
+def test_batch_size_invalid(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        with pytest.raises(ValueError):
+            src.read_batches(batch_size=0)
+
+
+def test_batches_closed(path_coutwildrnp_shp):
+    src = fiona.open(path_coutwildrnp_shp)
+    src.close()
+    with pytest.raises(ValueError):
+        src.read_batches()
+
+
+@requires_gdal2
+def test_batch_curves_linearized(path_curves_line_csv):
+    """Curves are linearized like the geometries of records"""
+    with fiona.open(path_curves_line_csv, geometry_format='wkt') as src:
+        records = list(src)
+        batch = next(src.read_batches(batch_size=100))
+    geometries = batch['geometry'].tolist()
+    assert geometries == [rec['geometry'] for rec in records]
+    assert not any('CIRCULAR' in g or 'CURVE' in g for g in geometries if g)
@@ -0,0 +1,85 @@
+"""Tests of the length and bounds of written layers and of approximate
+bounds"""
+
+import os
+import shutil
+
+import pytest
+
+import fiona
+from fiona.metacache import MetadataCache
+
+
+def point(x, y):
+    return {'geometry': {'type': 'Point', 'coordinates': (x, y)},
+            'properties': {'title': 'point'}}
+
+
+SCHEMA = {'geometry': 'Point', 'properties': {'title': 'str'}}
+
+
+@pytest.mark.parametrize('driver,filename', [
+    ('ESRI Shapefile', 'test.shp'), ('GeoJSON', 'test.geojson'),
+    ('GPKG', 'test.gpkg')])
+def test_write_batches(tmpdir, driver, filename):
+    """Length and bounds follow the written batches"""
+    path = str(tmpdir.join(filename))
+    with fiona.open(path, 'w', driver=driver, schema=SCHEMA) as dst:
+        assert len(dst) == 0
+        assert dst.bounds == (0.0, 0.0, 0.0, 0.0)
+        dst.writerecords([point(1, 2), point(3, 4)])
+        assert len(dst) == 2
+        assert dst.bounds == (1.0, 2.0, 3.0, 4.0)
+        dst.writerecords([point(-1, 3), {'geometry': None, 'properties': {'title': 'none'}}])
+        assert len(dst) == 4
+        assert dst.bounds == (-1.0, 2.0, 3.0, 4.0)
+        assert dst.get_bounds(approx=True) == (-1.0, 2.0, 3.0, 4.0)
+    with fiona.open(path) as src:
+        assert len(src) == 4
+        assert src.bounds == (-1.0, 2.0, 3.0, 4.0)
+
+
+def test_append(data_dir, tmpdir):
+    """Appended features extend the bounds of the layer"""
+    for filename in os.listdir(data_dir):
+        if filename.startswith('coutwildrnp.'):
+            shutil.copy(os.path.join(data_dir, filename), str(tmpdir))
+    path = str(tmpdir.join('coutwildrnp.shp'))
+    with fiona.open(path) as src:
+        feature = next(iter(src))
+        minx, miny, maxx, maxy = src.bounds
+    feature['geometry'] = {'type': 'Polygon', 'coordinates': [
+        [(maxx, maxy), (maxx + 1, maxy), (maxx + 1, maxy + 1), (maxx, maxy)]]}
+    with fiona.open(path, 'a') as dst:
+        dst.write(feature)
+        assert len(dst) == 68
+        assert dst.bounds == (minx, miny, maxx + 1, maxy + 1)
+        dst.write(feature)
+        assert len(dst) == 69
+        assert dst.bounds == (minx, miny, maxx + 1, maxy + 1)
+    with fiona.open(path) as src:
+        assert len(src) == 69
+        assert src.bounds == pytest.approx((minx, miny, maxx + 1, maxy + 1))
+
+
+def test_approx_bounds_header(path_coutwildrnp_shp):
+    """Shapefile headers have the bounds"""
+    with fiona.open(path_coutwildrnp_shp) as src:
+        bounds = src.get_bounds(approx=True)
+        assert bounds == pytest.approx(src.bounds)
+
+
+def test_approx_bounds_known(path_coutwildrnp_json):
+    """Computed bounds are reused"""
+    with fiona.open(path_coutwildrnp_json) as src:
+        bounds = src.bounds
+        assert src.get_bounds(approx=True) == bounds
+
+
+def test_approx_bounds_cache(path_coutwildrnp_shp):
+    cache = MetadataCache()
+    with fiona.open(path_coutwildrnp_shp, metadata_cache=cache) as src:
+        bounds = src.bounds
+    with fiona.open(path_coutwildrnp_shp, metadata_cache=cache) as src:
+        assert src.get_bounds(approx=True) == bounds
+    assert cache.hits >= 1
@@ -4,6 +4,7 @@ import math
 
 import pytest
 
+import fiona
 from fiona import transform
 
 
@@ -48,3 +49,177 @@ from fiona import transform
 def test_transform_geom_with_z(geom):
     """Transforming a geom with Z succeeds"""
     g2 = transform.transform_geom("epsg:4326", "epsg:3857", geom, precision=3)
+
+
+def test_transformer_transform():
+    transformer = transform.Transformer("EPSG:4326", "EPSG:26953")
+    xs, ys = transformer.transform([-105.0], [40.0])
+    assert (xs[0], ys[0]) == pytest.approx((957097.0952, 378940.8419))
+    assert (xs, ys) == transform.transform("EPSG:4326", "EPSG:26953", [-105.0], [40.0])
+
+
+def test_transformer_transform_geom():
+    transformer = transform.Transformer("EPSG:4326", "EPSG:3857")
+    geom = {"type": "Point", "coordinates": [0.0, 0.0]}
+    for _ in range(3):
+        g = transformer.transform_geom(geom, precision=3)
+        assert tuple(g["coordinates"]) == (0.0, 0.0)
+    assert transformer.src_crs == "EPSG:4326"
+    assert transformer.dst_crs == "EPSG:3857"
+
+
+def test_transformer_invalid_crs():
+    with pytest.raises(Exception):
+        transform.Transformer("EPSG:4326", "not a crs")
+
+
+def test_transformer_cache():
+    """Transformers of a pair of CRS are reused by the calling thread"""
+    from fiona._transform import get_transformer
+    crs = {"init": "epsg:4326"}
+    transformer = get_transformer(crs, "EPSG:3857")
+    assert get_transformer(dict(crs), "EPSG:3857") is transformer
+    assert get_transformer(crs, "EPSG:3857", antimeridian_cutting=True) is not transformer
+    assert crs == {"init": "epsg:4326"}
+
+
+def test_transform_geom_proj4_dict_unchanged():
+    """The CRS dicts of callers are not modified"""
+    crs = {"proj": "merc", "datum": "WGS84"}
+    transform.transform_geom(
+        "EPSG:4326", crs, {"type": "Point", "coordinates": [0.0, 0.0]})
+    assert crs == {"proj": "merc", "datum": "WGS84"}
+
+
+GEOMS = [
+    {"type": "Point", "coordinates": [-105.0, 40.0]},
+    {"type": "LineString", "coordinates": [[-105.0, 40.0, 0.0], [-104.0, 41.0, 10.0]]},
+    {"type": "MultiPolygon", "coordinates": [[[
+        [-105.0, 40.0], [-104.0, 40.0], [-104.0, 41.0], [-105.0, 40.0]]]]},
+    {"type": "GeometryCollection", "geometries": [
+        {"type": "Point", "coordinates": [-105.0, 40.0]}]},
+    None,
+]
+
+
+def test_transform_geoms_matches_transform_geom():
+    """Batched geometries are transformed like single ones"""
+    results = transform.transform_geoms("EPSG:4326", "EPSG:26953", GEOMS)
+    assert isinstance(results, list)
+    assert results[-1] is None
+    for geom, result in zip(GEOMS[:-1], results):
+        expected = transform.transform_geom("EPSG:4326", "EPSG:26953", geom)
+        assert result["type"] == expected["type"]
+        assert fiona.bounds(result) == pytest.approx(fiona.bounds(expected))
+
+
+def test_transform_geoms_precision():
+    geoms = GEOMS[:3]
+    results = transform.transform_geoms("EPSG:4326", "EPSG:26953", geoms, precision=1)
+    for geom, result in zip(geoms, results):
+        assert result == transform.transform_geom(
+            "EPSG:4326", "EPSG:26953", geom, precision=1)
+
+
+def test_transform_geoms_iterator():
+    results = transform.transform_geoms("EPSG:4326", "EPSG:26953", iter(GEOMS))
+    assert not isinstance(results, list)
+    assert len(list(results)) == len(GEOMS)
+
+
+def test_transform_geoms_batches():
+    """Geometries of several batches are transformed in order"""
+    xs = [float(i % 100) for i in range(2500)]
+    geoms = [{"type": "Point", "coordinates": [x, 0.0]} for x in xs]
+    results = transform.transform_geoms("EPSG:4326", "EPSG:3857", geoms)
+    expected_xs, _ = transform.transform("EPSG:4326", "EPSG:3857", xs, [0.0] * len(xs))
+    assert [r["coordinates"][0] for r in results] == pytest.approx(expected_xs)
+
+
+def test_transform_geoms_wkb():
+    wkb = bytes.fromhex("0101000000000000000040" "5ac00000000000004440")
+    result, = transform.transform_geoms("EPSG:4326", "EPSG:26953", [wkb], precision=3)
+    assert isinstance(result, bytes)
+    assert result != wkb
+
+
+def test_transform_geoms_shapely():
+    shapely_geometry = pytest.importorskip("shapely.geometry")
+    point = shapely_geometry.Point(-105.0, 40.0)
+    result, = transform.transform_geoms("EPSG:4326", "EPSG:26953", [point])
+    assert result.geom_type == "Point"
+    assert (result.x, result.y) == pytest.approx((957097.0952, 378940.8419))
+
+
+def test_transform_z():
+    xs, ys, zs = transform.transform("EPSG:4326", "EPSG:3857", [0.0], [0.0], [100.0])
+    assert (xs[0], ys[0], zs[0]) == pytest.approx((0.0, 0.0, 100.0))
+
+
+def test_transform_array():
+    from array import array
+    xs = array("d", [-105.0, -104.0])
+    ys = array("d", [40.0, 41.0])
+    xp, yp = transform.transform("EPSG:4326", "EPSG:26953", xs, ys)
+    assert isinstance(xp, array)
+    assert list(xs) == [-105.0, -104.0]
+    assert list(xp) == pytest.approx(
+        transform.transform("EPSG:4326", "EPSG:26953", [-105.0, -104.0], [40.0, 41.0])[0])
+
+
+def test_transform_numpy_in_place():
+    np = pytest.importorskip("numpy")
+    xs = np.array([-105.0, -104.0])
+    ys = np.array([40.0, 41.0])
+    expected = transform.transform("EPSG:4326", "EPSG:26953", xs.tolist(), ys.tolist())
+    result = transform.transform("EPSG:4326", "EPSG:26953", xs, ys, out=(xs, ys))
+    assert result[0] is xs
+    assert xs.tolist() == pytest.approx(expected[0])
+    assert ys.tolist() == pytest.approx(expected[1])
+
+
+def test_transform_numpy_out():
+    np = pytest.importorskip("numpy")
+    xs = np.array([-105.0, -104.0])
+    ys = np.array([40.0, 41.0])
+    out = (np.empty(2), np.empty(2))
+    xp, yp = transform.transform("EPSG:4326", "EPSG:26953", xs, ys, out=out)
+    assert xp is out[0]
+    assert xs.tolist() == [-105.0, -104.0]
+    assert xp.tolist() == pytest.approx(
+        transform.transform("EPSG:4326", "EPSG:26953", [-105.0, -104.0], [40.0, 41.0])[0])
+
+
+def test_transform_length_mismatch():
+    with pytest.raises(ValueError):
+        transform.transform("EPSG:4326", "EPSG:3857", [0.0, 1.0], [0.0])
+
+
+def test_transform_threads():
+    np = pytest.importorskip("numpy")
+    from concurrent.futures import ThreadPoolExecutor
+    xs = np.linspace(-100.0, -90.0, 10000)
+    ys = np.linspace(30.0, 40.0, 10000)
+    expected = transform.transform("EPSG:4326", "EPSG:3857", xs, ys)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(
+            lambda _: transform.transform("EPSG:4326", "EPSG:3857", xs, ys), range(8)))
+    for xp, yp in results:
+        assert np.array_equal(xp, expected[0])
+        assert np.array_equal(yp, expected[1])
+
+
+def test_transform_geoms_failure_per_geometry():
+    """A geometry that fails to transform doesn't fail its batch"""
+    geoms = [
+        {"type": "Point", "coordinates": [-105.0, 40.0]},
+        {"type": "Point", "coordinates": [0.0, 90.0]},
+        {"type": "Point", "coordinates": [-104.0, 41.0]}]
+    with pytest.raises(ValueError):
+        transform.transform_geom("EPSG:4326", "EPSG:3857", geoms[1])
+    results = transform.Transformer("EPSG:4326", "EPSG:3857").transform_geoms(iter(geoms))
+    assert next(results) == transform.transform_geom("EPSG:4326", "EPSG:3857", geoms[0])
+    with pytest.raises(ValueError):
+        next(results)
+    results = transform.transform_geoms("EPSG:4326", "EPSG:3857", [geoms[0], geoms[2]])
+    assert results[1] == transform.transform_geom("EPSG:4326", "EPSG:3857", geoms[2])
@@ -0,0 +1,62 @@
+"""Tests of the validation of written records"""
+
+import pytest
+
+import fiona
+from fiona.errors import SchemaError
+
+
+def test_validate_invalid(tmpdir, points_schema):
+    with pytest.raises(ValueError):
+        fiona.open(str(tmpdir.join('test.geojson')), 'w', driver='GeoJSON',
+                   schema=points_schema, validate='some')
+
+
+def test_validate_full(tmpdir, points_schema, points):
+    with fiona.open(str(tmpdir.join('test.geojson')), 'w', driver='GeoJSON',
+                    schema=points_schema) as dst:
+        assert dst.validate == 'full'
+        dst.writerecords(points(1))
+        with pytest.raises(SchemaError):
+            dst.write({'geometry': None, 'properties': {'title': 'two'}})
+
+
+def test_validate_sample(tmpdir, points_schema):
+    path = str(tmpdir.join('test.geojson'))
+    with fiona.open(path, 'w', driver='GeoJSON', schema=points_schema,
+                    validate='sample') as dst:
+        with pytest.raises(SchemaError):
+            dst.write({'geometry': None, 'properties': {'title': 'one'}})
+        dst.write({'geometry': None, 'properties': {'title': 'two'}})
+    with fiona.open(path) as src:
+        assert [f['properties']['count'] for f in src] == [None]
+
+
+def test_validate_none(tmpdir, points_schema, points):
+    path = str(tmpdir.join('test.geojson'))
+    with fiona.open(path, 'w', driver='GeoJSON', schema=points_schema,
+                    validate='none') as dst:
+        dst.writerecords(points(1) + [{'geometry': None, 'properties': {'title': 'two'}}])
+        with pytest.raises(KeyError):
+            dst.write({'geometry': None, 'properties': {'title': 'three', 'bogus': 3}})
+    with fiona.open(path) as src:
+        assert [f['properties']['title'] for f in src] == ['r0', 'two']
+
+
+def test_write_plan_values(tmpdir):
+    """Values of all kinds are written through the compiled write plan"""
+    schema = {'geometry': 'Point',
+              'properties': {'i': 'int32', 'f': 'float', 's': 'str',
+                             'd': 'date', 'b': 'bool'}}
+    path = str(tmpdir.join('test.gpkg'))
+    with fiona.open(path, 'w', driver='GPKG', schema=schema) as dst:
+        dst.write({'geometry': None,
+                   'properties': {'i': 1, 'f': 2.5, 's': u'\u00e9', 'd': '2019-01-02',
+                                  'b': True}})
+    with fiona.open(path) as src:
+        props = next(iter(src))['properties']
+    assert props['i'] == 1
+    assert props['f'] == 2.5
+    assert props['s'] == u'\u00e9'
+    assert props['d'] == '2019-01-02'
+    assert props['b'] is True
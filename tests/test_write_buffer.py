@@ -0,0 +1,85 @@
+"""Tests of buffered writing"""
+
+import pytest
+
+import fiona
+from fiona.collection import WriteBuffer
+from fiona.errors import SchemaError
+
+
+def test_buffered_write(tmpdir, points_schema, points):
+    path = str(tmpdir.join('test.gpkg'))
+    with fiona.open(path, 'w', driver='GPKG', schema=points_schema,
+                    buffered=True, buffer_size=10) as dst:
+        for record in points(25):
+            dst.write(record)
+        assert len(dst._write_buffer) == 5
+        assert len(dst) == 25
+        assert len(dst._write_buffer) == 0
+        assert dst.bounds == (0.0, 0.0, 24.0, 24.0)
+
+    with fiona.open(path) as src:
+        assert [f['properties']['title'] for f in src] == [
+            'r%d' % i for i in range(25)]
+
+
+def test_buffered_flush_on_close(tmpdir, points_schema, points):
+    path = str(tmpdir.join('test.gpkg'))
+    dst = fiona.open(path, 'w', driver='GPKG', schema=points_schema, buffered=True)
+    dst.write(points(1)[0])
+    dst.writerecords(points(1, start=1))
+    dst.close()
+    with fiona.open(path) as src:
+        assert [f['properties']['title'] for f in src] == ['r0', 'r1']
+
+
+def test_buffered_write_failure(tmpdir, points_schema, points):
+    path = str(tmpdir.join('test.geojson'))
+    bad = {'geometry': None, 'properties': {'bogus': 'x'}}
+    record, = points(1)
+    with fiona.open(path, 'w', driver='GeoJSON', schema=points_schema,
+                    buffered=True, buffer_size=2) as dst:
+        dst.write(bad)
+        with pytest.raises(SchemaError):
+            dst.write(record)
+        assert dst._write_buffer.records == [bad, record]
+        dst._write_buffer.records.remove(bad)
+
+    with fiona.open(path) as src:
+        assert [f['properties']['title'] for f in src] == ['r0']
+
+
+def test_buffered_read_mode(path_coutwildrnp_shp):
+    with pytest.raises(ValueError):
+        fiona.open(path_coutwildrnp_shp, buffered=True)
+
+
+def test_write_buffer_size(points):
+    buf = WriteBuffer(size=2)
+    first, second = points(2)
+    assert not buf.append(first)
+    assert buf.append(second)
+    assert len(buf.take()) == 2
+    assert len(buf) == 0
+
+
+def test_write_buffer_bytes(points):
+    buf = WriteBuffer(nbytes=60)
+    first, second = points(2)
+    assert not buf.append(first)
+    assert buf.append(second)
+
+
+def test_write_buffer_interval(monkeypatch, points):
+    now = [100.0]
+    monkeypatch.setattr('fiona.collection.time.monotonic', lambda: now[0])
+    buf = WriteBuffer(interval=5)
+    first, second = points(2)
+    assert not buf.append(first)
+    now[0] += 5
+    assert buf.append(second)
+
+
+def test_write_buffer_invalid():
+    with pytest.raises(ValueError):
+        WriteBuffer(size=0)
@@ -0,0 +1,112 @@
+"""Tests of columnar writing"""
+
+import struct
+
+import pytest
+
+import fiona
+from fiona.errors import SchemaError
+
+
+def point_wkb(x, y):
+    return struct.pack('<BIdd', 1, 1, x, y)
+
+
+def test_write_columns_sequences(tmpdir, points_schema):
+    path = str(tmpdir.join('test.gpkg'))
+    with fiona.open(path, 'w', driver='GPKG', schema=points_schema) as dst:
+        count = dst.write_columns(
+            {'title': ['a', 'b', None], 'count': [1, 2, 3],
+             'value': [0.5, None, 2.5], 'flag': [True, False, True]},
+            [point_wkb(0.0, 0.0), None, point_wkb(2.0, 2.0)])
+        assert count == 3
+        assert len(dst) == 3
+
+    with fiona.open(path) as src:
+        features = list(src)
+    assert [f['properties']['title'] for f in features] == ['a', 'b', None]
+    assert [f['properties']['value'] for f in features] == [0.5, None, 2.5]
+    assert features[1]['geometry'] is None
+    assert features[2]['geometry']['coordinates'] == (2.0, 2.0)
+
+
+def test_write_columns_arrays(tmpdir, points_schema):
+    np = pytest.importorskip("numpy")
+    path = str(tmpdir.join('test.gpkg'))
+    geometry = np.array([point_wkb(i, i) for i in range(4)], dtype=object)
+    with fiona.open(path, 'w', driver='GPKG', schema=points_schema) as dst:
+        dst.write_columns(
+            {'title': np.array(['a', 'b', 'c', 'd']),
+             'count': np.ma.MaskedArray([1, 2, 3, 4], mask=[0, 1, 0, 0]),
+             'value': np.arange(4, dtype='float32'),
+             'flag': np.array([True, False, True, False])},
+            geometry)
+
+    with fiona.open(path) as src:
+        features = list(src)
+    assert [f['properties']['title'] for f in features] == ['a', 'b', 'c', 'd']
+    assert [f['properties']['count'] for f in features] == [1, None, 3, 4]
+    assert [f['properties']['value'] for f in features] == [0.0, 1.0, 2.0, 3.0]
+    assert [f['properties']['flag'] for f in features] == [True, False, True, False]
+    assert [f['geometry']['coordinates'] for f in features] == [
+        (float(i), float(i)) for i in range(4)]
+
+
+def test_write_columns_length_mismatch(tmpdir, points_schema):
+    path = str(tmpdir.join('test.gpkg'))
+    with fiona.open(path, 'w', driver='GPKG', schema=points_schema) as dst:
+        with pytest.raises(ValueError):
+            dst.write_columns(
+                {'title': ['a'], 'count': [1, 2], 'value': [1.0], 'flag': [True]})
+
+
+def test_write_columns_schema_mismatch(tmpdir, points_schema):
+    path = str(tmpdir.join('test.gpkg'))
+    with fiona.open(path, 'w', driver='GPKG', schema=points_schema) as dst:
+        with pytest.raises(SchemaError):
+            dst.write_columns({'title': ['a']})
+        with pytest.raises(SchemaError):
+            dst.write_columns({'bogus': ['a']})
+
+
+def test_write_columns_subset_without_validation(tmpdir, points_schema):
+    path = str(tmpdir.join('test.gpkg'))
+    with fiona.open(path, 'w', driver='GPKG', schema=points_schema,
+                    validate='none') as dst:
+        dst.write_columns({'title': ['a', 'b']})
+    with fiona.open(path) as src:
+        assert [f['properties']['count'] for f in src] == [None, None]
+
+
+def test_write_columns_read_only(path_coutwildrnp_shp):
+    with fiona.open(path_coutwildrnp_shp) as src:
+        with pytest.raises(IOError):
+            src.write_columns({'NAME': ['a']})
+
+
+@pytest.mark.parametrize("field_type,dtype,value", [
+    ('int32', 'int64', 2 ** 31),
+    ('int32', 'int64', -2 ** 31 - 1),
+    ('int', 'uint64', 2 ** 63)])
+def test_write_columns_int_overflow(tmpdir, field_type, dtype, value):
+    np = pytest.importorskip("numpy")
+    path = str(tmpdir.join('test.gpkg'))
+    schema = {'geometry': 'Point', 'properties': {'count': field_type}}
+    with fiona.open(path, 'w', driver='GPKG', schema=schema) as dst:
+        with pytest.raises(OverflowError):
+            dst.write_columns({'count': np.array([1, value], dtype=dtype)})
+        with pytest.raises(OverflowError):
+            dst.writerecords([{'geometry': None, 'properties': {'count': value}}])
+        assert len(dst) == 0
+
+
+def test_write_columns_int_overflow_masked(tmpdir):
+    np = pytest.importorskip("numpy")
+    path = str(tmpdir.join('test.gpkg'))
+    schema = {'geometry': 'Point', 'properties': {'count': 'int32'}}
+    with fiona.open(path, 'w', driver='GPKG', schema=schema) as dst:
+        dst.write_columns(
+            {'count': np.ma.MaskedArray([1, 2 ** 31], mask=[0, 1], dtype='int64')})
+
+    with fiona.open(path) as src:
+        assert [f['properties']['count'] for f in src] == [1, None]
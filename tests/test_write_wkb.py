@@ -0,0 +1,67 @@
+"""Tests of writing records with WKB and geo interface geometries"""
+
+import struct
+
+import pytest
+
+import fiona
+from fiona.errors import GeometryTypeValidationError
+
+
+def point_wkb(x, y, byteorder='<'):
+    return struct.pack(byteorder + 'BIdd', 1 if byteorder == '<' else 0, 1, x, y)
+
+
+class GeoThing(object):
+    def __init__(self, geometry):
+        self.__geo_interface__ = geometry
+
+
+@pytest.fixture
+def point_meta():
+    return {
+        'driver': 'GeoJSON',
+        'schema': {'geometry': 'Point', 'properties': {'title': 'str'}}}
+
+
+@pytest.mark.parametrize('geometry', [
+    point_wkb(1.0, 2.0),
+    point_wkb(1.0, 2.0, '>'),
+    bytearray(point_wkb(1.0, 2.0)),
+    GeoThing({'type': 'Point', 'coordinates': (1.0, 2.0)}),
+])
+def test_write_geometry(tmpdir, point_meta, geometry):
+    path = str(tmpdir.join('points.geojson'))
+    with fiona.open(path, 'w', **point_meta) as dst:
+        dst.write({'geometry': geometry, 'properties': {'title': 'one'}})
+    with fiona.open(path) as src:
+        feature = next(iter(src))
+    assert feature['geometry'] == {'type': 'Point', 'coordinates': (1.0, 2.0)}
+
+
+def test_write_wkb_type_mismatch(tmpdir, point_meta):
+    path = str(tmpdir.join('points.geojson'))
+    linestring = struct.pack('<BII4d', 1, 2, 2, 0.0, 0.0, 1.0, 1.0)
+    with fiona.open(path, 'w', **point_meta) as dst:
+        with pytest.raises(GeometryTypeValidationError):
+            dst.write({'geometry': linestring, 'properties': {'title': 'one'}})
+
+
+def test_write_invalid_wkb(tmpdir, point_meta):
+    path = str(tmpdir.join('points.geojson'))
+    with fiona.open(path, 'w', **point_meta) as dst:
+        with pytest.raises(ValueError):
+            dst.write({'geometry': point_wkb(1.0, 2.0)[:-4],
+                       'properties': {'title': 'one'}})
+
+
+def test_write_shapely(tmpdir, point_meta):
+    geometry = pytest.importorskip("shapely.geometry")
+    path = str(tmpdir.join('points.geojson'))
+    with fiona.open(path, 'w', **point_meta) as dst:
+        dst.writerecords(
+            {'geometry': geometry.Point(i, i), 'properties': {'title': str(i)}}
+            for i in range(3))
+    with fiona.open(path) as src:
+        assert [f['geometry']['coordinates'] for f in src] == [
+            (0.0, 0.0), (1.0, 1.0), (2.0, 2.0)]
@@ -0,0 +1,40 @@
+"""Tests of writing with a pool of conversion threads"""
+
+import pytest
+
+import fiona
+from fiona.errors import SchemaError
+
+
+@pytest.mark.parametrize('write_workers', [1, 4])
+def test_write_workers(tmpdir, points_schema, points, write_workers):
+    """Records are written in order"""
+    path = str(tmpdir.join('test.gpkg'))
+    with fiona.open(path, 'w', driver='GPKG', schema=points_schema,
+                    write_workers=write_workers) as dst:
+        dst.writerecords(points(2500))
+        dst.writerecords(points(10))
+
+    with fiona.open(path) as src:
+        written = list(src)
+    assert len(written) == 2510
+    assert [f['properties']['count'] for f in written] == list(range(2500)) + list(range(10))
+    assert written[1234]['geometry']['coordinates'] == (1234.0, 1234.0)
+
+
+def test_write_workers_error(tmpdir, points_schema, points):
+    """An invalid record raises in the writing thread"""
+    bad = points(3000)
+    bad[2100] = {'geometry': None, 'properties': {'title': 'bad'}}
+    path = str(tmpdir.join('test.gpkg'))
+    with fiona.open(path, 'w', driver='GPKG', schema=points_schema,
+                    write_workers=2) as dst:
+        with pytest.raises(SchemaError):
+            dst.writerecords(bad)
+
+
+@pytest.mark.parametrize('write_workers', [-1, 1.5, None])
+def test_write_workers_invalid(tmpdir, points_schema, write_workers):
+    with pytest.raises(ValueError):
+        fiona.open(str(tmpdir.join('test.gpkg')), 'w', driver='GPKG',
+                   schema=points_schema, write_workers=write_workers)